@@ -173,3 +173,25 @@ for rotor_slice in range(rotor_slices):
                 + ",\t"
                 + str(force_density_angle)
             )
+
+# %%
+# Alternatively, get the force density for all orders, operating points and slices at once.
+# Results are NumPy arrays indexed by operating point, slice, space order and time order.
+# The amplitudes already include the 2x factor for time orders above zero.
+force_orders = mc.get_force_orders(
+    "Fr_Density_Stator",
+    max_space_order=mech_force_space_order_max,
+    electrical_cycles=electrical_cycles,
+)
+for required_space_order, required_electrical_time_order in required_orders:
+    force_density_amplitude, force_density_angle = force_orders.get_order(
+        required_space_order, required_electrical_time_order
+    )
+    print(
+        "Space order "
+        + str(required_space_order)
+        + ", electrical order "
+        + str(required_electrical_time_order)
+        + ", force density amplitude (N/m^2) for each operating point and slice:"
+    )
+    print(force_density_amplitude)
@@ -612,15 +612,15 @@ def calculate_enamel_temperatures(mc, ewdg_nodes_f, ewdg_nodes_r, oil_node_f, oi
     num_layers = len(ewdg_nodes_f)
     num_surfaces = len(ewdg_nodes_f[0])
 
-    # Get the node temperatures. These are the temperatures of the surface of the copper and the oil
-    copper_temperatures_f = [
-        [mc.get_node_temperature(node) for node in layer_nodes] for layer_nodes in ewdg_nodes_f
-    ]
-    copper_temperatures_r = [
-        [mc.get_node_temperature(node) for node in layer_nodes] for layer_nodes in ewdg_nodes_r
-    ]
-    oil_temperatures_f = [[mc.get_node_temperature(oil_node_f)] * num_surfaces] * num_layers
-    oil_temperatures_r = [[mc.get_node_temperature(oil_node_r)] * num_surfaces] * num_layers
+    # Get the node temperatures. These are the temperatures of the surfaces of the copper and oil.
+    # All temperatures are requested together, as a single batch of requests to Motor-CAD.
+    nodes_f = [node for layer_nodes in ewdg_nodes_f for node in layer_nodes]
+    nodes_r = [node for layer_nodes in ewdg_nodes_r for node in layer_nodes]
+    node_temperatures = mc.get_node_temperatures(nodes_f + nodes_r + [oil_node_f, oil_node_r])
+    copper_temperatures_f = node_temperatures[: len(nodes_f)].reshape(num_layers, num_surfaces)
+    copper_temperatures_r = node_temperatures[len(nodes_f) : -2].reshape(num_layers, num_surfaces)
+    oil_temperatures_f = np.full((num_layers, num_surfaces), node_temperatures[-2])
+    oil_temperatures_r = np.full((num_layers, num_surfaces), node_temperatures[-1])
 
     # Obtain winding enamel thermal resistances for each layer. These are the thermal resistances of
     # the enamel layer on the surface of the copper.
@@ -645,14 +645,11 @@ def calculate_enamel_temperatures(mc, ewdg_nodes_f, ewdg_nodes_r, oil_node_f, oi
 
     # Obtain overall thermal resistances between oil node and each copper node. This includes the
     # enamel and the oil cooling thermal resistance.
-    total_rt_f = [
-        [mc.get_node_to_node_resistance(oil_node_f, node) for node in layer_nodes]
-        for layer_nodes in ewdg_nodes_f
-    ]
-    total_rt_r = [
-        [mc.get_node_to_node_resistance(oil_node_r, node) for node in layer_nodes]
-        for layer_nodes in ewdg_nodes_r
-    ]
+    total_rts = mc.get_node_to_node_resistances(
+        [(oil_node_f, node) for node in nodes_f] + [(oil_node_r, node) for node in nodes_r]
+    )
+    total_rt_f = total_rts[: len(nodes_f)].reshape(num_layers, num_surfaces)
+    total_rt_r = total_rts[len(nodes_f) :].reshape(num_layers, num_surfaces)
 
     # Calculate the enamel temperature for each layer, using the formula:
     # T_enamel = T_copper - (T_copper - T_oil) * (Rt_enamel / Rt_total)
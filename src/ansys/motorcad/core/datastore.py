@@ -23,6 +23,25 @@
 """Contains data classes for getting whole datastore from Motor-CAD."""
 from collections.abc import Iterable
 from enum import Enum
+import hashlib
+import json as _json
+import math
+from numbers import Real
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+try:
+    import pandas as pd
+
+    _HAS_PANDAS = True
+except ImportError:
+    _HAS_PANDAS = False
 
 
 class DataTypes(Enum):
@@ -38,6 +57,104 @@ class DataTypes(Enum):
     unsupported = [18, 19, 20, 21, 22, 23]
 
 
+def _inout_type_values(inout_list):
+    """Get the set of raw input_or_output_type values for a list of DataTypes.
+
+    Parameters
+    ----------
+    inout_list : list[DataTypes] | None
+        list of DataType enum that define the data type.
+
+    Returns
+    -------
+    set | None
+        ``None`` if all types are accepted.
+    """
+    if inout_list is None:
+        return None
+    type_values = set()
+    for inout_type in inout_list:
+        if isinstance(inout_type.value, list):
+            type_values.update(inout_type.value)
+        else:
+            type_values.add(inout_type.value)
+    return type_values
+
+
+# Floats are rounded to this many significant figures before hashing, so that values that only
+# differ by floating point noise give the same hash.
+HASH_SIGNIFICANT_FIGURES = 12
+
+
+def _canonical_value(value):
+    """Convert a record value to a canonical form for hashing.
+
+    Numbers are converted to rounded floats, and lists and tuples are converted recursively.
+    """
+    if isinstance(value, bool) or (value is None) or isinstance(value, str):
+        return value
+    elif isinstance(value, Real):
+        value = float(value)
+        if math.isnan(value) or math.isinf(value):
+            return str(value)
+        # Adding 0.0 converts -0.0 to 0.0
+        return float(format(value, "." + str(HASH_SIGNIFICANT_FIGURES) + "g")) + 0.0
+    elif isinstance(value, (list, tuple)):
+        return [_canonical_value(item) for item in value]
+    else:
+        return str(value)
+
+
+def _to_arrow_columns(rows, template_records):
+    """Convert the values of one file section across several datastores to Arrow arrays.
+
+    The rows are converted together as a struct array, so the values are converted by Arrow
+    rather than one at a time. 1D arrays that have the same length in every datastore are
+    stored as a fixed size list column. Other arrays are stored as variable length list columns.
+
+    Parameters
+    ----------
+    rows : list of dict
+        Current values of the records in each datastore. Missing records are stored as null
+        values.
+    template_records : dict
+        Records used to decide the column order and type, where the key is the record name.
+
+    Returns
+    -------
+    dict
+        Arrow array for each record, where the key is the record name.
+    """
+    try:
+        struct_array = pa.array(rows)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+        # Find the record that failed, to give a useful error
+        for key in template_records:
+            try:
+                pa.array([row.get(key) for row in rows])
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                raise TypeError(
+                    "Failed to export Datastore. Values of " + key + " have mixed types."
+                ) from e
+        raise
+
+    columns = {}
+    for key, template_record in template_records.items():
+        column = struct_array.field(key)
+        if (
+            template_record.is_array
+            and pa.types.is_list(column.type)
+            and (column.null_count == 0)
+            and (len(column) > 0)
+        ):
+            lengths = pc.list_value_length(column)
+            min_max = pc.min_max(lengths)
+            if min_max["min"] == min_max["max"]:
+                column = pa.FixedSizeListArray.from_arrays(column.flatten(), min_max["max"].as_py())
+        columns[key] = column
+    return columns
+
+
 class DataStoreRecord:
     """Object to store data records from Motor-CAD.
 
@@ -50,6 +167,7 @@ class DataStoreRecord:
     def __init__(self, parent_datastore):
         """Do initialisation."""
         self._parent_datastore = parent_datastore
+        self._value_digest = None
         self.current_value = None
         self.default_value = None
 
@@ -68,11 +186,40 @@ class DataStoreRecord:
         self.max_value = None
         self.min_value = None
 
+    @property
+    def current_value(self):
+        """Get current value of record."""
+        return self._current_value
+
+    @current_value.setter
+    def current_value(self, value):
+        """Set current value of record."""
+        self._current_value = value
+        # Hash must be recalculated for the new value
+        self._value_digest = None
+
     @property
     def value(self):
         """Get value of record."""
         return self.current_value
 
+    def _get_value_digest(self):
+        """Get the hash digest of the canonical current value.
+
+        The digest is cached until a new current value is set. Modifying an array value in
+        place doesn't reset the cached digest, so arrays must be replaced rather than edited.
+
+        Returns
+        -------
+        bytes
+        """
+        if self._value_digest is None:
+            canonical_json = _json.dumps(
+                _canonical_value(self._current_value), separators=(",", ":")
+            )
+            self._value_digest = hashlib.sha256(canonical_json.encode("utf-8")).digest()
+        return self._value_digest
+
     def __str__(self):
         """Get string representation of record."""
         return str(self.current_value)
@@ -156,58 +303,71 @@ class DataStoreRecord:
         }
         return record_dict
 
-    @classmethod
-    def from_json(cls, json, parent_datastore):
-        """Create a DataStore object from JSON data.
+    @staticmethod
+    def _record_class_from_json(json):
+        """Get the record class matching JSON data returned from Motor-CAD.
 
         Parameters
         ----------
         json : dict
             JSON data returned from Motor-CAD
-        parent_datastore : Datastore
-            records must belong to a dataStore
 
         Returns
         -------
-        DataStoreRecord or DataStoreRecordArray or DataStoreRecordArray2D
+        type
         """
         if json["is_array"]:
-            datastore_record = DataStoreRecordArray(parent_datastore)
-            datastore_record.dynamic = json["dynamic"]
-            if datastore_record.dynamic:
-                datastore_record.array_length = json["array_length"]
-                datastore_record.array_length_ref_name = json["array_length_ref"]
-
+            return DataStoreRecordArray
         elif json["is_array_2d"]:
-            datastore_record = DataStoreRecordArray2D(parent_datastore)
-            datastore_record.dynamic = json["dynamic"]
-            if datastore_record.dynamic:
-                datastore_record.array_length_2d = tuple(json["array_length_2d"])
-                datastore_record.array_length_ref_2d_name = tuple(json["array_length_ref_2d"])
-
+            return DataStoreRecordArray2D
         else:
-            datastore_record = cls(parent_datastore)
+            return DataStoreRecord
 
-        datastore_record.current_value = json["current_value"]
-        datastore_record.default_value = json["default_value"]
+    def _update_from_json(self, json):
+        """Update the record in place from JSON data.
 
-        datastore_record.units = json["units"]
-        datastore_record.input_or_output_type = json["input_or_output_type"]
+        Parameters
+        ----------
+        json : dict
+            JSON data returned from Motor-CAD
+        """
+        self.current_value = json["current_value"]
+        self.default_value = json["default_value"]
+
+        self.units = json["units"]
+        self.input_or_output_type = json["input_or_output_type"]
+
+        self.record_name = json["record_name"]
+        self.activex_name = json["activex_name"]
+        self.alternative_activex_name = json["alternative_activex_name"]
+        self.file_section = json["file_section"]
+
+        self.is_array = json["is_array"]
+        self.is_array_2d = json["is_array_2d"]
+        self.use_max_value = json["use_max_value"]
+        self.use_min_value = json["use_min_value"]
+        if self.use_max_value:
+            self.max_value = json["max_value"]
+        if self.use_min_value:
+            self.min_value = json["min_value"]
 
-        datastore_record.record_name = json["record_name"]
-        datastore_record.activex_name = json["activex_name"]
-        datastore_record.alternative_activex_name = json["alternative_activex_name"]
-        datastore_record.file_section = json["file_section"]
+    @classmethod
+    def from_json(cls, json, parent_datastore):
+        """Create a DataStore object from JSON data.
 
-        datastore_record.is_array = json["is_array"]
-        datastore_record.is_array_2d = json["is_array_2d"]
-        datastore_record.use_max_value = json["use_max_value"]
-        datastore_record.use_min_value = json["use_min_value"]
-        if datastore_record.use_max_value:
-            datastore_record.max_value = json["max_value"]
-        if datastore_record.use_min_value:
-            datastore_record.min_value = json["min_value"]
+        Parameters
+        ----------
+        json : dict
+            JSON data returned from Motor-CAD
+        parent_datastore : Datastore
+            records must belong to a dataStore
 
+        Returns
+        -------
+        DataStoreRecord or DataStoreRecordArray or DataStoreRecordArray2D
+        """
+        datastore_record = DataStoreRecord._record_class_from_json(json)(parent_datastore)
+        datastore_record._update_from_json(json)
         return datastore_record
 
     @classmethod
@@ -287,6 +447,20 @@ class DataStoreRecordArray(DataStoreRecord):
         """
         return self._parent_datastore.get_variable_record(self.array_length_ref_name)
 
+    def _update_from_json(self, json):
+        """Update the 1D array record in place from JSON data.
+
+        Parameters
+        ----------
+        json : dict
+            JSON data returned from Motor-CAD
+        """
+        super()._update_from_json(json)
+        self.dynamic = json["dynamic"]
+        if self.dynamic:
+            self.array_length = json["array_length"]
+            self.array_length_ref_name = json["array_length_ref"]
+
     def to_json(self):
         """Convert 1D array Datastore record to a serialisable dictionary for JSON export.
 
@@ -326,6 +500,20 @@ class DataStoreRecordArray2D(DataStoreRecord):
             ]
         return array_length_2d_array
 
+    def _update_from_json(self, json):
+        """Update the 2D array record in place from JSON data.
+
+        Parameters
+        ----------
+        json : dict
+            JSON data returned from Motor-CAD
+        """
+        super()._update_from_json(json)
+        self.dynamic = json["dynamic"]
+        if self.dynamic:
+            self.array_length_2d = tuple(json["array_length_2d"])
+            self.array_length_ref_2d_name = tuple(json["array_length_ref_2d"])
+
     def to_json(self):
         """Convert 2D array Datastore record to a serialisable dictionary for JSON export.
 
@@ -421,6 +609,142 @@ class Datastore(dict):
         """
         return dict((key, item.current_value) for key, item in self.items())
 
+    def input_hash(self, sections=None):
+        """Get a hash of the input records, which identifies the machine design.
+
+        Datastores with the same input values give the same hash, regardless of record order.
+        Floats are rounded before hashing, so values that only differ by floating point noise
+        give the same hash. The hash of each record is cached and only recalculated when the
+        value of that record is set.
+
+        Parameters
+        ----------
+        sections : list | None
+            variable sections (category in automation parameter names) to include. If None,
+            all sections are included.
+
+        Returns
+        -------
+        str
+            SHA-256 hash as a hexadecimal string.
+        """
+        input_type_values = _inout_type_values([DataTypes.input])
+        record_digests = sorted(
+            (key, item._get_value_digest())
+            for key, item in self.items()
+            if (item.input_or_output_type in input_type_values)
+            and item.file_section_in_list(sections)
+        )
+
+        hasher = hashlib.sha256()
+        for key, value_digest in record_digests:
+            hasher.update(key.encode("utf-8"))
+            hasher.update(b"\0")
+            hasher.update(value_digest)
+        return hasher.hexdigest()
+
+    def to_arrow(self, file_sections=None, inout_types=None):
+        """Convert the Datastore to a single row ``pyarrow.Table``.
+
+        Each record is stored as a column. 1D arrays are stored as fixed size list columns and
+        2D arrays as nested list columns.
+
+        Parameters
+        ----------
+        file_sections : list | None
+            variable section (category in automation parameter names)
+        inout_types : list | None
+            Input/Output type (e.g. input, compatibility, setting).
+
+        Returns
+        -------
+        pyarrow.Table
+        """
+        return Datastore.concat([self], file_sections, inout_types, output_format="arrow")
+
+    def to_pandas(self, file_sections=None, inout_types=None):
+        """Convert the Datastore to a single row ``pandas.DataFrame``.
+
+        Each record is stored as a column. Arrays are stored as lists.
+
+        Parameters
+        ----------
+        file_sections : list | None
+            variable section (category in automation parameter names)
+        inout_types : list | None
+            Input/Output type (e.g. input, compatibility, setting).
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        return Datastore.concat([self], file_sections, inout_types, output_format="pandas")
+
+    @staticmethod
+    def concat(datastores, file_sections=None, inout_types=None, output_format="arrow"):
+        """Combine several Datastores into one table with a row per Datastore.
+
+        Useful for collecting the results of a parameter sweep, where each Datastore is a
+        design point. Columns are created for every record in any of the Datastores. Missing
+        records are stored as null values.
+
+        Parameters
+        ----------
+        datastores : list of Datastore
+            Datastores to combine. One row is created for each Datastore, in order.
+        file_sections : list | None
+            variable section (category in automation parameter names)
+        inout_types : list | None
+            Input/Output type (e.g. input, compatibility, setting).
+        output_format : str, default: "arrow"
+            Type of table to create. Options are ``"arrow"`` for a ``pyarrow.Table`` and
+            ``"pandas"`` for a ``pandas.DataFrame``.
+
+        Returns
+        -------
+        pyarrow.Table | pandas.DataFrame
+        """
+        if output_format == "arrow":
+            if not _HAS_PYARROW:
+                raise ImportError("Failed to export Datastore. Please ensure pyarrow is installed")
+        elif output_format == "pandas":
+            if not _HAS_PANDAS:
+                raise ImportError("Failed to export Datastore. Please ensure pandas is installed")
+        else:
+            raise ValueError('output_format must be "arrow" or "pandas"')
+
+        # Use the first occurrence of each record to decide column order and type. Values are
+        # grouped by file section, and each section is converted to columns in one go.
+        template_records = {}
+        section_records = {}
+        section_rows = {}
+        for row_index, datastore in enumerate(datastores):
+            for key, item in datastore.items():
+                if not (
+                    item.file_section_in_list(file_sections) and item.inout_in_list(inout_types)
+                ):
+                    continue
+                template_record = template_records.setdefault(key, item)
+                section = template_record.file_section
+                if section not in section_rows:
+                    section_records[section] = {}
+                    section_rows[section] = [{} for _ in datastores]
+                section_records[section][key] = template_record
+                section_rows[section][row_index][key] = item.current_value
+
+        columns = {}
+        for section, rows in section_rows.items():
+            if output_format == "arrow":
+                columns.update(_to_arrow_columns(rows, section_records[section]))
+            else:
+                columns.update(pd.DataFrame(rows, columns=list(section_records[section])).items())
+
+        columns = dict((key, columns[key]) for key in template_records)
+        if output_format == "arrow":
+            return pa.table(columns)
+        else:
+            return pd.DataFrame(columns, index=range(len(datastores)))
+
     def pop(self, k, d=None):
         """
         Remove specified key and return the corresponding value.
@@ -473,23 +797,87 @@ class Datastore(dict):
                 self.__activex_names__[value.alternative_activex_name.lower()] = key
         return self
 
+    def _add_record_from_json(self, datastore_record_json):
+        """Create a record from JSON data and add it to the datastore.
+
+        Parameters
+        ----------
+        datastore_record_json : dict
+            JSON data for a single record returned from Motor-CAD.
+
+        Returns
+        -------
+        DataStoreRecord
+        """
+        datastore_record_object = DataStoreRecord.from_json(datastore_record_json, self)
+        self[datastore_record_json["activex_name"]] = datastore_record_object
+
+        self.__activex_names__[
+            datastore_record_json["activex_name"].lower()
+        ] = datastore_record_json["activex_name"]
+        if datastore_record_json["alternative_activex_name"] != "xxx":
+            # Parameter also has an alternative name. Add it to another dict to search quickly.
+            self.__activex_names__[
+                datastore_record_json["alternative_activex_name"].lower()
+            ] = datastore_record_json["activex_name"]
+
+        return datastore_record_object
+
+    def refresh(self, mc, inout_types=(DataTypes.output,), file_sections=None):
+        """Update the datastore in place with the current values from Motor-CAD.
+
+        Only records matching the file sections and input-or-output types are updated. Existing
+        records are updated in place, so references to them remain valid. Records that are not
+        yet in the datastore are added. Where the Motor-CAD version supports it, only the
+        requested records are transferred.
+
+        Parameters
+        ----------
+        mc : ansys.motorcad.core.MotorCAD
+            Motor-CAD instance to get the values from.
+        inout_types : list | None, default: [DataTypes.output]
+            Input/Output type (e.g. input, compatibility, setting). If None, all types are
+            updated.
+        file_sections : list | None
+            variable section (category in automation parameter names). If None, all sections
+            are updated.
+
+        Returns
+        -------
+        Datastore
+        """
+        datastore_json = mc._get_datastore_json(inout_types, file_sections)
+        type_values = _inout_type_values(inout_types)
+
+        for datastore_record_json in datastore_json["data_records"]:
+            # Filter on the raw JSON before creating any objects, in case Motor-CAD returned
+            # the whole datastore.
+            if (type_values is not None) and (
+                datastore_record_json["input_or_output_type"] not in type_values
+            ):
+                continue
+            if (file_sections is not None) and (
+                datastore_record_json["file_section"] not in file_sections
+            ):
+                continue
+
+            record = self.get(datastore_record_json["activex_name"])
+            if (record is not None) and (
+                type(record) is DataStoreRecord._record_class_from_json(datastore_record_json)
+            ):
+                record._update_from_json(datastore_record_json)
+            else:
+                self._add_record_from_json(datastore_record_json)
+
+        return self
+
     @classmethod
     def from_json(cls, datastore_json):
         """Create a Datastore object from JSON data."""
         datastore = cls()
 
         for datastore_record_json in datastore_json["data_records"]:
-            datastore_record_object = DataStoreRecord.from_json(datastore_record_json, datastore)
-            datastore[datastore_record_json["activex_name"]] = datastore_record_object
-
-            datastore.__activex_names__[
-                datastore_record_json["activex_name"].lower()
-            ] = datastore_record_json["activex_name"]
-            if datastore_record_json["alternative_activex_name"] != "xxx":
-                # Parameter also has an alternative name. Add it to another dict to search quickly.
-                datastore.__activex_names__[
-                    datastore_record_json["alternative_activex_name"].lower()
-                ] = datastore_record_json["activex_name"]
+            datastore._add_record_from_json(datastore_record_json)
 
         return datastore
 
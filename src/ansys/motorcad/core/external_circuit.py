@@ -0,0 +1,261 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Build Motor-CAD external thermal circuits on the client.
+
+An ``ExternalCircuit`` holds the nodes and components of an external circuit. It is sent to
+Motor-CAD with ``MotorCAD.set_external_circuit``, which only sends the changes since the
+circuit was last sent, in a few batched requests.
+"""
+from dataclasses import astuple, dataclass
+
+
+@dataclass(frozen=True)
+class CircuitNode:
+    """Node of an external thermal circuit."""
+
+    name: str
+    node1: int
+    row: int
+    column: int
+    colour: int
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class Resistance:
+    """Resistance between two thermal nodes."""
+
+    name: str
+    node1: int
+    node2: int
+    value: float
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class ResistanceMultiplier:
+    """Multiplication factor for the resistance between two thermal nodes."""
+
+    name: str
+    node1: int
+    node2: int
+    value: float
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class Capacitance:
+    """Capacitance of a thermal node."""
+
+    name: str
+    node1: int
+    value: float
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class PowerSource:
+    """Power source at a thermal node."""
+
+    name: str
+    node1: int
+    value: float
+    rpm_ref: float = 0
+    rpm_coef: float = 0
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class PowerInjection:
+    """Power injection at a thermal node."""
+
+    name: str
+    node1: int
+    value: float
+    rpm_ref: float = 0
+    rpm_coef: float = 0
+    description: str = ""
+
+
+@dataclass(frozen=True)
+class FixedTemperature:
+    """Fixed temperature of a thermal node."""
+
+    name: str
+    node1: int
+    value: float
+    description: str = ""
+
+
+# RPC method that creates or sets each type of component
+_SET_METHODS = {
+    Resistance: "SetResistanceValue",
+    ResistanceMultiplier: "SetResistanceMultiplier",
+    Capacitance: "SetCapacitanceValue",
+    PowerSource: "SetPowerSourceValue",
+    PowerInjection: "SetPowerInjectionValue",
+    FixedTemperature: "SetFixedTemperatureValue",
+}
+
+# Component type used by RemoveExternalComponent, for components that can be removed
+_REMOVE_COMPONENT_TYPES = {
+    Resistance: "Resistance",
+    PowerSource: "Power Source",
+    PowerInjection: "Power Injection",
+}
+
+
+def _get_key(component):
+    """Get the key that identifies a component in a circuit."""
+    if isinstance(component, CircuitNode):
+        return CircuitNode, component.node1
+    if isinstance(component, FixedTemperature):
+        # A node has at most one fixed temperature
+        return FixedTemperature, component.node1
+    return type(component), component.name, component.node1
+
+
+class ExternalCircuit:
+    """External thermal circuit, built on the client and sent to Motor-CAD in one update.
+
+    Components are identified by type, name and first node. Adding a component with the same
+    type, name and first node as an existing component replaces it.
+
+    Parameters
+    ----------
+    components : list, default: None
+        Nodes and components to add to the circuit.
+    """
+
+    def __init__(self, components=None):
+        """Create ExternalCircuit object."""
+        self._components = {}
+        if components is not None:
+            self.add(*components)
+
+    @property
+    def components(self):
+        """Nodes and components in the circuit."""
+        return list(self._components.values())
+
+    def __len__(self):
+        """Get the number of nodes and components in the circuit."""
+        return len(self._components)
+
+    def add(self, *components):
+        """Add nodes or components to the circuit.
+
+        Parameters
+        ----------
+        *components
+            Nodes and components, for example ``CircuitNode`` or ``Resistance`` objects.
+        """
+        for component in components:
+            if not isinstance(component, CircuitNode) and type(component) not in _SET_METHODS:
+                raise TypeError("Not an external circuit component: " + repr(component))
+            self._components[_get_key(component)] = component
+
+    def remove(self, component):
+        """Remove a node or component from the circuit.
+
+        Parameters
+        ----------
+        component
+            Node or component to remove. Components are matched by type, name and first node.
+        """
+        del self._components[_get_key(component)]
+
+    def add_node(self, name, node1, row, column, colour, description=""):
+        """Add a node to the circuit."""
+        self.add(CircuitNode(name, node1, row, column, colour, description))
+
+    def add_resistance(self, name, node1, node2, value, description=""):
+        """Add a resistance to the circuit."""
+        self.add(Resistance(name, node1, node2, value, description))
+
+    def add_resistance_multiplier(self, name, node1, node2, value, description=""):
+        """Add a resistance multiplication factor to the circuit."""
+        self.add(ResistanceMultiplier(name, node1, node2, value, description))
+
+    def add_capacitance(self, name, node1, value, description=""):
+        """Add a capacitance to the circuit."""
+        self.add(Capacitance(name, node1, value, description))
+
+    def add_power_source(self, name, node1, value, rpm_ref=0, rpm_coef=0, description=""):
+        """Add a power source to the circuit."""
+        self.add(PowerSource(name, node1, value, rpm_ref, rpm_coef, description))
+
+    def add_power_injection(self, name, node1, value, rpm_ref=0, rpm_coef=0, description=""):
+        """Add a power injection to the circuit."""
+        self.add(PowerInjection(name, node1, value, rpm_ref, rpm_coef, description))
+
+    def add_fixed_temperature(self, name, node1, value, description=""):
+        """Add a fixed temperature to the circuit."""
+        self.add(FixedTemperature(name, node1, value, description))
+
+    def _get_update(self, previous_components):
+        """Get the RPC calls that change the previously sent circuit into this circuit.
+
+        Parameters
+        ----------
+        previous_components : dict
+            Components of the circuit that was sent previously, by key. Empty if the external
+            circuit has been cleared.
+
+        Returns
+        -------
+        removals : list of tuple or None
+            ``(method, params)`` calls that remove components. None if a removed node or
+            component can't be removed on its own, so the circuit must be cleared first.
+        nodes : list of tuple
+            Calls that create or modify nodes.
+        components : list of tuple
+            Calls that create or set components.
+        """
+        removals = []
+        for key, component in previous_components.items():
+            if key in self._components:
+                continue
+            if type(component) in _REMOVE_COMPONENT_TYPES:
+                removals.append(
+                    (
+                        "RemoveExternalComponent",
+                        [_REMOVE_COMPONENT_TYPES[type(component)], component.name, component.node1],
+                    )
+                )
+            elif isinstance(component, FixedTemperature):
+                removals.append(("ClearFixedTemperatureValue", [component.node1]))
+            else:
+                return (None,) + self._get_update({})[1:]
+
+        nodes = []
+        components = []
+        for key, component in self._components.items():
+            if previous_components.get(key) == component:
+                continue
+            if isinstance(component, CircuitNode):
+                method = "ModifyNode" if key in previous_components else "CreateNewNode"
+                nodes.append((method, list(astuple(component))))
+            else:
+                components.append((_SET_METHODS[type(component)], list(astuple(component))))
+        return removals, nodes, components
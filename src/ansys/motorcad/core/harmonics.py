@@ -0,0 +1,97 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Harmonic analysis of many waveforms at once."""
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+
+def harmonics(waveforms, x_range, includes_end_point=True):
+    """Get the harmonic orders, amplitudes and angles of several waveforms.
+
+    Uses the same conventions as Motor-CAD harmonic graphs and
+    ``MotorCAD.get_magnetic_graph_harmonics``. Angles are shifted by 90 degrees and account
+    for the phase of the first point. Angles of harmonics with amplitudes below 1e-8 are set
+    to zero.
+
+    Requires NumPy.
+
+    Parameters
+    ----------
+    waveforms : array_like
+        Waveform values, with one row per waveform. All waveforms must have the same x values.
+        A single waveform can be given as a 1D array.
+    x_range : tuple of float
+        First and last x values of the waveforms, in degrees. The x range can cover several
+        cycles.
+    includes_end_point : bool, default: True
+        Whether the last value of each waveform repeats the first value (360deg=0deg), as in
+        Motor-CAD graphs. If True, the last value is discarded. If False, the last x value in
+        ``x_range`` is one step after the last value of the waveforms.
+
+    Returns
+    -------
+    order_values : numpy.ndarray
+        Harmonic orders, which are the same for all waveforms.
+    amplitude_values : numpy.ndarray
+        Harmonic amplitudes, with one row per waveform.
+    angle_values : numpy.ndarray
+        Harmonic angles in degrees, with one row per waveform.
+    """
+    if not _HAS_NUMPY:
+        raise ImportError("Failed to calculate harmonics. Please ensure numpy is installed")
+
+    waveforms = np.atleast_2d(np.asarray(waveforms, dtype=float))
+    if includes_end_point:
+        waveforms = waveforms[:, :-1]
+
+    min_x, max_x = x_range
+    cycles = (max_x - min_x) / 360
+    number_of_samples = waveforms.shape[1]
+
+    # Carry out FFT only get up to the Nyquist limit, using real valued inputs
+    waveforms_fft = np.fft.rfft(waveforms, axis=1) / number_of_samples
+
+    # Multiply by 2 to account for the positive and negative frequency component
+    waveforms_fft[:, 1:] *= 2
+
+    amplitudes = np.abs(waveforms_fft)
+    orders = np.arange(waveforms_fft.shape[1])
+
+    # Motor-CAD harmonic plot convention shifts the angles by 90 degrees.
+    # Also consider the phase angle of the first point:
+    angles = (
+        np.degrees(np.arctan2(waveforms_fft.imag, waveforms_fft.real))
+        + 90
+        - (min_x * orders / cycles)
+    )
+    angles = np.where(angles > 180, angles - 360, angles)
+    angles = np.where(angles < -180, angles + 360, angles)
+
+    # For very small magnitudes, the angle information is not meaningful, so set to zero
+    angles[amplitudes <= 1e-8] = 0
+
+    return orders / cycles, amplitudes, angles
@@ -0,0 +1,463 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Read and interpolate Motor-CAD Lab results from MAT files.
+
+Variables are only read from the file when they are used, and are stored until the file
+changes, so repeated reads of the same results don't read the file again.
+"""
+from dataclasses import dataclass
+import os
+import threading
+
+try:
+    import numpy as np
+    from scipy.io import loadmat, whosmat
+    from scipy.spatial import Delaunay, cKDTree
+
+    Num_Sci_py_AVAILABLE = True
+except ImportError:
+    Num_Sci_py_AVAILABLE = False
+
+# Tolerance for points on the edge of a triangle, with speed and torque scaled to the range 0-1
+_TOLERANCE = 1e-9
+
+
+def _lab_map_property(variable_name):
+    """Create a property for a standard Lab result map."""
+
+    def get_map(self):
+        return self[variable_name]
+
+    get_map.__doc__ = "Values of ``" + variable_name + "`` from the Lab results."
+    return property(get_map)
+
+
+class LabResults:
+    """Lab results from a Motor-CAD Lab MAT file.
+
+    Variables are read when they are first used, for example ``lab_results["Speed"]`` or
+    ``lab_results.speed``. Variables that have been read are stored in the object until the
+    file is modified, so they are freed with the object.
+
+    MAT files written by Motor-CAD are compressed, so variables can't be memory mapped, but
+    only the requested variables are read.
+
+    Requires NumPy and SciPy.
+
+    Parameters
+    ----------
+    file_path : str
+        Lab results file, for example ``MotorLAB_elecdata.mat``.
+    """
+
+    speed = _lab_map_property("Speed")
+    shaft_torque = _lab_map_property("Shaft_Torque")
+    total_loss = _lab_map_property("Total_Loss")
+    stator_current_line_rms = _lab_map_property("Stator_Current_Line_RMS")
+    power_factor = _lab_map_property("Power_Factor")
+    efficiency = _lab_map_property("Efficiency")
+
+    def __init__(self, file_path):
+        """Create LabResults object."""
+        if not Num_Sci_py_AVAILABLE:
+            raise ImportError(
+                "Failed to read Lab results. Please ensure Numpy and Scipy are installed"
+            )
+        self.file_path = os.path.abspath(file_path)
+        # Variables read from the file, and the state of the file when they were read
+        self._variables = {}
+        self._file_state = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_motorcad(cls, mc, file_name="MotorLAB_elecdata.mat"):
+        """Get Lab results from the results folder of a Motor-CAD instance.
+
+        Parameters
+        ----------
+        mc : MotorCAD
+            Motor-CAD instance.
+        file_name : str, default: "MotorLAB_elecdata.mat"
+            Name of the results file, for example ``"MotorLAB_caldata.mat"``.
+
+        Returns
+        -------
+        LabResults
+        """
+        return cls(mc.get_variable("ResultsPath_MotorLAB") + file_name)
+
+    def _get_file_state(self):
+        """Get the file modification time and size, to check whether the file has changed."""
+        file_stat = os.stat(self.file_path)
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    def _get_cached_variables(self):
+        """Get the stored variables for the file, clearing them if the file has changed."""
+        file_state = self._get_file_state()
+        if self._file_state != file_state:
+            self._variables = {}
+            self._file_state = file_state
+        return self._variables
+
+    def get_variables(self, variable_names):
+        """Get several variables from the Lab results.
+
+        Variables that haven't been read yet are read from the file together.
+
+        Parameters
+        ----------
+        variable_names : list of str
+            Names of the variables.
+
+        Returns
+        -------
+        dict
+            Value of each variable as a NumPy array.
+        """
+        with self._lock:
+            variables = self._get_cached_variables()
+            missing_names = [name for name in variable_names if name not in variables]
+            if missing_names:
+                file_variables = loadmat(self.file_path, variable_names=missing_names)
+                for name in missing_names:
+                    if name not in file_variables:
+                        raise KeyError("Variable not found in Lab results: " + name)
+                    variables[name] = file_variables[name]
+            return dict((name, variables[name]) for name in variable_names)
+
+    def __getitem__(self, variable_name):
+        """Get a variable from the Lab results."""
+        return self.get_variables([variable_name])[variable_name]
+
+    def __contains__(self, variable_name):
+        """Check whether the Lab results contain a variable."""
+        return variable_name in self.variable_names()
+
+    def variable_names(self):
+        """Get the names of all variables in the Lab results, without reading their values.
+
+        Returns
+        -------
+        list of str
+        """
+        return [name for name, _, _ in whosmat(self.file_path)]
+
+    def interpolator(self, variable_names=None):
+        """Create an interpolator for Lab result maps.
+
+        Parameters
+        ----------
+        variable_names : list of str, default: None
+            Names of the maps to interpolate. If None, ``Total_Loss``,
+            ``Stator_Current_Line_RMS`` and ``Power_Factor`` are used.
+
+        Returns
+        -------
+        LabMapInterpolator
+        """
+        if variable_names is None:
+            variable_names = ["Total_Loss", "Stator_Current_Line_RMS", "Power_Factor"]
+        maps = self.get_variables(["Speed", "Shaft_Torque"] + list(variable_names))
+        speed = maps.pop("Speed")
+        torque = maps.pop("Shaft_Torque")
+        return LabMapInterpolator(speed, torque, maps)
+
+    def get_unit(self, variable_name):
+        """Get the unit of a Lab result variable.
+
+        Parameters
+        ----------
+        variable_name : str
+            Name of the variable.
+
+        Returns
+        -------
+        str
+        """
+        names_and_units = self.get_variables(["varStr", "varUnits"])
+        names = names_and_units["varStr"]
+        index = np.where(np.strings.find(names, variable_name) == 0)[0]
+        return str(names_and_units["varUnits"][index][0]).strip()
+
+
+@dataclass
+class LabMapPoints:
+    """Operating points located in the grid of a ``LabMapInterpolator``.
+
+    Locating points is the slowest part of interpolation, so located points can be reused to
+    interpolate several maps, or maps from several designs with the same grid.
+
+    Attributes
+    ----------
+    vertices : numpy.ndarray
+        Grid points used for each operating point, with shape (number of points, 3).
+    weights : numpy.ndarray
+        Weight of each grid point, with shape (number of points, 3).
+    outside : numpy.ndarray
+        True for operating points outside the Lab map.
+    shape : tuple
+        Shape of the speed and torque arrays.
+    """
+
+    vertices: "np.ndarray"
+    weights: "np.ndarray"
+    outside: "np.ndarray"
+    shape: tuple
+
+
+class LabMapInterpolator:
+    """Interpolate Lab result maps for many operating points at once.
+
+    The Lab map grid points are triangulated, with speed and torque scaled to the same range.
+    Values are interpolated linearly within each triangle. If the maps are 2D arrays, as in
+    ``MotorLAB_elecdata.mat``, each cell of four neighbouring grid points is split into two
+    triangles, so points above the torque limit are outside the map. Other grids are triangulated
+    with a Delaunay triangulation.
+
+    Requires NumPy and SciPy.
+
+    Parameters
+    ----------
+    speed : numpy.ndarray
+        Speed of each grid point.
+    torque : numpy.ndarray
+        Shaft torque of each grid point.
+    maps : dict
+        Value of each map at each grid point, with the same shape as ``speed``.
+    """
+
+    def __init__(self, speed, torque, maps):
+        """Create LabMapInterpolator object."""
+        if not Num_Sci_py_AVAILABLE:
+            raise ImportError(
+                "Failed to create Lab map interpolator. Please ensure Numpy and Scipy are installed"
+            )
+        speed = np.asarray(speed, dtype=float)
+        torque = np.asarray(torque, dtype=float)
+        if speed.shape != torque.shape:
+            raise ValueError("Speed and torque must have the same shape.")
+        for name, values in maps.items():
+            if np.shape(values) != speed.shape:
+                raise ValueError("Map " + name + " must have the same shape as speed.")
+
+        valid = np.isfinite(speed) & np.isfinite(torque)
+        speed = speed[valid]
+        torque = torque[valid]
+        self._offset = np.array([speed.min(), torque.min()])
+        self._scale = np.array([np.ptp(speed), np.ptp(torque)])
+        self._scale[self._scale == 0] = 1.0
+        self._points = self._normalise(speed, torque)
+        if valid.ndim == 2:
+            self._set_triangles(self._grid_triangles(valid))
+        else:
+            self._set_triangles(Delaunay(self._points).simplices)
+        self._nearest = None
+        self.maps = dict(
+            (name, np.asarray(values, dtype=float)[valid]) for name, values in maps.items()
+        )
+
+    def _normalise(self, speed, torque):
+        """Scale speed and torque to the range of the grid."""
+        return (np.stack([speed, torque], axis=-1) - self._offset) / self._scale
+
+    @staticmethod
+    def _grid_triangles(valid):
+        """Split each cell of neighbouring grid points into two triangles.
+
+        Triangles with a missing grid point are skipped, so the triangles follow the edge of
+        the map.
+        """
+        index = np.full(valid.shape, -1)
+        index[valid] = np.arange(np.count_nonzero(valid))
+        corner_00 = index[:-1, :-1].ravel()
+        corner_10 = index[1:, :-1].ravel()
+        corner_01 = index[:-1, 1:].ravel()
+        corner_11 = index[1:, 1:].ravel()
+        triangles = np.concatenate(
+            [
+                np.column_stack([corner_00, corner_10, corner_01]),
+                np.column_stack([corner_11, corner_01, corner_10]),
+            ]
+        )
+        return triangles[np.all(triangles >= 0, axis=1)]
+
+    def _set_triangles(self, triangles):
+        """Store the triangles, and sort them into bins for locating points."""
+        corners = self._points[triangles]
+        edges = np.stack([corners[:, 0] - corners[:, 2], corners[:, 1] - corners[:, 2]], axis=-1)
+        # Triangles with no area can't contain any points
+        area = np.abs(np.linalg.det(edges)) if len(edges) else np.zeros(0)
+        keep = area > _TOLERANCE * _TOLERANCE
+        if not keep.any():
+            raise ValueError("Lab map grid must contain at least one triangle.")
+        self._triangles = triangles[keep]
+        self._origins = corners[keep, 2]
+        self._transforms = np.linalg.inv(edges[keep])
+
+        # Bins are a regular grid over the normalised speed and torque range, with roughly one
+        # triangle per bin. Each triangle is added to every bin its bounding box overlaps.
+        corners = corners[keep]
+        self._bins = max(1, int(np.sqrt(len(self._triangles))))
+        first = self._bin_index(corners.min(axis=1) - _TOLERANCE)
+        last = self._bin_index(corners.max(axis=1) + _TOLERANCE)
+        widths = last - first + 1
+        counts = widths[:, 0] * widths[:, 1]
+        triangle_ids = np.repeat(np.arange(len(counts)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        bins_x = first[triangle_ids, 0] + offsets % widths[triangle_ids, 0]
+        bins_y = first[triangle_ids, 1] + offsets // widths[triangle_ids, 0]
+        bins = bins_y * self._bins + bins_x
+        order = np.argsort(bins, kind="stable")
+        self._bin_triangles = triangle_ids[order]
+        self._bin_starts = np.concatenate(
+            [[0], np.cumsum(np.bincount(bins, minlength=self._bins * self._bins))]
+        )
+
+    def _bin_index(self, points):
+        """Get the bin column and row of normalised points."""
+        return np.clip(np.floor(points * self._bins).astype(int), 0, self._bins - 1)
+
+    def _find_triangles(self, points):
+        """Find the triangle containing each normalised point, and the weight of each corner.
+
+        The triangle is -1, and the weights are NaN, for points outside all triangles.
+        """
+        triangles = np.full(len(points), -1)
+        weights = np.full((len(points), 3), np.nan)
+        candidates = np.flatnonzero(
+            np.all((points >= -_TOLERANCE) & (points <= 1 + _TOLERANCE), axis=1)
+        )
+        bins = self._bin_index(points[candidates])
+        bins = bins[:, 1] * self._bins + bins[:, 0]
+        starts = self._bin_starts[bins]
+        counts = self._bin_starts[bins + 1] - starts
+
+        # Check the nth triangle in the bin of each point not found yet
+        n = 0
+        while len(candidates):
+            remaining = counts > n
+            candidates = candidates[remaining]
+            starts = starts[remaining]
+            counts = counts[remaining]
+            triangle = self._bin_triangles[starts + n]
+            coordinates = np.einsum(
+                "ijk,ik->ij",
+                self._transforms[triangle],
+                points[candidates] - self._origins[triangle],
+            )
+            weight = np.column_stack([coordinates, 1.0 - coordinates.sum(axis=1)])
+            found = np.all(weight >= -_TOLERANCE, axis=1)
+            triangles[candidates[found]] = triangle[found]
+            weights[candidates[found]] = weight[found]
+            candidates = candidates[~found]
+            starts = starts[~found]
+            counts = counts[~found]
+            n += 1
+        return triangles, weights
+
+    def locate(self, speed, torque, extrapolate=False):
+        """Locate operating points in the grid.
+
+        Parameters
+        ----------
+        speed : numpy.ndarray
+            Speed of each operating point.
+        torque : numpy.ndarray
+            Shaft torque of each operating point.
+        extrapolate : bool, default: False
+            If True, points outside the map use the values at the nearest grid point. If False,
+            values for points outside the map are NaN.
+
+        Returns
+        -------
+        LabMapPoints
+        """
+        speed, torque = np.broadcast_arrays(
+            np.asarray(speed, dtype=float), np.asarray(torque, dtype=float)
+        )
+        points = self._normalise(speed.ravel(), torque.ravel())
+
+        triangles, weights = self._find_triangles(points)
+        outside = triangles < 0
+        vertices = self._triangles[np.where(outside, 0, triangles)]
+
+        if extrapolate:
+            if self._nearest is None:
+                self._nearest = cKDTree(self._points)
+            _, nearest = self._nearest.query(points[outside])
+            vertices[outside] = nearest[:, np.newaxis]
+            weights[outside] = [1.0, 0.0, 0.0]
+
+        return LabMapPoints(vertices, weights, outside.reshape(speed.shape), speed.shape)
+
+    def evaluate(self, points, variable_names=None):
+        """Interpolate maps at located operating points.
+
+        Parameters
+        ----------
+        points : LabMapPoints
+            Operating points from ``locate``.
+        variable_names : list of str, default: None
+            Names of the maps to interpolate. If None, all maps are interpolated.
+
+        Returns
+        -------
+        dict
+            Interpolated values of each map, with the same shape as the operating points.
+        """
+        if variable_names is None:
+            variable_names = self.maps
+        return dict(
+            (
+                name,
+                np.einsum("ij,ij->i", self.maps[name][points.vertices], points.weights).reshape(
+                    points.shape
+                ),
+            )
+            for name in variable_names
+        )
+
+    def interpolate(self, speed, torque, variable_names=None, extrapolate=False):
+        """Interpolate maps at operating points.
+
+        Parameters
+        ----------
+        speed : numpy.ndarray
+            Speed of each operating point.
+        torque : numpy.ndarray
+            Shaft torque of each operating point.
+        variable_names : list of str, default: None
+            Names of the maps to interpolate. If None, all maps are interpolated.
+        extrapolate : bool, default: False
+            If True, points outside the map use the values at the nearest grid point. If False,
+            values for points outside the map are NaN.
+
+        Returns
+        -------
+        dict
+            Interpolated values of each map, with the same shape as the operating points.
+        numpy.ndarray
+            True for operating points outside the map.
+        """
+        points = self.locate(speed, torque, extrapolate=extrapolate)
+        return self.evaluate(points, variable_names), points.outside
@@ -21,12 +21,97 @@
 # SOFTWARE.
 
 """RPC methods for calculations."""
-from ansys.motorcad.core.rpc_client_core import MotorCADWarning
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+from ansys.motorcad.core.datastore import Datastore, DataTypes
+from ansys.motorcad.core.result_cache import GRAPH_FUNCTIONS, CachedResult
+from ansys.motorcad.core.rpc_client_core import MotorCADError, MotorCADWarning
+
+# Number of cells to request at once when getting a force harmonics matrix one cell at a time
+_FORCE_MATRIX_CHUNK_SIZE = 4096
+
+# Limit on the number of rows or columns of a force harmonics matrix, in case Motor-CAD
+# doesn't return an error for cells outside the matrix
+_MAX_FORCE_MATRIX_SIZE = 65536
 
 
 class _RpcMethodsCalculations:
     def __init__(self, mc_connection):
         self.connection = mc_connection
+        self._result_cache = None
+        self._result_cache_graphs = []
+        self._result_cache_inputs = None
+
+    def set_result_cache(self, result_cache, graphs=None):
+        """Use a persistent cache for calculation results.
+
+        When a result cache is set, ``do_magnetic_calculation`` and ``do_steady_state_analysis``
+        return a ``CachedResult`` containing the output variables and requested graphs. If a
+        result is already stored for the current inputs, it is returned without running the
+        calculation. In this case, the results in the Motor-CAD instance are not updated, so
+        results must be read from the ``CachedResult``.
+
+        Requires Motor-CAD 2026.0 or later.
+
+        Parameters
+        ----------
+        result_cache : ansys.motorcad.core.result_cache.ResultCache | None
+            Cache to use. If None, caching is disabled.
+        graphs : list of tuple, default: None
+            Graphs to store with each result, as ``(source, graph_name)`` tuples. Options for
+            source are ``"magnetic"``, ``"temperature"``, ``"power"`` and ``"heatflow"``.
+        """
+        if graphs is None:
+            graphs = []
+        for source, _ in graphs:
+            if source not in GRAPH_FUNCTIONS:
+                raise ValueError("Graph source must be one of: " + ", ".join(GRAPH_FUNCTIONS) + ".")
+        self._result_cache = result_cache
+        self._result_cache_graphs = [tuple(graph) for graph in graphs]
+
+    def _run_calculation(self, method):
+        """Run a calculation, using the result cache if one is set.
+
+        Parameters
+        ----------
+        method : str
+            Name of the calculation RPC method.
+
+        Returns
+        -------
+        CachedResult | None
+            None if no result cache is set.
+        """
+        if self._result_cache is None:
+            return self.connection.send_and_receive(method)
+
+        # Only inputs are needed for the key, so don't transfer the whole datastore
+        if self._result_cache_inputs is None:
+            self._result_cache_inputs = Datastore()
+        self._result_cache_inputs.refresh(self, inout_types=[DataTypes.input])
+        key = self._result_cache.get_key(
+            self._result_cache_inputs.input_hash(), method, self.connection.program_version
+        )
+
+        result = self._result_cache.get(key)
+        if (result is not None) and result.has_graphs(self._result_cache_graphs):
+            return result
+
+        self.connection.send_and_receive(method)
+
+        outputs = Datastore().refresh(self, inout_types=[DataTypes.output])
+        graphs = dict(
+            ((source, graph_name), getattr(self, GRAPH_FUNCTIONS[source])(graph_name))
+            for source, graph_name in self._result_cache_graphs
+        )
+        result = CachedResult(outputs, graphs)
+        self._result_cache.put(key, result)
+        return result
 
     def do_magnetic_thermal_calculation(self):
         """Run coupled e-magnetic and thermal calculations."""
@@ -78,6 +163,98 @@ class _RpcMethodsCalculations:
         params = [row, column, load_point]
         return self.connection.send_and_receive(method, params)
 
+    def _force_frequency_domain_index_exists(self, load_point, axis, index):
+        """Check if a row (axis 0) or column (axis 1) of a force harmonics matrix exists."""
+        params = [0, 0, load_point]
+        params[axis] = index
+        try:
+            # None if the call failed, with exceptions disabled
+            value = self.connection.send_and_receive(
+                "GetForceFrequencyDomainAmplitude", params, success_var=False
+            )
+        except MotorCADError:
+            return False
+        return value is not None
+
+    def _get_force_frequency_domain_size(self, load_point, axis):
+        """Find the number of rows (axis 0) or columns (axis 1) of a force harmonics matrix.
+
+        The first row and column must exist. The index is doubled until it is outside the
+        matrix, then the end of the matrix is found by bisection.
+        """
+        # Index lower exists and upper doesn't
+        lower = 0
+        upper = 1
+        while self._force_frequency_domain_index_exists(load_point, axis, upper):
+            if upper >= _MAX_FORCE_MATRIX_SIZE:
+                raise MotorCADError("Failed to find the size of the force harmonics matrix.")
+            lower = upper
+            upper = upper * 2
+        while upper - lower > 1:
+            middle = (lower + upper) // 2
+            if self._force_frequency_domain_index_exists(load_point, axis, middle):
+                lower = middle
+            else:
+                upper = middle
+        return upper
+
+    def get_force_frequency_domain_matrix(self, load_points=None):
+        """Export the force space time harmonics matrices for a 2D FFT.
+
+        If the Motor-CAD instance can't return a whole matrix, the matrix values are requested
+        in batches.
+
+        Requires NumPy.
+
+        Parameters
+        ----------
+        load_points : list of int, default: None
+            Load points to get matrices for, from 1 to the value of ``"NumLoadPoints"``. If None,
+            all load points are used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Matrix values, indexed by load point, row and column.
+        """
+        if not _HAS_NUMPY:
+            raise ImportError(
+                "Failed to get force frequency domain matrix. Please ensure numpy is installed"
+            )
+        number_of_load_points = self.get_variable("NumLoadPoints")
+        if load_points is None:
+            load_points = range(1, number_of_load_points + 1)
+        load_points = list(load_points)
+        for load_point in load_points:
+            if not 1 <= load_point <= number_of_load_points:
+                raise ValueError("Load point must be from 1 to " + str(number_of_load_points) + ".")
+
+        if self.connection.check_if_feature_exists("get_force_frequency_domain_matrix"):
+            calls = [("GetForceFrequencyDomainMatrix", [load_point]) for load_point in load_points]
+            matrices = self.connection.send_and_receive_batch(calls, success_var=False)
+            return np.array(matrices, dtype=float)
+
+        # Raises an error if the matrix isn't available
+        self.get_force_frequency_domain_amplitude(0, 0, load_points[0])
+        number_of_rows = self._get_force_frequency_domain_size(load_points[0], 0)
+        number_of_columns = self._get_force_frequency_domain_size(load_points[0], 1)
+        calls = [
+            ("GetForceFrequencyDomainAmplitude", [row, column, load_point])
+            for load_point in load_points
+            for row in range(number_of_rows)
+            for column in range(number_of_columns)
+        ]
+        values = []
+        for chunk_start in range(0, len(calls), _FORCE_MATRIX_CHUNK_SIZE):
+            values.extend(
+                self.connection.send_and_receive_batch(
+                    calls[chunk_start : chunk_start + _FORCE_MATRIX_CHUNK_SIZE], success_var=False
+                )
+            )
+        return np.array(values, dtype=float).reshape(
+            (len(load_points), number_of_rows, number_of_columns)
+        )
+
     def update_force_analysis_results(self, fft_data_type):
         """Update force analysis results for the multiforce operating point.
 
@@ -100,9 +277,15 @@ class _RpcMethodsCalculations:
         return self.connection.send_and_receive(method)
 
     def do_steady_state_analysis(self):
-        """Run the thermal steady state analysis."""
+        """Run the thermal steady state analysis.
+
+        Returns
+        -------
+        CachedResult | None
+            Calculation outputs if a result cache has been set with ``set_result_cache``.
+        """
         method = "DoSteadyStateAnalysis"
-        return self.connection.send_and_receive(method)
+        return self._run_calculation(method)
 
     def do_transient_analysis(self):
         """Run the thermal transient analysis."""
@@ -110,9 +293,15 @@ class _RpcMethodsCalculations:
         return self.connection.send_and_receive(method)
 
     def do_magnetic_calculation(self):
-        """Run the Motor-CAD magnetic calculation."""
+        """Run the Motor-CAD magnetic calculation.
+
+        Returns
+        -------
+        CachedResult | None
+            Calculation outputs if a result cache has been set with ``set_result_cache``.
+        """
         method = "DoMagneticCalculation"
-        return self.connection.send_and_receive(method)
+        return self._run_calculation(method)
 
     def do_weight_calculation(self, context=None):
         """Run the Motor-CAD weight calculation."""
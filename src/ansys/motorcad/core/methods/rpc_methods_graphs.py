@@ -21,25 +21,91 @@
 # SOFTWARE.
 
 """RPC methods for graphs."""
+from contextlib import contextmanager
+from copy import deepcopy
 from dataclasses import dataclass
 import math
 
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+from ansys.motorcad.core.harmonics import harmonics
 from ansys.motorcad.core.rpc_client_core import MotorCADError
 
+_END_OF_GRAPH_ERROR = "Point requested is greater than number of points available"
+
+# RPC methods for getting a graph one point at a time, for Motor-CAD versions before 2025.0
+_GRAPH_POINT_METHODS = {
+    "magnetic": "GetMagneticGraphPoint",
+    "temperature": "GetTemperatureGraphPoint",
+    "power": "GetPowerGraphPoint",
+}
+
+GRAPH_DATA_SOURCES = {
+    "magnetic": "MagneticDataSource",
+    "temperature": "TransientDataSource",
+    "power": "PowerDataSource",
+    "heatflow": "HeatFlowDataSource",
+    "fea": "FEAPathDataSource",
+}
+
 
 @dataclass
 class Magnetic3dGraph:
-    """Class for x, y and data from a magnetic 3d graph."""
+    """Class for x, y and data from a magnetic 3d graph.
+
+    Values are lists, as returned by Motor-CAD. Use ``x_array``, ``y_array`` and
+    ``data_array`` to get the values as NumPy arrays. Arrays are converted once and stored
+    until ``x``, ``y`` or ``data`` is set again, so changes made to the lists in place aren't
+    included in the arrays.
+    """
 
     x: list
     y: list
     data: list
 
+    def __setattr__(self, name, value):
+        """Set an attribute, clearing the stored array of a changed value."""
+        super().__setattr__(name, value)
+        self.__dict__.get("_arrays", {}).pop(name, None)
+
+    def _get_array(self, name):
+        """Get the values of an attribute as a read-only NumPy array, converting them once."""
+        if not _HAS_NUMPY:
+            raise ImportError("Failed to get graph array. Please ensure numpy is installed")
+        arrays = self.__dict__.setdefault("_arrays", {})
+        if name not in arrays:
+            array = np.array(getattr(self, name), dtype=float)
+            array.flags.writeable = False
+            arrays[name] = array
+        return arrays[name]
+
+    @property
+    def x_array(self):
+        """Values of x coordinates as a NumPy array."""
+        return self._get_array("x")
+
+    @property
+    def y_array(self):
+        """Values of y coordinates as a NumPy array."""
+        return self._get_array("y")
+
+    @property
+    def data_array(self):
+        """Graph values as a 2D NumPy array, indexed by x and then y."""
+        return self._get_array("data")
+
 
 def _dft_real(values):
     """
     Calculate a discrete fourier transform from a real valued list.
 
+    Pure Python version, used when NumPy is not available.
+
     Parameters
     ----------
     values : list of real
@@ -56,29 +122,191 @@ def _dft_real(values):
     # Discard terms above Nyquist limit
     length_out = length_in // 2 + 1
 
+    # i * j * 2 * pi / length_in repeats every length_in, so look up cos and sin from a table
+    cos_table = [math.cos(k * 2 * math.pi / length_in) for k in range(length_in)]
+    sin_table = [math.sin(k * 2 * math.pi / length_in) for k in range(length_in)]
+
     real = [0] * length_out
     imag = [0] * length_out
 
     for i in range(length_out):
-        for j in range(length_in):
-            real[i] = real[i] + values[j] * math.cos(i * j * 2 * math.pi / length_in) / length_in
-            imag[i] = imag[i] - values[j] * math.sin(i * j * 2 * math.pi / length_in) / length_in
+        real_sum = 0
+        imag_sum = 0
+        k = 0
+        for value in values:
+            real_sum += value * cos_table[k]
+            imag_sum -= value * sin_table[k]
+            k = (k + i) % length_in
+        real[i] = real_sum / length_in
+        imag[i] = imag_sum / length_in
     return real, imag
 
 
+def _graph_harmonics(x, y):
+    """Get the harmonic orders, amplitudes and angles of a graph.
+
+    Parameters
+    ----------
+    x : list
+        Values of x coordinates from the graph, in degrees.
+    y : list
+        Values of y coordinates from the graph. The final point is a duplicate of the first
+        point (360deg=0deg) and is discarded.
+
+    Returns
+    -------
+    order_values : list
+        Value of harmonic orders from graph
+    amplitude_values : list
+        Value of harmonic amplitudes from graph
+    angle_values : list
+        Value of harmonic angles from graph in degrees
+    """
+    if _HAS_NUMPY:
+        orders, amplitudes, angles = harmonics([y], (min(x), max(x)))
+        return [orders.tolist(), amplitudes[0].tolist(), angles[0].tolist()]
+
+    # Find x-axis limits and range, as this is needed to find the phase information
+    min_x = min(x)
+    cycles = (max(x) - min(x)) / 360
+
+    # y normally contains a duplicated final point (360deg=0deg), so discard this point.
+    y_no_duplicate = y[: len(y) - 1]
+
+    return _graph_harmonics_python(min_x, cycles, y_no_duplicate)
+
+
+def _graph_harmonics_python(min_x, cycles, y_no_duplicate):
+    """Pure Python version of ``_graph_harmonics``, used when NumPy is not available."""
+    y_fft_real, y_fft_imag = _dft_real(y_no_duplicate)
+
+    y_index = []
+    y_mag = []
+    y_ang = []
+    for i in range(len(y_fft_real)):
+        # Apply normalisation.
+        if i > 0:
+            # Multiply by 2 to account for the positive and negative frequency component
+            y_fft_real[i] = 2 * y_fft_real[i]
+            y_fft_imag[i] = 2 * y_fft_imag[i]
+
+        # Get amplitude and angle:
+        magnitude = math.sqrt(y_fft_real[i] ** 2 + y_fft_imag[i] ** 2)
+        angle = math.degrees(math.atan2(y_fft_imag[i], y_fft_real[i]))
+
+        # Motor-CAD harmonic plot convention shifts the angles by 90 degrees.
+        # Also consider the phase angle of the first point:
+        angle = angle + 90 - (min_x * i / cycles)
+        if angle > 180:
+            angle = angle - 360
+        if angle < -180:
+            angle = angle + 360
+
+        # For very small magnitudes, the angle information is not meaningful, so set to zero
+        if math.isclose(magnitude, 0, abs_tol=1e-8):
+            angle = 0
+
+        y_index.append(i / cycles)
+        y_mag.append(magnitude)
+        y_ang.append(angle)
+
+    return [y_index, y_mag, y_ang]
+
+
+@dataclass
+class ForceOrders:
+    """Class for space and time order force harmonics for all operating points and slices.
+
+    Amplitudes and angles are indexed by operating point, slice, space order index and time
+    order index. Use ``get_order()`` to get results for a space and time order.
+    """
+
+    space_orders: "np.ndarray"
+    time_orders: "np.ndarray"
+    amplitude: "np.ndarray"
+    angle: "np.ndarray"
+
+    def get_order(self, space_order, time_order):
+        """Get the amplitude and angle of a force order for all operating points and slices.
+
+        Parameters
+        ----------
+        space_order : int
+            Space order. Can be positive or negative.
+        time_order : float
+            Electrical time order. Must be zero or positive.
+
+        Returns
+        -------
+        amplitude : numpy.ndarray
+            Amplitudes, indexed by operating point and slice.
+        angle : numpy.ndarray
+            Angles in degrees, indexed by operating point and slice.
+        """
+        space_indices = np.flatnonzero(self.space_orders == space_order)
+        time_indices = np.flatnonzero(np.isclose(self.time_orders, time_order))
+        if len(space_indices) == 0 or len(time_indices) == 0:
+            raise ValueError(
+                "Force order not available: " + str(space_order) + ", " + str(time_order)
+            )
+        space_index = space_indices[0]
+        time_index = time_indices[0]
+        return (
+            self.amplitude[:, :, space_index, time_index],
+            self.angle[:, :, space_index, time_index],
+        )
+
+
+def _generic_graph_call(source, graph_name, section_number, point_number):
+    """Get the method and params for getting a graph with ``GetGenericGraph``."""
+    method = "GetGenericGraph"
+    params = [{"variant": graph_name}, GRAPH_DATA_SOURCES[source], section_number, point_number]
+    return method, params
+
+
 class _RpcMethodsGraphs:
     def __init__(self, mc_connection):
         self.connection = mc_connection
+        self._message_display_depth = 0
+        self._saved_message_display_state = None
+        self._graph_cache = None
+        self._graph_cache_generation = 0
+
+    @contextmanager
+    def _message_display_suppressed(self):
+        """Turn off the Motor-CAD message popup window until the context exits.
+
+        Contexts can be nested, in which case the message display state is only saved and
+        restored by the outermost context.
+        """
+        if self._message_display_depth == 0:
+            self._saved_message_display_state = self.get_variable("MessageDisplayState")
+            self.set_variable("MessageDisplayState", 2)
+        self._message_display_depth += 1
+        try:
+            yield
+        finally:
+            self._message_display_depth -= 1
+            if self._message_display_depth == 0:
+                # switching on again the message window
+                self.set_variable("MessageDisplayState", self._saved_message_display_state)
+
+    def _get_graph(self, method, graph_name):
+        """Get an array from a Motor-CAD graph, one point at a time.
 
-    def _get_graph(self, graphing_func, *args):
-        """Get an array from a Motor-CAD graph.
+        Used for Motor-CAD versions that can't return a whole graph. The number of points is
+        found by requesting points at doubling and then bisecting point numbers. The remaining
+        points are then requested in a single batch request, if the Motor-CAD RPC server
+        accepts batch requests, or one at a time otherwise.
+
+        If exceptions are disabled, the graph ends at the first point that fails.
 
         Parameters
         ----------
-        graphing_func : func
-            graph function to use eg. get_magnetic_graph_point
-        *args : str, int
-            Args for selected graphing function
+        method : str
+            RPC method for getting a graph point, for example ``"GetMagneticGraphPoint"``.
+        graph_name : str, int
+            Name or ID of the graph.
 
         Returns
         -------
@@ -87,29 +315,85 @@ class _RpcMethodsGraphs:
         y_array : list
             Values of y coordinates from the graph.
         """
-        loop = 0
-        x_points = []
-        y_points = []
-        # turning off message poput window
-        save_message_display_state = self.get_variable("MessageDisplayState")
-        self.set_variable("MessageDisplayState", 2)
+        with self._message_display_suppressed():
+            points = self._get_graph_points(method, graph_name)
+        return [point[0] for point in points], [point[1] for point in points]
+
+    def _get_graph_point_or_none(self, method, graph_name, point_number):
+        """Get a graph point, or None if it is after the end of the graph."""
         try:
-            while True:
-                try:
-                    x, y = graphing_func(*args, loop)
-
-                    y_points.append(y)
-                    x_points.append(x)
-                    loop += 1
-                except MotorCADError as e:
-                    if "Point requested is greater than number of points available" in str(e):
-                        break
-                    else:
-                        raise
-        finally:
-            # switching on again the message window
-            self.set_variable("MessageDisplayState", save_message_display_state)
-        return x_points, y_points
+            # None if the call failed, with exceptions disabled
+            return self.connection.send_and_receive(
+                method, [{"variant": graph_name}, point_number], success_var=False
+            )
+        except MotorCADError as e:
+            if _END_OF_GRAPH_ERROR in str(e):
+                return None
+            raise
+
+    def _get_graph_points_batch(self, method, graph_name, point_numbers):
+        """Get graph points in a single batch request, with None for points after the end."""
+        calls = [
+            (method, [{"variant": graph_name}, point_number]) for point_number in point_numbers
+        ]
+        results = self.connection.send_and_receive_batch(
+            calls, success_var=False, return_errors=True
+        )
+        for index, point in enumerate(results):
+            if isinstance(point, MotorCADError):
+                if _END_OF_GRAPH_ERROR not in str(point):
+                    raise point
+                results[index] = None
+        return results
+
+    def _get_graph_points(self, method, graph_name):
+        """Get all points of a graph, finding the number of points first."""
+        points = {}
+
+        def point_exists(point_number):
+            if point_number not in points:
+                points[point_number] = self._get_graph_point_or_none(
+                    method, graph_name, point_number
+                )
+            return points[point_number] is not None
+
+        if not point_exists(0):
+            return []
+        # Point number lower exists and upper doesn't
+        lower = 0
+        upper = 1
+        while point_exists(upper):
+            lower = upper
+            upper = upper * 2
+        while upper - lower > 1:
+            middle = (lower + upper) // 2
+            if point_exists(middle):
+                lower = middle
+            else:
+                upper = middle
+
+        missing_point_numbers = [
+            point_number for point_number in range(upper) if point_number not in points
+        ]
+        if len(missing_point_numbers) > 0:
+            if self.connection._check_batch_supported():
+                missing_points = self._get_graph_points_batch(
+                    method, graph_name, missing_point_numbers
+                )
+            else:
+                missing_points = [
+                    self._get_graph_point_or_none(method, graph_name, point_number)
+                    for point_number in missing_point_numbers
+                ]
+            points.update(zip(missing_point_numbers, missing_points))
+
+        graph_points = []
+        for point_number in range(upper):
+            if points[point_number] is None:
+                # Failed, with exceptions disabled
+                break
+            graph_points.append(points[point_number])
+        return graph_points
 
     def get_magnetic_graph_point(self, graph_name, point_number):
         """Get a point from a Motor-CAD magnetic graph.
@@ -246,12 +530,7 @@ class _RpcMethodsGraphs:
         y_values : list
             Value of y coordinates from graph
         """
-        if self.connection.check_version_at_least("2025.0"):
-            method = "GetGenericGraph"
-            params = [{"variant": graph_name}, "MagneticDataSource", -1, -1]
-            return self.connection.send_and_receive(method, params)
-        else:
-            return self._get_graph(self.get_magnetic_graph_point, graph_name)
+        return self._get_cached_graph("magnetic", graph_name, -1, -1)
 
     def get_magnetic_graph_harmonics(self, graph_name):
         """Get harmonic analysis from Motor-CAD magnetic graph.
@@ -271,50 +550,7 @@ class _RpcMethodsGraphs:
             Value of harmonic angles from graph in degrees
         """
         x, y = self.get_magnetic_graph(graph_name)
-        # Find x-axis limits and range, as this is needed to find the phase information
-        min_x = min(x)
-        cycles = (max(x) - min(x)) / 360
-
-        # y normally contains a duplicated final point (360deg=0deg), so discard this point.
-        y_no_duplicate = y[: len(y) - 1]
-
-        # Carry out FFT only get up to the Nyquist limit, using real valued inputs
-        y_fft_real, y_fft_imag = _dft_real(y_no_duplicate)
-
-        # Apply normalisation.
-        for i in range(len(y_fft_real)):
-            if i > 0:
-                # Multiply by 2 to account for the positive and negative frequency component
-                y_fft_real[i] = 2 * y_fft_real[i]
-                y_fft_imag[i] = 2 * y_fft_imag[i]
-
-        # Get amplitude and angle:
-        y_mag = []
-        y_ang = []
-        for i in range(len(y_fft_real)):
-            y_mag.append(math.sqrt(y_fft_real[i] ** 2 + y_fft_imag[i] ** 2))
-            y_ang.append(math.degrees(math.atan2(y_fft_imag[i], y_fft_real[i])))
-
-        # Motor-CAD harmonic plot convention shifts the angles by 90 degrees.
-        # Also consider the phase angle of the first point:
-        for i in range(len(y_ang)):
-            y_ang[i] = y_ang[i] + 90 - (min_x * i / cycles)
-            if y_ang[i] > 180:
-                y_ang[i] = y_ang[i] - 360
-            if y_ang[i] < -180:
-                y_ang[i] = y_ang[i] + 360
-
-        # For very small magnitudes, the angle information is not meaningful, so set to zero
-        for i in range(len(y_ang)):
-            if math.isclose(y_mag[i], 0, abs_tol=1e-8):
-                y_ang[i] = 0
-
-        # Generate an index list for plotting
-        y_index = []
-        for i in range(len(y_ang)):
-            y_index.append(i / cycles)
-
-        return [y_index, y_mag, y_ang]
+        return _graph_harmonics(x, y)
 
     def get_temperature_graph(self, graph_name):
         """Get graph points from a Motor-CAD transient temperature graph.
@@ -331,12 +567,7 @@ class _RpcMethodsGraphs:
         y_values : list
             value of y coordinates from graph
         """
-        if self.connection.check_version_at_least("2025.0"):
-            method = "GetGenericGraph"
-            params = [{"variant": graph_name}, "TransientDataSource", -1, -1]
-            return self.connection.send_and_receive(method, params)
-        else:
-            return self._get_graph(self.get_temperature_graph_point, graph_name)
+        return self._get_cached_graph("temperature", graph_name, -1, -1)
 
     def get_power_graph(self, graph_name):
         """Get graph points from a Motor-CAD transient power loss graph.
@@ -353,12 +584,7 @@ class _RpcMethodsGraphs:
         y_values : list
             value of y coordinates from graph
         """
-        if self.connection.check_version_at_least("2025.0"):
-            method = "GetGenericGraph"
-            params = [{"variant": graph_name}, "PowerDataSource", -1, -1]
-            return self.connection.send_and_receive(method, params)
-        else:
-            return self._get_graph(self.get_power_graph_point, graph_name)
+        return self._get_cached_graph("power", graph_name, -1, -1)
 
     def get_heatflow_graph(self, graph_name):
         """Get graph points from a Motor-CAD heat flow graph.
@@ -375,10 +601,7 @@ class _RpcMethodsGraphs:
         y_values : list
             value of y coordinates from graph
         """
-        self.connection.ensure_version_at_least("2025.0")
-        method = "GetGenericGraph"
-        params = [{"variant": graph_name}, "HeatFlowDataSource", -1, -1]
-        return self.connection.send_and_receive(method, params)
+        return self._get_cached_graph("heatflow", graph_name, -1, -1)
 
     def get_fea_graph(self, graph_name, section_number, point_number=0):
         """Get graph points from a Motor-CAD FEA graph.
@@ -401,10 +624,7 @@ class _RpcMethodsGraphs:
         y_values : list
             value of y coordinates from graph
         """
-        self.connection.ensure_version_at_least("2025.0")
-        method = "GetGenericGraph"
-        params = [{"variant": graph_name}, "FEAPathDataSource", section_number, point_number]
-        return self.connection.send_and_receive(method, params)
+        return self._get_cached_graph("fea", graph_name, section_number, point_number)
 
     def get_magnetic_3d_graph(self, graph_name, section_number):
         """Get graph points from a Motor-CAD Magnetic 3d graph.
@@ -422,8 +642,266 @@ class _RpcMethodsGraphs:
         Magnetic3dGraph
             Class containing x, y and data as lists
         """
+        return self._get_cached_graph("magnetic_3d", graph_name, section_number, -1)
+
+    def _get_graph_from_source(self, source, graph_name, section_number, point_number):
+        """Get graph points from Motor-CAD, without using the graph cache."""
+        if source == "magnetic_3d":
+            self.connection.ensure_version_at_least("2025.0")
+            method = "GetMagnetic3DGraph"
+            params = [{"variant": graph_name}, section_number]
+            graph_3d_dict = self.connection.send_and_receive(method, params)
+            return Magnetic3dGraph(**graph_3d_dict)
+
+        if not self.connection.check_version_at_least("2025.0"):
+            if source in _GRAPH_POINT_METHODS:
+                return self._get_graph(_GRAPH_POINT_METHODS[source], graph_name)
+            self.connection.ensure_version_at_least("2025.0")
+
+        return self.connection.send_and_receive(
+            *_generic_graph_call(source, graph_name, section_number, point_number)
+        )
+
+    def set_graph_cache(self, enabled):
+        """Store graphs so that repeated requests for a graph don't need to call Motor-CAD.
+
+        Stored graphs are cleared when a calculation is run or a file is loaded using this
+        MotorCAD object, which is any method starting with ``do_``, ``calculate_`` or
+        ``load_``. Graphs are not cleared if results are changed in any other way, for example
+        from the Motor-CAD UI or another script.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether to store graphs. If False, stored graphs are cleared.
+        """
+        self._graph_cache = {} if enabled else None
+        self._graph_cache_generation = self.connection.calculation_generation
+
+    def _get_current_graph_cache(self):
+        """Get the graph cache, clearing it if results have changed since graphs were stored."""
+        if self._graph_cache_generation != self.connection.calculation_generation:
+            self._graph_cache.clear()
+            self._graph_cache_generation = self.connection.calculation_generation
+        return self._graph_cache
+
+    def _get_cached_graph(self, source, graph_name, section_number, point_number):
+        """Get graph points, using the graph cache if enabled."""
+        if self._graph_cache is None:
+            return self._get_graph_from_source(source, graph_name, section_number, point_number)
+
+        graph_cache = self._get_current_graph_cache()
+        key = (source, graph_name, section_number, point_number)
+        if key not in graph_cache:
+            graph = self._get_graph_from_source(*key)
+            if graph is None:
+                # Failed, with exceptions disabled
+                return graph
+            graph_cache[key] = graph
+        # Return a copy, so that the stored graph isn't changed by the caller
+        return deepcopy(graph_cache[key])
+
+    def get_graphs(self, graphs):
+        """Get graph points from several Motor-CAD graphs in one request.
+
+        With Motor-CAD versions that don't support getting several graphs at once, the graphs
+        are requested in a batch request, or one at a time for versions before 2025.0.
+
+        Requires NumPy.
+
+        Parameters
+        ----------
+        graphs : list of tuple
+            Graphs to get, as ``(source, graph_name, section_number, point_number)`` tuples.
+            Options for source are ``"magnetic"``, ``"temperature"`` (transient temperature),
+            ``"power"`` (transient power loss), ``"heatflow"`` and ``"fea"`` (FEA path).
+            Section and point numbers are only used for FEA graphs and can be omitted for other
+            graphs, for example ``("magnetic", "TorqueVW")``.
+
+        Returns
+        -------
+        dict
+            Graph points, where the key is the graph tuple and the value is an
+            ``(x_values, y_values)`` tuple of NumPy arrays. If exceptions are disabled, the
+            value is None for graphs that failed.
+        """
+        if not _HAS_NUMPY:
+            raise ImportError("Failed to get graphs. Please ensure numpy is installed")
+
+        graph_requests = []
+        for graph in graphs:
+            source = graph[0]
+            if source not in GRAPH_DATA_SOURCES:
+                raise ValueError(
+                    "Graph source must be one of: " + ", ".join(GRAPH_DATA_SOURCES) + "."
+                )
+            if source == "fea":
+                if len(graph) < 3:
+                    raise ValueError("Section number must be given for FEA graphs.")
+                default_point_number = 0
+            else:
+                default_point_number = -1
+            section_number = graph[2] if len(graph) > 2 else -1
+            point_number = graph[3] if len(graph) > 3 else default_point_number
+            graph_requests.append((source, graph[1], section_number, point_number))
+
+        if self._graph_cache is None:
+            missing_requests = graph_requests
+        else:
+            graph_cache = self._get_current_graph_cache()
+            missing_requests = list(
+                dict.fromkeys(
+                    graph_request
+                    for graph_request in graph_requests
+                    if graph_request not in graph_cache
+                )
+            )
+
+        if not missing_requests:
+            missing_graph_points = []
+        elif self.connection.check_if_feature_exists("get_generic_graphs"):
+            method = "GetGenericGraphs"
+            params = [
+                [
+                    [{"variant": graph_name}, GRAPH_DATA_SOURCES[source], section_number, point]
+                    for source, graph_name, section_number, point in missing_requests
+                ]
+            ]
+            missing_graph_points = self.connection.send_and_receive(method, params)
+            if missing_graph_points is None:
+                # Failed, with exceptions disabled
+                missing_graph_points = [None] * len(missing_requests)
+        elif self.connection.check_version_at_least("2025.0"):
+            calls = [_generic_graph_call(*graph_request) for graph_request in missing_requests]
+            missing_graph_points = self.connection.send_and_receive_batch(calls)
+        else:
+            # Graphs are read one point at a time, so only turn off messages once
+            with self._message_display_suppressed():
+                missing_graph_points = [
+                    self._get_graph_from_source(*graph_request)
+                    for graph_request in missing_requests
+                ]
+
+        if self._graph_cache is None:
+            graph_points = missing_graph_points
+        else:
+            graph_cache.update(
+                (graph_request, points)
+                for graph_request, points in zip(missing_requests, missing_graph_points)
+                if points is not None
+            )
+            graph_points = [graph_cache.get(graph_request) for graph_request in graph_requests]
+
+        return dict(
+            (
+                tuple(graph),
+                None
+                if points is None
+                else (np.asarray(points[0], dtype=float), np.asarray(points[1], dtype=float)),
+            )
+            for graph, points in zip(graphs, graph_points)
+        )
+
+    def get_force_orders(
+        self,
+        graph_name="Fr_Density_Stator",
+        max_space_order=None,
+        electrical_cycles=None,
+    ):
+        """Get 2D FFT force harmonics for all operating points and slices.
+
+        Gets the ``<graph_name>_FFT_Amplitude_OL_Th<n>`` and ``<graph_name>_FFT_Angle_OL_Th<n>``
+        magnetic 3D graphs for each operating point and slice. If the Motor-CAD RPC server
+        accepts batch requests, all graphs are requested at once. Run
+        ``do_multi_force_calculation`` first.
+
+        Amplitudes are for positive time orders only, so are doubled for time orders above zero.
+
+        Requires Motor-CAD 2025.0 or later and NumPy.
+
+        Parameters
+        ----------
+        graph_name : str, default: "Fr_Density_Stator"
+            Start of the force graph name, for example ``"Fr_Density_Stator"`` for the radial
+            force density on the stator.
+        max_space_order : int, default: None
+            Maximum space order of the results. Results at indices from ``max_space_order``
+            upwards are for negative space orders. If None, the value of
+            ``"ForceMaxOrder_Space_Stator_OL"`` is used.
+        electrical_cycles : int, default: None
+            Number of electrical cycles in the force calculation. If None, the value of
+            ``"TorqueNumberCycles"`` is used. For induction motors, use the value of
+            ``"IMSingleLoadNumberCycles_Rotating"``.
+
+        Returns
+        -------
+        ForceOrders
+            Space and time orders, and amplitudes and angles with shape
+            (operating point, slice, space order, time order).
+        """
+        if not _HAS_NUMPY:
+            raise ImportError("Failed to get force orders. Please ensure numpy is installed")
         self.connection.ensure_version_at_least("2025.0")
-        method = "GetMagnetic3DGraph"
-        params = [{"variant": graph_name}, section_number]
-        graph_3d_dict = self.connection.send_and_receive(method, params)
-        return Magnetic3dGraph(**graph_3d_dict)
+
+        if max_space_order is None:
+            max_space_order = self.get_variable("ForceMaxOrder_Space_Stator_OL")
+        if electrical_cycles is None:
+            electrical_cycles = self.get_variable("TorqueNumberCycles")
+        number_of_operating_points = self.get_variable("NumLoadPoints")
+        if self.get_variable("SkewType") == 2:
+            # Stepped skew
+            number_of_slices = self.get_variable("RotorSkewSlices")
+        else:
+            number_of_slices = 1
+
+        calls = []
+        for operating_point in range(number_of_operating_points):
+            for slice_number in range(1, number_of_slices + 1):
+                for result_type in ["Amplitude", "Angle"]:
+                    force_graph_name = "{}_FFT_{}_OL_Th{}".format(
+                        graph_name, result_type, operating_point + 1
+                    )
+                    calls.append(
+                        ("GetMagnetic3DGraph", [{"variant": force_graph_name}, slice_number])
+                    )
+        graphs = self.connection.send_and_receive_batch(
+            calls, success_var=False, return_errors=True
+        )
+        for (_, (force_graph, slice_number)), graph in zip(calls, graphs):
+            # Graphs that failed are None if exceptions are disabled
+            if graph is None or isinstance(graph, MotorCADError):
+                raise MotorCADError(
+                    "Failed to get force graph "
+                    + force_graph["variant"]
+                    + " for slice "
+                    + str(slice_number)
+                    + (": " + str(graph) if graph is not None else "")
+                )
+
+        data = np.array([np.asarray(graph["data"], dtype=float) for graph in graphs])
+        number_of_space_orders, number_of_time_orders = data.shape[1:]
+        data = data.reshape(
+            (
+                number_of_operating_points,
+                number_of_slices,
+                2,
+                number_of_space_orders,
+                number_of_time_orders,
+            )
+        )
+        amplitude = data[:, :, 0]
+        angle = data[:, :, 1]
+
+        # Apply 2x factor due to FFT symmetry, unless on the 0th time order (mean).
+        # This is equivalent to showing results with 'Positive time only'
+        amplitude[..., 1:] *= 2
+
+        # Results are stored with negative space orders at the end
+        space_orders = np.arange(number_of_space_orders)
+        space_orders = np.where(
+            space_orders >= max_space_order, space_orders - 2 * max_space_order, space_orders
+        )
+        # Scale between internal orders and electrical orders
+        time_orders = np.arange(number_of_time_orders) / electrical_cycles
+
+        return ForceOrders(space_orders, time_orders, amplitude, angle)
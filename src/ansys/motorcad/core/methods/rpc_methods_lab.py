@@ -32,38 +32,85 @@ k_custom_loss_name_external_lab = "CustomLoss_Name_External_Lab"
 k_custom_loss_power_function_external_lab = "CustomLoss_PowerFunction_External_Lab"
 k_custom_loss_voltage_function_external_lab = "CustomLoss_VoltageFunction_External_Lab"
 
+# Array variable for each custom loss property
+_internal_custom_loss_arrays = {
+    "name": k_custom_loss_name_internal_lab,
+    "function": k_custom_loss_function_internal_lab,
+    "type": k_custom_loss_type_internal_lab,
+    "thermal_node": k_custom_loss_thermal_node_internal_lab,
+}
+_external_custom_loss_arrays = {
+    "name": k_custom_loss_name_external_lab,
+    "power_function": k_custom_loss_power_function_external_lab,
+    "voltage_function": k_custom_loss_voltage_function_external_lab,
+}
+
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+import queue
+import shutil
+import tempfile
 
 from openpyxl import Workbook
 
 try:
     import numpy as np
-    from scipy.io import loadmat
+    import scipy.io  # noqa: F401
 
     Num_Sci_py_AVAILABLE = True
 except ImportError:
     Num_Sci_py_AVAILABLE = False
 
+from ansys.motorcad.core.lab_results import LabResults
+from ansys.motorcad.core.rpc_client_core import MotorCADError
+
+# Lab results used by export_concept_ev_model
+_CONCEPT_EV_LAB_VARIABLES = [
+    "Speed",
+    "Shaft_Torque",
+    "Stator_Current_Line_RMS",
+    "Total_Loss",
+    "Power_Factor",
+    "varStr",
+    "varUnits",
+]
+
 
 def _write_excel(data, sheets, DC_voltage_list, i, wb, reset_speeds):
-    i_len, j_len = data["Speed"].shape
+    """Add a sheet for each Lab result to a write-only workbook, writing a row at a time."""
     for sheet in sheets:
-        ws = wb.create_sheet("Newsheet")
-        ws.title = "Voltages"
         if len(DC_voltage_list) > 1:
-            ws.title = sheet + str(i + 1)
+            ws = wb.create_sheet(sheet + str(i + 1))
         else:
-            ws.title = sheet
-        for jj, col in enumerate(ws.iter_cols(min_col=0, max_col=j_len, max_row=i_len)):
-            for ii, cell in enumerate(col):
-                if reset_speeds and sheet == "Speed" and data[sheet][ii][jj] == 1:
-                    # Special case for induction motor, where we want to
-                    # change speed from 1 RPM to 0 RPM
-                    ws[cell.coordinate] = 0
-                else:
-                    ws[cell.coordinate] = data[sheet][ii][jj]
+            ws = wb.create_sheet(sheet)
+        values = data[sheet]
+        if reset_speeds and sheet == "Speed":
+            # Special case for induction motor, where we want to
+            # change speed from 1 RPM to 0 RPM
+            values = np.where(values == 1, 0, values)
+        for row in values.tolist():
+            ws.append(row)
     return wb
 
 
+def _get_index_from_name(name, custom_losses):
+    """Retrieve index of a specified name within a custom loss table.
+
+    Parameters
+    ----------
+    name : str
+        Specified name to find
+    custom_losses : list of dict
+        Custom losses to search
+
+    """
+    for index, custom_loss in enumerate(custom_losses):
+        if name == custom_loss["name"]:
+            return index
+    raise NameError("Provided name is not listed")
+
+
 class _RpcMethodsLab:
     def __init__(self, mc_connection):
         self.connection = mc_connection
@@ -163,7 +210,11 @@ class _RpcMethodsLab:
         return self.connection.send_and_receive(method)
 
     def calculate_magnetic_lab(self):
-        """Run the Lab magnetic calculation."""
+        """Run the Lab magnetic calculation.
+
+        Lab results are saved to files in the Lab results folder, so this calculation doesn't
+        use the result cache set with ``set_result_cache``.
+        """
         method = "CalculateMagnetic_Lab"
         return self.connection.send_and_receive(method)
 
@@ -177,6 +228,147 @@ class _RpcMethodsLab:
         method = "CalculateDutyCycle_Lab"
         return self.connection.send_and_receive(method)
 
+    def get_internal_custom_losses(self):
+        """Get all internal custom losses.
+
+        Returns
+        -------
+        list of dict
+            Each custom loss, with keys ``"name"``, ``"function"``, ``"type"`` and
+            ``"thermal_node"``.
+        """
+        return self._get_custom_losses(
+            k_num_custom_losses_internal_lab, _internal_custom_loss_arrays
+        )
+
+    def set_internal_custom_losses(self, custom_losses):
+        """Replace all internal custom losses.
+
+        Custom losses can be read with ``get_internal_custom_losses``, edited, and written back
+        in a single update.
+
+        Parameters
+        ----------
+        custom_losses : list of dict
+            Each custom loss, with keys ``"name"``, ``"function"``, ``"type"`` and
+            ``"thermal_node"``. Options for type are ``Electrical`` or ``Mechanical``.
+        """
+        custom_losses = [dict(custom_loss) for custom_loss in custom_losses]
+        for custom_loss in custom_losses:
+            # Internal Custom Loss Type is case-sensitive in MotorCAD.
+            custom_loss["type"] = custom_loss["type"].capitalize()
+            if custom_loss["type"] not in ["Electrical", "Mechanical"]:
+                raise ValueError("Thermal Loss Type must be Electrical or Mechanical")
+
+        thermal_nodes = sorted(set(custom_loss["thermal_node"] for custom_loss in custom_losses))
+        nodes_exist = self.connection.send_and_receive_batch(
+            [("GetNodeExists", [thermal_node]) for thermal_node in thermal_nodes],
+            success_var=False,
+            return_errors=True,
+        )
+        for node_exists in nodes_exist:
+            if isinstance(node_exists, MotorCADError):
+                if "Range check error" not in str(node_exists):
+                    raise node_exists
+                node_exists = False
+            if not node_exists:
+                raise ValueError("Thermal node does not exist")
+
+        self._set_custom_losses(
+            k_num_custom_losses_internal_lab, _internal_custom_loss_arrays, custom_losses
+        )
+
+    def get_external_custom_losses(self):
+        """Get all external custom losses.
+
+        Returns
+        -------
+        list of dict
+            Each custom loss, with keys ``"name"``, ``"power_function"`` and
+            ``"voltage_function"``.
+        """
+        return self._get_custom_losses(
+            k_num_custom_losses_external_lab, _external_custom_loss_arrays
+        )
+
+    def set_external_custom_losses(self, custom_losses):
+        """Replace all external custom losses.
+
+        Custom losses can be read with ``get_external_custom_losses``, edited, and written back
+        in a single update.
+
+        Parameters
+        ----------
+        custom_losses : list of dict
+            Each custom loss, with keys ``"name"``, ``"power_function"`` and
+            ``"voltage_function"``.
+        """
+        self._set_custom_losses(
+            k_num_custom_losses_external_lab, _external_custom_loss_arrays, custom_losses
+        )
+
+    def _get_custom_losses(self, var_length_array, custom_loss_arrays):
+        """Read a custom loss table with one batch of requests.
+
+        Parameters
+        ----------
+        var_length_array : str
+            Variable which specifies the number of custom losses
+        custom_loss_arrays : dict
+            Array variable for each custom loss property
+
+        Returns
+        -------
+        list of dict
+        """
+        array_length = self.get_variable(var_length_array)
+        calls = [
+            ("GetArrayVariable", [array_name, index])
+            for index in range(array_length)
+            for array_name in custom_loss_arrays.values()
+        ]
+        values = self.connection.send_and_receive_batch(calls, success_var=False)
+        number_of_properties = len(custom_loss_arrays)
+        return [
+            dict(zip(custom_loss_arrays, values[start : start + number_of_properties]))
+            for start in range(0, len(values), number_of_properties)
+        ]
+
+    def _set_custom_losses(self, var_length_array, custom_loss_arrays, custom_losses, start=0):
+        """Write a custom loss table with one batch of requests.
+
+        Parameters
+        ----------
+        var_length_array : str
+            Variable which specifies the number of custom losses
+        custom_loss_arrays : dict
+            Array variable for each custom loss property
+        custom_losses : list of dict
+            Custom losses to write
+        start : int, default: 0
+            Index of the first custom loss to write. Custom losses before this are unchanged.
+        """
+        for custom_loss in custom_losses[start:]:
+            if set(custom_loss) != set(custom_loss_arrays):
+                raise ValueError(
+                    "Custom losses must have the keys: " + ", ".join(custom_loss_arrays) + "."
+                )
+
+        array_length = self.get_variable(var_length_array)
+        # Arrays are resized when the length changes, so only shrink them after moving losses
+        if len(custom_losses) > array_length:
+            self.set_variable(var_length_array, len(custom_losses))
+
+        calls = [
+            ("SetArrayVariable", [array_name, index, {"variant": custom_losses[index][key]}])
+            for index in range(start, len(custom_losses))
+            for key, array_name in custom_loss_arrays.items()
+        ]
+        self.connection.send_and_receive_batch(calls)
+
+        if len(custom_losses) < array_length:
+            self.set_variable(var_length_array, len(custom_losses))
+
     def add_internal_custom_loss(self, name, function, type, thermal_node):
         """Add an internal custom loss.
 
@@ -201,14 +393,14 @@ class _RpcMethodsLab:
             raise ValueError("Thermal node does not exist")
         else:
             no_internal_losses = self.get_variable(k_num_custom_losses_internal_lab)
-            self.set_variable(k_num_custom_losses_internal_lab, no_internal_losses + 1)
-            self.set_array_variable(k_custom_loss_name_internal_lab, no_internal_losses, name)
-            self.set_array_variable(
-                k_custom_loss_function_internal_lab, no_internal_losses, function
-            )
-            self.set_array_variable(k_custom_loss_type_internal_lab, no_internal_losses, type)
-            self.set_array_variable(
-                k_custom_loss_thermal_node_internal_lab, no_internal_losses, thermal_node
+            custom_losses = [None] * no_internal_losses + [
+                {"name": name, "function": function, "type": type, "thermal_node": thermal_node}
+            ]
+            self._set_custom_losses(
+                k_num_custom_losses_internal_lab,
+                _internal_custom_loss_arrays,
+                custom_losses,
+                start=no_internal_losses,
             )
 
     def add_external_custom_loss(self, name, power_function, voltage_function):
@@ -225,13 +417,14 @@ class _RpcMethodsLab:
 
         """
         no_external_losses = self.get_variable(k_num_custom_losses_external_lab)
-        self.set_variable(k_num_custom_losses_external_lab, no_external_losses + 1)
-        self.set_array_variable(k_custom_loss_name_external_lab, no_external_losses, name)
-        self.set_array_variable(
-            k_custom_loss_power_function_external_lab, no_external_losses, power_function
-        )
-        self.set_array_variable(
-            k_custom_loss_voltage_function_external_lab, no_external_losses, voltage_function
+        custom_losses = [None] * no_external_losses + [
+            {"name": name, "power_function": power_function, "voltage_function": voltage_function}
+        ]
+        self._set_custom_losses(
+            k_num_custom_losses_external_lab,
+            _external_custom_loss_arrays,
+            custom_losses,
+            start=no_external_losses,
         )
 
     def remove_internal_custom_loss(self, name):
@@ -243,18 +436,8 @@ class _RpcMethodsLab:
             Name of lab internal custom loss
 
         """
-        index = self._get_index_from_name(
-            name, k_num_custom_losses_internal_lab, k_custom_loss_name_internal_lab
-        )
-        self._motorcad_array_pop(
-            index,
-            k_num_custom_losses_internal_lab,
-            [
-                k_custom_loss_name_internal_lab,
-                k_custom_loss_function_internal_lab,
-                k_custom_loss_type_internal_lab,
-                k_custom_loss_thermal_node_internal_lab,
-            ],
+        self._remove_custom_loss(
+            name, k_num_custom_losses_internal_lab, _internal_custom_loss_arrays
         )
 
     def remove_external_custom_loss(self, name):
@@ -266,63 +449,27 @@ class _RpcMethodsLab:
             Name of lab external custom loss
 
         """
-        index = self._get_index_from_name(
-            name, k_num_custom_losses_external_lab, k_custom_loss_name_external_lab
-        )
-        self._motorcad_array_pop(
-            index,
-            k_num_custom_losses_external_lab,
-            [
-                k_custom_loss_name_external_lab,
-                k_custom_loss_power_function_external_lab,
-                k_custom_loss_voltage_function_external_lab,
-            ],
+        self._remove_custom_loss(
+            name, k_num_custom_losses_external_lab, _external_custom_loss_arrays
         )
 
-    def _motorcad_array_pop(self, index, var_length_array, list_of_var_names):
-        """Remove variables at a specified location within an array.
-
-        Parameters
-        ----------
-        index : int
-            Index of array to remove
-        var_length_array : str
-            Variable which specifies the length of the array
-        list_of_var_names : list
-            List of variables to pop
-
-        """
-        array_length = self.get_variable(var_length_array)
-
-        for i in range(index + 1, array_length):
-            for j in range(len(list_of_var_names)):
-                self.set_array_variable(
-                    list_of_var_names[j], i - 1, self.get_array_variable(list_of_var_names[j], i)
-                )
-
-        self.set_variable(var_length_array, array_length - 1)
-
-    def _get_index_from_name(self, name, var_length_array, variable_name):
-        """Retrieve index of a specified variable name within an array.
+    def _remove_custom_loss(self, name, var_length_array, custom_loss_arrays):
+        """Remove a custom loss by name, moving the following custom losses up.
 
         Parameters
         ----------
         name : str
-            Specified name to find
+            Name of the custom loss to remove
         var_length_array : str
-            Variable which specifies the length of the array
-        variable_name : str
-            Variable that holds the list of names
+            Variable which specifies the number of custom losses
+        custom_loss_arrays : dict
+            Array variable for each custom loss property
 
         """
-        array_length = self.get_variable(var_length_array)
-        for i in range(array_length):
-            if name == self.get_array_variable(variable_name, i):
-                index = i
-                break
-        else:
-            raise NameError("Provided name is not listed")
-        return index
+        custom_losses = self._get_custom_losses(var_length_array, custom_loss_arrays)
+        index = _get_index_from_name(name, custom_losses)
+        custom_losses.pop(index)
+        self._set_custom_losses(var_length_array, custom_loss_arrays, custom_losses, start=index)
 
     def export_lab_model(self, file_path):
         """Export lab model.
@@ -406,6 +553,13 @@ class _RpcMethodsLab:
             0 Motor, 1 Generator, 2 Motor / Generator mode
         DC_voltage_list: list
             List of DC bus voltages
+        instances: int or list of MotorCAD
+            Other Motor-CAD instances to calculate the DC bus voltages in parallel with this
+            instance, or the number of new instances to open. A copy of the saved model file and
+            its results, including the built Lab model, is loaded in each of the other
+            instances, so the model must be saved before the export. This instance keeps its
+            model file. New instances are closed when the export finishes. If not given, all
+            voltages are calculated in this instance.
         """
         if not Num_Sci_py_AVAILABLE:
             raise ImportError(
@@ -419,20 +573,18 @@ class _RpcMethodsLab:
             file_path = self.get_variable("ResultsPath_MotorLAB") + "ConceptEV_elecdata.xlsx"
             # set model parameters
             _RpcMethodsLab._set_model_parameters(self, **kwargs)
-            wb = Workbook()
+            # Write-only workbook, so sheets are streamed to disk as they are written
+            wb = Workbook(write_only=True)
             # choose number of DC bus voltages (list as user input)
             if "DC_voltage_list" in kwargs:
                 DC_voltage_list = kwargs["DC_voltage_list"]
             else:
                 DC_voltage_list = [self.get_variable("DCBusVoltage")]
 
-            ws = wb.active
-            ws.title = "Voltages"
-            ws["A1"] = "Index"
-            ws["B1"] = "Voltages"
+            ws = wb.create_sheet("Voltages")
+            ws.append(["Index", "Voltages"])
             for i, DC_voltage in enumerate(DC_voltage_list):
-                ws["A" + str(i + 2)] = i + 1
-                ws["B" + str(i + 2)] = DC_voltage_list[i]
+                ws.append([i + 1, DC_voltage])
 
             # Units sheet
 
@@ -445,21 +597,21 @@ class _RpcMethodsLab:
                 "Total_Loss",
                 "Power_Factor",
             ]
-            for i, DC_voltage in enumerate(DC_voltage_list):
-                self.set_variable("DCBusVoltage", DC_voltage)
-                # run Efficiency Map calculation
-                self.calculate_magnetic_lab()
-                # read the lab data .mat file
-                data_file_path = self.get_variable("ResultsPath_MotorLAB") + "MotorLAB_elecdata.mat"
-                data = loadmat(data_file_path)
-                if (
-                    "Min_speed" in kwargs
-                    and self.get_variable("Motor_Type") == 1
-                    and kwargs["Min_speed"] == 0
-                ):
-                    wb = _write_excel(data, sheets, DC_voltage_list, i, wb, True)
-                else:
-                    wb = _write_excel(data, sheets, DC_voltage_list, i, wb, False)
+            reset_speeds = (
+                "Min_speed" in kwargs
+                and self.get_variable("Motor_Type") == 1
+                and kwargs["Min_speed"] == 0
+            )
+            if "instances" in kwargs:
+                voltage_results = self._calculate_lab_voltages_parallel(
+                    DC_voltage_list, kwargs["instances"], kwargs
+                )
+            else:
+                voltage_results = (
+                    self._calculate_lab_voltage(DC_voltage) for DC_voltage in DC_voltage_list
+                )
+            for i, data in enumerate(voltage_results):
+                wb = _write_excel(data, sheets, DC_voltage_list, i, wb, reset_speeds)
 
             units = [
                 "Power_Factor",
@@ -468,16 +620,105 @@ class _RpcMethodsLab:
                 "Shaft_Torque",
                 "Speed",
             ]
-            ws = wb.create_sheet("Newsheet")
-            ws.title = "Units"
-            for i, unit in enumerate(units):
-                ws["A" + str(i + 1)] = unit
+            ws = wb.create_sheet("Units")
+            for unit in units:
                 index = np.where(np.strings.find(data["varStr"], unit) == 0)[0]
-                ws["B" + str(i + 1)] = data["varUnits"][index][0]
+                ws.append([unit, data["varUnits"][index][0]])
             wb.save(file_path)
         finally:
             self.set_variable("MessageDisplayState", save_message_display_state)
 
+    def _calculate_lab_voltage(self, DC_voltage):
+        """Run the Lab efficiency map calculation for a DC bus voltage.
+
+        Returns
+        -------
+        dict
+            Lab results, read from the MotorLAB_elecdata.mat file.
+        """
+        self.set_variable("DCBusVoltage", DC_voltage)
+        # run Efficiency Map calculation
+        self.calculate_magnetic_lab()
+        # read the lab data .mat file
+        data_file_path = self.get_variable("ResultsPath_MotorLAB") + "MotorLAB_elecdata.mat"
+        return LabResults(data_file_path).get_variables(_CONCEPT_EV_LAB_VARIABLES)
+
+    def _calculate_lab_voltages_parallel(self, DC_voltage_list, instances, model_parameters):
+        """Run the Lab efficiency map calculation for each DC bus voltage in parallel.
+
+        The saved model file and its results folder, which contains the built Lab model, are
+        copied for each of the other instances. This instance and the other instances each take
+        the next voltage from a shared queue.
+
+        Returns
+        -------
+        list of dict
+            Lab results for each voltage, read from the MotorLAB_elecdata.mat file.
+        """
+        mot_file = self.get_file_name()
+        if mot_file is None:
+            raise MotorCADError(
+                "Save the model to a file before exporting DC bus voltages in parallel."
+            )
+        results_folder = os.path.splitext(mot_file)[0]
+
+        owns_instances = isinstance(instances, int)
+        if owns_instances:
+            instances = [type(self)() for _ in range(instances)]
+
+        voltage_indices = queue.Queue()
+        for index in range(len(DC_voltage_list)):
+            voltage_indices.put(index)
+        voltage_results = [None] * len(DC_voltage_list)
+
+        def calculate_voltages(mc):
+            while True:
+                try:
+                    index = voltage_indices.get_nowait()
+                except queue.Empty:
+                    return
+                voltage_results[index] = mc._calculate_lab_voltage(DC_voltage_list[index])
+
+        def load_and_calculate_voltages(mc, model_file):
+            save_message_display_state = mc.get_variable("MessageDisplayState")
+            try:
+                mc.set_variable("MessageDisplayState", 2)
+                mc.load_from_file(model_file)
+                mc.set_motorlab_context()
+                _RpcMethodsLab._set_model_parameters(mc, **model_parameters)
+                mc.set_variable("EmagneticCalcType_Lab", 1)
+                calculate_voltages(mc)
+            finally:
+                mc.set_variable("MessageDisplayState", save_message_display_state)
+
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as copies_folder:
+            # Copy the saved model and its results for each of the other instances, so that
+            # this instance keeps its model file
+            model_files = []
+            for instance_number in range(len(instances)):
+                instance_folder = os.path.join(copies_folder, "instance_" + str(instance_number))
+                os.makedirs(instance_folder)
+                model_file = os.path.join(instance_folder, os.path.basename(mot_file))
+                shutil.copy2(mot_file, model_file)
+                if os.path.isdir(results_folder):
+                    shutil.copytree(results_folder, os.path.splitext(model_file)[0])
+                model_files.append(model_file)
+
+            try:
+                with ThreadPoolExecutor(max_workers=len(instances) + 1) as executor:
+                    futures = [executor.submit(calculate_voltages, self)] + [
+                        executor.submit(load_and_calculate_voltages, mc, model_file)
+                        for mc, model_file in zip(instances, model_files)
+                    ]
+                    for future in futures:
+                        future.result()
+            finally:
+                if owns_instances:
+                    for mc in instances:
+                        mc.quit()
+
+        return voltage_results
+
     def export_lab_thermal_model(self, file_path):
         """Export a built lab thermal model.
 
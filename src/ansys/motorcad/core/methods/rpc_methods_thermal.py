@@ -21,12 +21,87 @@
 # SOFTWARE.
 
 """RPC methods for Motor-CAD Thermal."""
+from dataclasses import dataclass
+from glob import glob
+from os import path
+import tempfile
+
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+try:
+    from scipy import sparse
+
+    _HAS_SCIPY = True
+except ImportError:
+    _HAS_SCIPY = False
+
 from ansys.motorcad.core.rpc_client_core import MotorCADError
 
+# Limit on thermal node numbers, in case Motor-CAD doesn't return an error for node numbers
+# outside the thermal network
+_MAX_NODE_NUMBER = 1000000
+
+# Resistances at or above this value, in K/W, are treated as no connection between nodes
+_MAX_CONNECTED_RESISTANCE = 1e9
+
+
+@dataclass
+class ThermalNetwork:
+    """Class for the lumped parameter thermal network of a model.
+
+    Values are indexed by position in ``node_numbers``, not by node number. Use ``get_index()``
+    to find the position of a node. For models with slices or cuboids, the node numbers include
+    the offset node numbers from ``get_offset_node_number``.
+
+    Attributes
+    ----------
+    node_numbers : numpy.ndarray
+        Numbers of the thermal nodes.
+    capacitances : numpy.ndarray
+        Capacitance of each node, in J/K.
+    powers : numpy.ndarray
+        Power of each node, in W.
+    fixed_temperatures : numpy.ndarray
+        Fixed temperature of each node, in degrees C. NaN for nodes without a fixed temperature.
+    conductance : scipy.sparse.csr_matrix
+        Thermal conductance between each pair of nodes, in W/K. Symmetric, with a zero diagonal.
+    """
+
+    node_numbers: "np.ndarray"
+    capacitances: "np.ndarray"
+    powers: "np.ndarray"
+    fixed_temperatures: "np.ndarray"
+    conductance: "sparse.csr_matrix"
+
+    def get_index(self, node_number):
+        """Get the position of a node in the network arrays.
+
+        Parameters
+        ----------
+        node_number : int
+            Number of the thermal node.
+
+        Returns
+        -------
+        int
+        """
+        indices = np.flatnonzero(self.node_numbers == node_number)
+        if len(indices) == 0:
+            raise ValueError("Node not in thermal network: " + str(node_number))
+        return indices[0]
+
 
 class _RpcMethodsThermal:
     def __init__(self, mc_connection):
         self.connection = mc_connection
+        # Model generation and components of the external circuit last sent with
+        # set_external_circuit or cleared
+        self._external_circuit_state = None
 
     def set_resistance_value(self, name, node1, node2, value, description):
         """Set or create a resistance."""
@@ -43,7 +118,43 @@ class _RpcMethodsThermal:
     def clear_external_circuit(self):
         """Clear the external circuit."""
         method = "ClearExternalCircuit"
-        return self.connection.send_and_receive(method)
+        result = self.connection.send_and_receive(method)
+        self._external_circuit_state = (self.connection.model_generation, {})
+        return result
+
+    def set_external_circuit(self, circuit, full_update=False):
+        """Replace the external circuit with a circuit built on the client.
+
+        Only changes since the circuit was last set on this Motor-CAD instance are sent, unless
+        a model or circuit file has been loaded since. All changes are sent in a few batched
+        requests. Changes made to the external circuit with
+        other methods, such as ``set_resistance_value``, aren't included in the comparison,
+        so use ``full_update`` after making such changes.
+
+        Parameters
+        ----------
+        circuit : ansys.motorcad.core.external_circuit.ExternalCircuit
+            External circuit.
+        full_update : bool, default: False
+            Whether to clear the external circuit and send the whole circuit, instead of only
+            the changes.
+        """
+        removals = None
+        # The previous circuit is unknown if a model or circuit file has been loaded since
+        if (self._external_circuit_state is not None) and not full_update:
+            model_generation, previous_components = self._external_circuit_state
+            if model_generation == self.connection.model_generation:
+                removals, nodes, components = circuit._get_update(previous_components)
+        if removals is None:
+            self.clear_external_circuit()
+            removals, nodes, components = circuit._get_update({})
+
+        # Nodes must exist before components can be connected to them
+        self._external_circuit_state = None
+        for calls in [removals, nodes, components]:
+            if calls:
+                self.connection.send_and_receive_batch(calls)
+        self._external_circuit_state = (self.connection.model_generation, dict(circuit._components))
 
     def create_new_node(self, name, node1, row, column, colour, description):
         """Create a node."""
@@ -86,6 +197,8 @@ class _RpcMethodsThermal:
 
         Text file separator defined using the
         ``"ExportTextSeparator"`` parameter (default is semicolon).
+        The file can be read with
+        ``ansys.motorcad.core.transient_results.read_transient_results``.
         """
         method = "SaveTransientPowerValues"
         params = [file_name]
@@ -96,6 +209,8 @@ class _RpcMethodsThermal:
 
         Text file separator defined using the
         ``"ExportTextSeparator"`` parameter (default is semicolon).
+        The file can be read with
+        ``ansys.motorcad.core.transient_results.read_transient_results``.
         """
         method = "SaveTransientTemperatures"
         params = [file_name]
@@ -169,6 +284,297 @@ class _RpcMethodsThermal:
         params = [node_number]
         return self.connection.send_and_receive(method, params)
 
+    def get_node_numbers(self):
+        """Get the numbers of all thermal nodes.
+
+        Node numbers are checked in batches that double in size, until a node number is outside
+        the thermal network. For models with axial slices or cuboids, the offset node numbers
+        from ``get_offset_node_number`` are also checked, because these can be outside the
+        range of the other nodes.
+
+        Returns
+        -------
+        list of int
+            Numbers of the thermal nodes that exist.
+        """
+        node_numbers = []
+        start = 0
+        batch_size = 256
+        while start < _MAX_NODE_NUMBER:
+            batch_node_numbers = range(start, start + batch_size)
+            nodes_exist = self._get_nodes_exist(batch_node_numbers)
+            node_numbers.extend(
+                node_number
+                for node_number, node_exists in zip(batch_node_numbers, nodes_exist)
+                if node_exists
+            )
+            if len(nodes_exist) < batch_size:
+                return self._add_offset_node_numbers(node_numbers)
+            start += batch_size
+            batch_size = batch_size * 2
+        raise MotorCADError("Failed to find the number of thermal nodes.")
+
+    def _get_nodes_exist(self, node_numbers):
+        """Check if several nodes exist in a single batch of requests.
+
+        Returns
+        -------
+        list of bool
+            Whether each node exists, up to the first node number outside the thermal network.
+        """
+        calls = [("GetNodeExists", [int(node_number)]) for node_number in node_numbers]
+        nodes_exist = self.connection.send_and_receive_batch(
+            calls, success_var=False, return_errors=True
+        )
+        for index, node_exists in enumerate(nodes_exist):
+            if isinstance(node_exists, MotorCADError):
+                if "Range check error" in str(node_exists):
+                    return nodes_exist[:index]
+                raise node_exists
+        return nodes_exist
+
+    def _add_offset_node_numbers(self, node_numbers):
+        """Add the offset node numbers of each axial slice and cuboid to a list of nodes."""
+        try:
+            number_of_slices = 2 * self.get_variable("AxialSliceDefinition") + 1
+            number_of_cuboids = self.get_variable("NumberOfCuboids")
+        except (MotorCADError, TypeError):
+            return node_numbers
+        if number_of_slices <= 1 and number_of_cuboids <= 1:
+            return node_numbers
+
+        # Motor-CAD slices and cuboids use 1-based indexing
+        calls = [
+            ("GetOffsetNodeNumber", [node_number, slice_number, cuboid_number])
+            for node_number in node_numbers
+            for slice_number in range(1, number_of_slices + 1)
+            for cuboid_number in range(1, number_of_cuboids + 1)
+        ]
+        offset_node_numbers = self.connection.send_and_receive_batch(
+            calls, success_var=False, return_errors=True
+        )
+        new_node_numbers = sorted(
+            set(
+                int(node_number)
+                for node_number in offset_node_numbers
+                if not isinstance(node_number, MotorCADError)
+            )
+            - set(node_numbers)
+        )
+        if len(new_node_numbers) == 0:
+            return node_numbers
+
+        # New node numbers are sorted, so all nodes after a node outside the network are also
+        # outside the network
+        nodes_exist = self._get_nodes_exist(new_node_numbers)
+        return sorted(
+            node_numbers
+            + [
+                node_number
+                for node_number, node_exists in zip(new_node_numbers, nodes_exist)
+                if node_exists
+            ]
+        )
+
+    def _get_node_values(self, method, node_numbers, description):
+        """Get a value for each thermal node in a single batch of requests."""
+        if not _HAS_NUMPY:
+            raise ImportError(
+                "Failed to get node " + description + ". Please ensure numpy is installed"
+            )
+        if node_numbers is None:
+            node_numbers = self.get_node_numbers()
+        calls = [(method, [int(node_number)]) for node_number in node_numbers]
+        values = self.connection.send_and_receive_batch(calls, success_var=False)
+        return np.array(values, dtype=float)
+
+    def get_node_temperatures(self, node_numbers=None):
+        """Get the temperatures of several thermal nodes.
+
+        Requires NumPy.
+
+        Parameters
+        ----------
+        node_numbers : list of int, default: None
+            Numbers of the thermal nodes. If None, all nodes from ``get_node_numbers`` are used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Temperature of each thermal node.
+        """
+        return self._get_node_values("GetNodeTemperature", node_numbers, "temperatures")
+
+    def get_node_capacitances(self, node_numbers=None):
+        """Get the capacitances of several thermal nodes.
+
+        Requires NumPy.
+
+        Parameters
+        ----------
+        node_numbers : list of int, default: None
+            Numbers of the thermal nodes. If None, all nodes from ``get_node_numbers`` are used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Capacitance of each thermal node.
+        """
+        return self._get_node_values("GetNodeCapacitance", node_numbers, "capacitances")
+
+    def get_node_powers(self, node_numbers=None):
+        """Get the powers of several thermal nodes.
+
+        Requires NumPy.
+
+        Parameters
+        ----------
+        node_numbers : list of int, default: None
+            Numbers of the thermal nodes. If None, all nodes from ``get_node_numbers`` are used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Power of each thermal node.
+        """
+        return self._get_node_values("GetNodePower", node_numbers, "powers")
+
+    def get_node_to_node_resistances(self, node_pairs):
+        """Get the resistances between several pairs of thermal nodes.
+
+        Requires NumPy.
+
+        Parameters
+        ----------
+        node_pairs : list of tuple
+            ``(node1, node2)`` pairs of thermal node numbers.
+
+        Returns
+        -------
+        numpy.ndarray
+            Resistance between each pair of thermal nodes.
+        """
+        if not _HAS_NUMPY:
+            raise ImportError(
+                "Failed to get node to node resistances. Please ensure numpy is installed"
+            )
+        calls = [
+            ("GetNodeToNodeResistance", [int(node1), int(node2)]) for node1, node2 in node_pairs
+        ]
+        values = self.connection.send_and_receive_batch(calls, success_var=False)
+        return np.array(values, dtype=float)
+
+    def get_thermal_network(self):
+        """Get the lumped parameter thermal network of the model.
+
+        If the Motor-CAD instance can't return the whole network, the resistances are read from
+        the matrices exported by ``export_matrices``. In this case, only the ambient node
+        (node 0) has a fixed temperature, because fixed temperatures can't be read from
+        Motor-CAD.
+
+        Results are from the last thermal calculation.
+
+        Requires NumPy and SciPy.
+
+        Returns
+        -------
+        ThermalNetwork
+        """
+        if not (_HAS_NUMPY and _HAS_SCIPY):
+            raise ImportError(
+                "Failed to get thermal network. Please ensure numpy and scipy are installed"
+            )
+
+        if self.connection.check_if_feature_exists("get_thermal_network"):
+            method = "GetThermalNetwork"
+            network = self.connection.send_and_receive(method, success_var=False)
+            node_numbers = np.array(network["NodeNumbers"], dtype=int)
+            capacitances = np.array(network["Capacitances"], dtype=float)
+            powers = np.array(network["Powers"], dtype=float)
+            fixed_temperatures = np.array(network["FixedTemperatures"], dtype=float)
+            resistances = np.array(network["Resistances"], dtype=float).reshape(-1, 3)
+            # Resistances are listed once for each connected pair, as (node1, node2, resistance)
+            order = np.argsort(node_numbers)
+            node_indices = order[
+                np.searchsorted(node_numbers, resistances[:, :2].astype(int), sorter=order)
+            ]
+            rows, columns = node_indices.T
+            resistances = resistances[:, 2]
+        else:
+            node_numbers, resistance_matrix = self._get_exported_resistances()
+            capacitances = self.get_node_capacitances(node_numbers)
+            powers = self.get_node_powers(node_numbers)
+            fixed_temperatures = np.full(len(node_numbers), np.nan)
+            if len(node_numbers) > 0 and node_numbers[0] == 0:
+                fixed_temperatures[0] = self.get_node_temperature(0)
+
+            # Resistances between fluid nodes are only in the direction of flow
+            rows, columns = np.triu_indices(len(node_numbers), k=1)
+            resistances = np.minimum(resistance_matrix, resistance_matrix.T)[rows, columns]
+
+        not_positive = resistances <= 0
+        if not_positive.any():
+            index = np.flatnonzero(not_positive)[0]
+            raise MotorCADError(
+                "Resistance between thermal nodes "
+                + str(node_numbers[rows[index]])
+                + " and "
+                + str(node_numbers[columns[index]])
+                + " is not positive."
+            )
+        connected = resistances < _MAX_CONNECTED_RESISTANCE
+        rows = rows[connected]
+        columns = columns[connected]
+        conductances = 1 / resistances[connected]
+        conductance = sparse.coo_matrix(
+            (
+                np.concatenate([conductances, conductances]),
+                (np.concatenate([rows, columns]), np.concatenate([columns, rows])),
+            ),
+            shape=(len(node_numbers), len(node_numbers)),
+        ).tocsr()
+
+        return ThermalNetwork(node_numbers, capacitances, powers, fixed_temperatures, conductance)
+
+    def _get_exported_resistances(self):
+        """Get the node numbers and resistance matrix from the matrices exported by Motor-CAD.
+
+        Returns
+        -------
+        numpy.ndarray
+            Numbers of the thermal nodes.
+        numpy.ndarray
+            Resistance from each node to each other node.
+        """
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as directory:
+            self.export_matrices(directory)
+            node_files = glob(path.join(directory, "*.nmf"))
+            resistance_files = glob(path.join(directory, "*.rmf"))
+            if len(node_files) != 1 or len(resistance_files) != 1:
+                raise MotorCADError("Failed to export the thermal matrices.")
+
+            node_numbers = []
+            with open(node_files[0], "r") as file:
+                # Lines after the header are group names in brackets, or node numbers and names
+                for line in file.readlines()[2:]:
+                    if len(line.strip()) > 0 and line[0] != "[":
+                        node_numbers.append(int(line.split(" ", 1)[0]))
+
+            with open(resistance_files[0], "r") as file:
+                # Rows after the header start with the node name, and end with a separator
+                resistances = np.array(
+                    [
+                        [float(value) for value in line.split(";")[1:-1]]
+                        for line in file.readlines()[4:-1]
+                    ],
+                    dtype=float,
+                )
+
+        node_numbers = np.sort(np.array(node_numbers, dtype=int))
+        if resistances.shape != (len(node_numbers), len(node_numbers)):
+            raise MotorCADError("Failed to read the exported thermal matrices.")
+        return node_numbers, resistances
+
     def get_node_to_node_resistance(self, node1, node2):
         """Get the node-to-node resistance.
 
@@ -23,7 +23,7 @@
 """RPC methods for variables."""
 from warnings import warn
 
-from ansys.motorcad.core.datastore import Datastore
+from ansys.motorcad.core.datastore import Datastore, _inout_type_values
 
 
 class _RpcMethodsVariables:
@@ -174,7 +174,36 @@ class _RpcMethodsVariables:
         -------
         ansys.motorcad.core.datastore.Datastore
         """
+        return Datastore.from_json(self._get_datastore_json())
+
+    def _get_datastore_json(self, inout_types=None, file_sections=None):
+        """Get the datastore JSON from Motor-CAD, filtered where supported.
+
+        Older versions of Motor-CAD return the whole datastore, so the result must still be
+        filtered by the caller.
+
+        Parameters
+        ----------
+        inout_types : list | None
+            Input/Output type (e.g. input, compatibility, setting).
+        file_sections : list | None
+            variable section (category in automation parameter names).
+
+        Returns
+        -------
+        dict
+        """
         self.connection.ensure_version_at_least("2026.0")
-        method = "GetDataStore"
-        datastore_json = self.connection.send_and_receive(method)
-        return Datastore.from_json(datastore_json)
+        if ((inout_types is not None) or (file_sections is not None)) and (
+            self.connection.check_if_feature_exists("get_datastore_filtered")
+        ):
+            method = "GetDataStoreFiltered"
+            type_values = _inout_type_values(inout_types)
+            params = [
+                [] if type_values is None else sorted(type_values),
+                [] if file_sections is None else list(file_sections),
+            ]
+            return self.connection.send_and_receive(method, params)
+        else:
+            method = "GetDataStore"
+            return self.connection.send_and_receive(method)
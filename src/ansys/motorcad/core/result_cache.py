@@ -0,0 +1,249 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Persistent cache of Motor-CAD calculation results, keyed on the design inputs."""
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+import time
+
+from ansys.motorcad.core.datastore import Datastore
+
+# Graph sources that can be stored with a cached result, and the MotorCAD method used to get them
+GRAPH_FUNCTIONS = {
+    "magnetic": "get_magnetic_graph",
+    "temperature": "get_temperature_graph",
+    "power": "get_power_graph",
+    "heatflow": "get_heatflow_graph",
+}
+
+_INDEX_FILE_NAME = "index.json"
+
+
+@dataclass
+class CachedResult:
+    """Outputs of a Motor-CAD calculation.
+
+    Parameters
+    ----------
+    outputs : Datastore
+        Output records after the calculation.
+    graphs : dict
+        Graphs after the calculation. The key is a ``(source, graph_name)`` tuple and the value
+        is an ``(x_values, y_values)`` tuple.
+    from_cache : bool, default: False
+        Whether the result was loaded from the cache rather than calculated.
+    """
+
+    outputs: Datastore
+    graphs: dict = field(default_factory=dict)
+    from_cache: bool = False
+
+    def has_graphs(self, graphs):
+        """Check if the result contains all the graphs.
+
+        Parameters
+        ----------
+        graphs : list of tuple
+            List of ``(source, graph_name)`` tuples.
+
+        Returns
+        -------
+        bool
+        """
+        return all(tuple(graph) in self.graphs for graph in graphs)
+
+
+class ResultCache:
+    """On-disk cache of Motor-CAD calculation results.
+
+    Results are stored as one JSON file per entry in the cache directory. When the cache
+    exceeds the maximum number of entries or maximum size, the least recently used entries
+    are removed.
+
+    The cache can be shared between scripts that run one after another, but is not safe to
+    use from several processes at the same time.
+
+    Parameters
+    ----------
+    cache_directory : str
+        Folder to store the cache in. The folder is created if it doesn't exist.
+    max_entries : int, default: 1000
+        Maximum number of results to store.
+    max_size : int, default: 1073741824
+        Maximum total size of the stored results in bytes.
+    """
+
+    def __init__(self, cache_directory, max_entries=1000, max_size=1024**3):
+        """Create ResultCache object."""
+        self.cache_directory = cache_directory
+        self.max_entries = max_entries
+        self.max_size = max_size
+
+        os.makedirs(cache_directory, exist_ok=True)
+        self._index = self._load_index()
+
+    def __len__(self):
+        """Get number of stored results."""
+        return len(self._index)
+
+    def __contains__(self, key):
+        """Check if a result is stored for the key."""
+        return key in self._index
+
+    @property
+    def size(self):
+        """Get total size of the stored results in bytes.
+
+        Returns
+        -------
+        int
+        """
+        return sum(entry["size"] for entry in self._index.values())
+
+    @staticmethod
+    def get_key(input_hash, calculation_type, program_version):
+        """Get the cache key for a calculation.
+
+        Results from different Motor-CAD versions can differ, so the version is part of the key.
+
+        Parameters
+        ----------
+        input_hash : str
+            Hash of the input datastore, from ``Datastore.input_hash()``.
+        calculation_type : str
+            Name of the calculation, for example ``"DoMagneticCalculation"``.
+        program_version : str
+            Motor-CAD version that runs the calculation.
+
+        Returns
+        -------
+        str
+        """
+        key_text = program_version + ":" + calculation_type + ":" + input_hash
+        return hashlib.sha256(key_text.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """Get a stored result.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from ``get_key()``.
+
+        Returns
+        -------
+        CachedResult | None
+            Stored result, or ``None`` if no result is stored for the key.
+        """
+        if key not in self._index:
+            return None
+
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as entry_file:
+                entry = json.load(entry_file)
+        except (OSError, ValueError):
+            # Entry has been deleted or is corrupt. Treat as a cache miss.
+            self._remove_entry(key)
+            self._save_index()
+            return None
+
+        self._index[key]["last_access"] = time.time()
+        self._save_index()
+
+        graphs = dict(
+            ((source, graph_name), (x_values, y_values))
+            for source, graph_name, x_values, y_values in entry["graphs"]
+        )
+        return CachedResult(Datastore.from_json(entry["outputs"]), graphs, from_cache=True)
+
+    def put(self, key, result):
+        """Store a result.
+
+        Parameters
+        ----------
+        key : str
+            Cache key from ``get_key()``.
+        result : CachedResult
+            Result to store.
+        """
+        entry = {
+            "outputs": result.outputs.to_json(),
+            "graphs": [
+                [source, graph_name, list(x_values), list(y_values)]
+                for (source, graph_name), (x_values, y_values) in result.graphs.items()
+            ],
+        }
+
+        entry_path = self._entry_path(key)
+        temp_path = entry_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as entry_file:
+            json.dump(entry, entry_file, separators=(",", ":"))
+        # Replace in one step so that readers never see a partly written entry
+        os.replace(temp_path, entry_path)
+
+        self._index[key] = {"size": os.path.getsize(entry_path), "last_access": time.time()}
+        self._evict()
+        self._save_index()
+
+    def clear(self):
+        """Remove all stored results."""
+        for key in list(self._index):
+            self._remove_entry(key)
+        self._save_index()
+
+    def _evict(self):
+        """Remove least recently used entries until the cache is within its limits."""
+        keys_by_age = sorted(self._index, key=lambda key: self._index[key]["last_access"])
+        total_size = self.size
+        for key in keys_by_age:
+            if (len(self._index) <= self.max_entries) and (total_size <= self.max_size):
+                break
+            total_size -= self._index[key]["size"]
+            self._remove_entry(key)
+
+    def _remove_entry(self, key):
+        self._index.pop(key, None)
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_directory, key + ".json")
+
+    def _index_path(self):
+        return os.path.join(self.cache_directory, _INDEX_FILE_NAME)
+
+    def _load_index(self):
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as index_file:
+                return json.load(index_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        temp_path = self._index_path() + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as index_file:
+            json.dump(self._index, index_file)
+        os.replace(temp_path, self._index_path())
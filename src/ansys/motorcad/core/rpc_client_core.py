@@ -54,6 +54,13 @@ SERVER_IP = LOCALHOST_ADDRESS
 
 _METHOD_SUCCESS = 0
 
+# Prefixes of RPC methods that can change calculation results, for example "DoMagneticCalculation",
+# "CalculateSaturationMap" or "LoadFromFile"
+_RESULT_CHANGING_METHOD_PREFIXES = ("Do", "Calculate", "Load")
+
+# RPC methods that replace the model or its external circuit
+_MODEL_LOADING_METHODS = ("LoadFromFile", "LoadTemplate", "LoadExternalCircuit")
+
 MOTORCAD_EXE_GLOBAL = ""
 
 if MOTORCAD_EXE_GLOBAL == "":
@@ -327,6 +334,14 @@ class _MotorCADConnection:
         else:
             self._post = requests.post
 
+        # Whether the RPC server accepts JSON-RPC batch requests. Checked on first use.
+        self._batch_supported = None
+
+        # Incremented by each method that can change results, so stored results can be cleared
+        self.calculation_generation = 0
+        # Incremented by each method that loads a model, so stored model state can be cleared
+        self.model_generation = 0
+
         self.enable_exceptions = enable_exceptions
         self.reuse_parallel_instances = reuse_parallel_instances
 
@@ -732,6 +747,8 @@ class _MotorCADConnection:
             "id": self._port,  # Can be any number not just linked to port
         }
 
+        self._update_calculation_generation(method)
+
         try:
             # Special case as there won't be a response
             if method == "Quit":
@@ -750,83 +767,173 @@ class _MotorCADConnection:
             self._raise_if_allowed("RPC Communication failed: " + str(e))
 
         else:  # No exceptions in RPC communication
-            if "error" in response:
-                error_string = "RPC Communication Error: " + response["error"]["message"]
-
-                if "Invalid params" in error_string:
-                    try:
-                        # common error - give a better error message
-                        new_error_string = error_string.split("hint")
-                        # Get last part
-                        new_error_string = new_error_string[-1]
-
-                        new_error_string = (
-                            method
-                            + ": One or more parameter types were invalid. HINT ["
-                            + new_error_string
-                        )
-                        error_string = new_error_string
-                    except Exception:
-                        # use old error string if that failed
-                        pass
+            return self._process_response(method, response, success_var)
+
+    def _process_response(self, method, response, success_var):
+        """Check the response to an RPC call for errors and get the returned values."""
+        if "error" in response:
+            error_string = "RPC Communication Error: " + response["error"]["message"]
+
+            if "Invalid params" in error_string:
+                try:
+                    # common error - give a better error message
+                    new_error_string = error_string.split("hint")
+                    # Get last part
+                    new_error_string = new_error_string[-1]
+
+                    new_error_string = (
+                        method
+                        + ": One or more parameter types were invalid. HINT ["
+                        + new_error_string
+                    )
+                    error_string = new_error_string
+                except Exception:
+                    # use old error string if that failed
+                    pass
 
-                success = -99
-                self._last_error_message = error_string
+            success = -99
+            self._last_error_message = error_string
 
-                self._raise_if_allowed(error_string)
-                return
+            self._raise_if_allowed(error_string)
+            return
 
-            else:
-                success = response["result"]["success"]
+        else:
+            success = response["result"]["success"]
 
-            if (method == "CheckIfGeometryIsValid") or (
-                method == "CheckIfGeometryIsValidWithContext"
-            ):
-                # This doesn't have the normal success var
-                success_value = 1
+        if (method == "CheckIfGeometryIsValid") or (method == "CheckIfGeometryIsValidWithContext"):
+            # This doesn't have the normal success var
+            success_value = 1
+        else:
+            success_value = _METHOD_SUCCESS
+
+        if success != success_value:
+            # This is an error caused by bad user code
+            # Exception is enabled by default
+            # Can get error message (get_last_error_message) instead
+            if response["result"]["errorMessage"] != "":
+                error_message = response["result"]["errorMessage"]
             else:
-                success_value = _METHOD_SUCCESS
-
-            if success != success_value:
-                # This is an error caused by bad user code
-                # Exception is enabled by default
-                # Can get error message (get_last_error_message) instead
-                if response["result"]["errorMessage"] != "":
-                    error_message = response["result"]["errorMessage"]
-                else:
-                    error_message = (
-                        "An error occurred in Motor-CAD."  # put some generic error message
-                    )
+                error_message = "An error occurred in Motor-CAD."  # put some generic error message
 
-                self._last_error_message = error_message
+            self._last_error_message = error_message
 
-                self._raise_if_allowed(error_message)
+            self._raise_if_allowed(error_message)
 
-            # Warning message only exists in response from Motor-CAD version >= 24R1
-            if "warningMessage" in response["result"]:
-                warning_message = response["result"]["warningMessage"]
-                if warning_message != "":
-                    # Code in Motor-CAD wants to raise a warning in Python
-                    warnings.warn(response["result"]["warningMessage"], MotorCADWarning)
+        # Warning message only exists in response from Motor-CAD version >= 24R1
+        if "warningMessage" in response["result"]:
+            warning_message = response["result"]["warningMessage"]
+            if warning_message != "":
+                # Code in Motor-CAD wants to raise a warning in Python
+                warnings.warn(response["result"]["warningMessage"], MotorCADWarning)
 
-            result_list = []
+        result_list = []
 
-            if success_var is None:
-                success_var = self.enable_success_variable
+        if success_var is None:
+            success_var = self.enable_success_variable
 
-            if success_var is True:
-                result_list.append(success)
+        if success_var is True:
+            result_list.append(success)
 
-            if len(response["result"]["output"]) > 0:
-                if len(response["result"]["output"]) == 1:
-                    result_list.append(response["result"]["output"][0])
-                else:
-                    result_list.extend(list(response["result"]["output"]))
+        if len(response["result"]["output"]) > 0:
+            if len(response["result"]["output"]) == 1:
+                result_list.append(response["result"]["output"][0])
+            else:
+                result_list.extend(list(response["result"]["output"]))
+
+        if len(result_list) > 1:
+            return tuple(result_list)
+        elif len(result_list) == 1:
+            return result_list[0]
+
+    def _update_calculation_generation(self, method):
+        """Increment the calculation and model generations if the method can change them."""
+        if method.startswith(_RESULT_CHANGING_METHOD_PREFIXES):
+            self.calculation_generation += 1
+        if method in _MODEL_LOADING_METHODS:
+            self.model_generation += 1
+
+    def _check_batch_supported(self):
+        """Check whether the Motor-CAD RPC server accepts JSON-RPC batch requests."""
+        if self._batch_supported is None:
+            payload = [{"method": "Handshake", "params": [], "jsonrpc": "2.0", "id": 0}]
+            try:
+                response = self._post(self._get_url(), json=payload).json()
+                self._batch_supported = (
+                    isinstance(response, list)
+                    and (len(response) == 1)
+                    and ("result" in response[0])
+                )
+            except Exception:
+                self._batch_supported = False
+        return self._batch_supported
+
+    def send_and_receive_batch(self, calls, success_var=None, return_errors=False):
+        """Send several RPC calls in a single request.
 
-            if len(result_list) > 1:
-                return tuple(result_list)
-            elif len(result_list) == 1:
-                return result_list[0]
+        A JSON-RPC batch request is used if the Motor-CAD RPC server supports it. Otherwise,
+        the calls are sent one at a time.
+
+        Parameters
+        ----------
+        calls : list of tuple
+            ``(method, params)`` tuples for each call.
+        success_var : bool, default: None
+            Whether to include the success variable in each result. If None, the connection
+            setting is used.
+        return_errors : bool, default: False
+            Whether to return a ``MotorCADError`` as the result of each failed call instead of
+            raising it. All calls are run, even if one of them fails.
+
+        Returns
+        -------
+        list
+            Result of each call.
+        """
+        results = []
+
+        if not self._check_batch_supported():
+            for method, params in calls:
+                try:
+                    results.append(self.send_and_receive(method, params, success_var))
+                except MotorCADError as e:
+                    if not return_errors:
+                        raise
+                    results.append(e)
+            return results
+
+        for method, _ in calls:
+            self._update_calculation_generation(method)
+
+        payload = [
+            {
+                "method": method,
+                "params": [] if params is None else params,
+                "jsonrpc": "2.0",
+                "id": call_number,
+            }
+            for call_number, (method, params) in enumerate(calls)
+        ]
+
+        try:
+            log_if_enabled(f">>> batch {payload}")
+            responses = self._post(self._get_url(), json=payload).json()
+            log_if_enabled(f"<<< batch {responses}")
+        except Exception as e:
+            log_if_enabled(f"!!! batch {type(e).__name__}: {e}")
+            self._raise_if_allowed("RPC Communication failed: " + str(e))
+            return [None] * len(calls)
+
+        # Responses to a batch request can be in any order
+        responses = dict((response.get("id"), response) for response in responses)
+
+        for call_number, (method, _) in enumerate(calls):
+            try:
+                results.append(self._process_response(method, responses[call_number], success_var))
+            except MotorCADError as e:
+                if not return_errors:
+                    raise
+                results.append(e)
+        return results
 
     def _wait_for_response(self, max_retries):
         method = "Handshake"
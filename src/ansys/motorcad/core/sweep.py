@@ -0,0 +1,580 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Parametric sweep engine for running design points across several Motor-CAD instances."""
+from collections import deque
+from dataclasses import dataclass, field
+import json
+from numbers import Number
+import os
+import queue
+import threading
+
+from ansys.motorcad.core.methods.rpc_methods_graphs import Magnetic3dGraph
+from ansys.motorcad.core.motorcad_methods import MotorCAD
+from ansys.motorcad.core.result_cache import GRAPH_FUNCTIONS, CachedResult
+from ansys.motorcad.core.rpc_client_core import MotorCADError
+
+# Put on the results queue by a worker thread when it has no more points to run
+_WORKER_FINISHED = object()
+
+# Relative cost of changing a variable, by datastore file section. Changing geometry or winding
+# variables forces Motor-CAD to rebuild the geometry and re-mesh.
+FILE_SECTION_COSTS = {
+    "Dimensions": 100,
+    "Winding": 100,
+    "Winding_Design": 100,
+    "Imported_DXF_Geometry": 100,
+    "Material": 10,
+    "Material_Properties": 10,
+    "FEA_Settings": 10,
+}
+# Cost of changing any other variable, such as currents or speeds
+DEFAULT_VARIABLE_COST = 1
+
+
+@dataclass
+class SweepResult:
+    """Result of one design point in a sweep.
+
+    Parameters
+    ----------
+    index : int
+        Index of the design point in the sweep.
+    point : dict
+        Variable names and values for the design point.
+    outputs : dict
+        Output variable names and values.
+    graphs : dict
+        Graphs for the design point. The key is a ``(source, graph_name)`` tuple and the value
+        is an ``(x_values, y_values)`` tuple.
+    graphs_3d : dict
+        Magnetic 3D graphs for the design point. The key is a ``(graph_name, section_number)``
+        tuple and the value is a ``Magnetic3dGraph``.
+    error : str
+        Error message if the design point failed, otherwise an empty string.
+    """
+
+    index: int
+    point: dict
+    outputs: dict = field(default_factory=dict)
+    graphs: dict = field(default_factory=dict)
+    graphs_3d: dict = field(default_factory=dict)
+    error: str = ""
+
+    def to_json(self):
+        """Convert SweepResult to a serialisable dictionary for JSON export.
+
+        Returns
+        -------
+        dict
+        """
+        return {
+            "index": self.index,
+            "point": self.point,
+            "outputs": self.outputs,
+            "graphs": [
+                [source, graph_name, list(x_values), list(y_values)]
+                for (source, graph_name), (x_values, y_values) in self.graphs.items()
+            ],
+            "graphs_3d": [
+                [graph_name, section_number, list(graph.x), list(graph.y), list(graph.data)]
+                for (graph_name, section_number), graph in self.graphs_3d.items()
+            ],
+            "error": self.error,
+        }
+
+    @classmethod
+    def from_json(cls, json_data):
+        """Create a SweepResult object from JSON data.
+
+        Parameters
+        ----------
+        json_data : dict
+            Data from ``to_json()``.
+
+        Returns
+        -------
+        SweepResult
+        """
+        graphs = dict(
+            ((source, graph_name), (x_values, y_values))
+            for source, graph_name, x_values, y_values in json_data["graphs"]
+        )
+        graphs_3d = dict(
+            ((graph_name, section_number), Magnetic3dGraph(x_values, y_values, data))
+            for graph_name, section_number, x_values, y_values, data in json_data["graphs_3d"]
+        )
+        return cls(
+            json_data["index"],
+            json_data["point"],
+            json_data["outputs"],
+            graphs,
+            graphs_3d,
+            json_data["error"],
+        )
+
+
+def _to_python_value(value):
+    """Convert NumPy scalar values to Python values, so they can be sent to Motor-CAD."""
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+def classify_variables(datastore, variable_names, section_costs=None):
+    """Get the relative cost of changing each variable, using its datastore file section.
+
+    Parameters
+    ----------
+    datastore : ansys.motorcad.core.datastore.Datastore
+        Datastore from ``MotorCAD.get_datastore()``.
+    variable_names : list of str
+        Names of the variables to classify.
+    section_costs : dict, default: None
+        Cost of changing a variable in each file section. Defaults to ``FILE_SECTION_COSTS``.
+        Variables in other sections have a cost of ``DEFAULT_VARIABLE_COST``.
+
+    Returns
+    -------
+    dict
+        Cost of changing each variable.
+    """
+    if section_costs is None:
+        section_costs = FILE_SECTION_COSTS
+
+    variable_costs = {}
+    for variable_name in variable_names:
+        record = datastore.get_variable_record(variable_name)
+        if record is None:
+            variable_costs[variable_name] = DEFAULT_VARIABLE_COST
+        else:
+            variable_costs[variable_name] = section_costs.get(
+                record.file_section, DEFAULT_VARIABLE_COST
+            )
+    return variable_costs
+
+
+def transition_cost(point_1, point_2, variable_costs):
+    """Get the cost of changing from one design point to another.
+
+    Parameters
+    ----------
+    point_1 : dict
+        Variable names and values for the first design point.
+    point_2 : dict
+        Variable names and values for the second design point.
+    variable_costs : dict
+        Cost of changing each variable, from ``classify_variables()``.
+
+    Returns
+    -------
+    int
+        Sum of the costs of the variables that change.
+    """
+    return sum(
+        variable_costs.get(variable_name, DEFAULT_VARIABLE_COST)
+        for variable_name in set(point_1) | set(point_2)
+        if point_1.get(variable_name) != point_2.get(variable_name)
+    )
+
+
+def _value_sort_key(value):
+    """Sort numbers before other values, so that points with mixed types can be sorted."""
+    if isinstance(value, Number) and not isinstance(value, bool):
+        return 0, value
+    return 1, str(value)
+
+
+def order_points(points, variable_costs):
+    """Order design points to reduce the cost of changing from one point to the next.
+
+    Points are grouped by the most expensive variables first. Within each group, the order of
+    the next variable is reversed for every other group, in the same way as a reflected Gray
+    code. For a full factorial sweep, each step only changes one variable.
+
+    Parameters
+    ----------
+    points : list of dict
+        Variable names and values for each design point.
+    variable_costs : dict
+        Cost of changing each variable, from ``classify_variables()``.
+
+    Returns
+    -------
+    list of int
+        Indices of the points in run order.
+    """
+    variable_names = set()
+    for point in points:
+        variable_names.update(point)
+    # Most expensive first. Sort on name as well so that the order is repeatable.
+    variable_names = sorted(
+        variable_names,
+        key=lambda name: (-variable_costs.get(name, DEFAULT_VARIABLE_COST), name),
+    )
+
+    def order_group(indices, level):
+        if (level == len(variable_names)) or (len(indices) <= 1):
+            return indices
+        groups = {}
+        for index in indices:
+            value = points[index].get(variable_names[level])
+            groups.setdefault(_value_sort_key(value), []).append(index)
+
+        ordered_indices = []
+        for group_number, value_key in enumerate(sorted(groups)):
+            group_indices = order_group(groups[value_key], level + 1)
+            if group_number % 2 == 1:
+                group_indices = group_indices[::-1]
+            ordered_indices.extend(group_indices)
+        return ordered_indices
+
+    return order_group(list(range(len(points))), 0)
+
+
+def schedule_points(points, variable_costs, number_of_instances):
+    """Order design points and share them between Motor-CAD instances.
+
+    Points are ordered with ``order_points()``, then split into one contiguous block per
+    instance. Each split is moved, by up to a quarter of the block size, to the most expensive
+    change nearby, so that expensive changes happen between instances rather than within them.
+
+    Parameters
+    ----------
+    points : list of dict
+        Variable names and values for each design point.
+    variable_costs : dict
+        Cost of changing each variable, from ``classify_variables()``.
+    number_of_instances : int
+        Number of Motor-CAD instances.
+
+    Returns
+    -------
+    list of list of int
+        Indices of the points to run on each instance, in run order.
+    """
+    ordered_indices = order_points(points, variable_costs)
+    number_of_points = len(ordered_indices)
+
+    # Cost of changing to each point from the previous point
+    step_costs = [0] + [
+        transition_cost(points[previous], points[current], variable_costs)
+        for previous, current in zip(ordered_indices, ordered_indices[1:])
+    ]
+
+    search_width = number_of_points // (4 * number_of_instances)
+    splits = [0]
+    for instance_number in range(1, number_of_instances):
+        ideal_split = round(instance_number * number_of_points / number_of_instances)
+        candidates = range(
+            max(splits[-1] + 1, ideal_split - search_width),
+            min(number_of_points, ideal_split + search_width) + 1,
+        )
+        if len(candidates) == 0:
+            splits.append(max(splits[-1], min(ideal_split, number_of_points)))
+            continue
+        splits.append(
+            max(
+                candidates,
+                key=lambda split: (
+                    step_costs[split] if split < number_of_points else 0,
+                    -abs(split - ideal_split),
+                ),
+            )
+        )
+    splits.append(number_of_points)
+
+    return [ordered_indices[start:end] for start, end in zip(splits, splits[1:])]
+
+
+class Sweep:
+    """Parametric sweep over a table of design points.
+
+    For each design point, the variables are set in Motor-CAD, the calculation is run, and the
+    outputs and graphs are read. Design points are shared between a pool of Motor-CAD
+    instances, and results are returned as soon as each point is complete.
+
+    If a checkpoint file is given, each completed point is saved to the file. Running the sweep
+    again with the same checkpoint file skips the points that have already been completed.
+
+    Parameters
+    ----------
+    points : list of dict | pandas.DataFrame
+        Design of experiments table. Each row maps Motor-CAD variable names to values.
+    outputs : list of str, default: None
+        Motor-CAD variables to read after each calculation.
+    graphs : list of tuple, default: None
+        Graphs to read after each calculation, as ``(source, graph_name)`` tuples. Options for
+        source are ``"magnetic"``, ``"temperature"``, ``"power"`` and ``"heatflow"``.
+    graphs_3d : list of tuple, default: None
+        Magnetic 3D graphs to read after each calculation, as ``(graph_name, section_number)``
+        tuples.
+    calculation : str, default: "do_magnetic_calculation"
+        Name of the ``MotorCAD`` method that runs the calculation.
+    evaluate : callable, default: None
+        Custom function to run each design point, called as ``evaluate(mc, point)``. Must
+        return a dictionary of outputs. If given, ``outputs``, ``graphs``, ``graphs_3d`` and
+        ``calculation`` are not used.
+    checkpoint_file : str, default: None
+        JSON lines file used to save completed points and resume the sweep.
+    mot_file : str, default: None
+        Motor-CAD file to load in each instance before running any points.
+    """
+
+    def __init__(
+        self,
+        points,
+        outputs=None,
+        graphs=None,
+        graphs_3d=None,
+        calculation="do_magnetic_calculation",
+        evaluate=None,
+        checkpoint_file=None,
+        mot_file=None,
+    ):
+        """Create Sweep object."""
+        if hasattr(points, "to_dict"):
+            # pandas.DataFrame
+            points = points.to_dict("records")
+        self.points = [
+            dict((str(name), _to_python_value(value)) for name, value in point.items())
+            for point in points
+        ]
+
+        self.outputs = [] if outputs is None else list(outputs)
+        self.graphs = [] if graphs is None else [tuple(graph) for graph in graphs]
+        for source, _ in self.graphs:
+            if source not in GRAPH_FUNCTIONS:
+                raise ValueError("Graph source must be one of: " + ", ".join(GRAPH_FUNCTIONS) + ".")
+        self.graphs_3d = [] if graphs_3d is None else [tuple(graph) for graph in graphs_3d]
+
+        self.calculation = calculation
+        self.evaluate = evaluate
+        self.checkpoint_file = checkpoint_file
+        self.mot_file = mot_file
+
+    def checkpoint_results(self):
+        """Get the results of completed points from the checkpoint file.
+
+        Returns
+        -------
+        list of SweepResult
+        """
+        if (self.checkpoint_file is None) or (not os.path.exists(self.checkpoint_file)):
+            return []
+
+        results = []
+        with open(self.checkpoint_file, "r", encoding="utf-8") as checkpoint:
+            for line in checkpoint:
+                try:
+                    result = SweepResult.from_json(json.loads(line))
+                except ValueError:
+                    # Last line can be incomplete if the sweep was interrupted while writing
+                    continue
+                if (result.index >= len(self.points)) or (
+                    result.point != self.points[result.index]
+                ):
+                    raise ValueError(
+                        "Checkpoint file does not match the sweep points: " + self.checkpoint_file
+                    )
+                results.append(result)
+        return results
+
+    def pending_indices(self):
+        """Get the indices of points that haven't been completed.
+
+        Returns
+        -------
+        list of int
+        """
+        completed = set(result.index for result in self.checkpoint_results())
+        return [index for index in range(len(self.points)) if index not in completed]
+
+    def run(self, instances, variable_costs=None):
+        """Run the sweep, returning results as each point completes.
+
+        Points that fail with an exception are returned with the error message set, and
+        aren't saved to the checkpoint file, so are run again when the sweep is resumed.
+
+        If variable costs are given, the points are ordered and shared between the instances
+        with ``schedule_points()`` to reduce expensive changes, such as geometry rebuilds.
+        When an instance finishes its points, it takes points from the end of the longest
+        remaining list.
+
+        Parameters
+        ----------
+        instances : list of MotorCAD | int
+            Motor-CAD instances to run the points on. If an integer is given, that number of
+            new instances are opened, and closed when the sweep finishes.
+        variable_costs : dict, default: None
+            Cost of changing each variable, from ``classify_variables()``. If None, the
+            points are run in order.
+
+        Yields
+        ------
+        SweepResult
+            Result of each point, in order of completion.
+        """
+        owns_instances = isinstance(instances, int)
+        if owns_instances:
+            instances = [MotorCAD() for _ in range(instances)]
+            for mc in instances:
+                mc.set_variable("MessageDisplayState", 2)
+
+        pending_indices = self.pending_indices()
+        if variable_costs is None:
+            # One list shared by all instances
+            point_lists = [deque(pending_indices)]
+        else:
+            schedule = schedule_points(
+                [self.points[index] for index in pending_indices], variable_costs, len(instances)
+            )
+            point_lists = [
+                deque(pending_indices[position] for position in positions) for positions in schedule
+            ]
+        point_lists_lock = threading.Lock()
+
+        def next_index(instance_number):
+            with point_lists_lock:
+                point_list = point_lists[instance_number % len(point_lists)]
+                if point_list:
+                    return point_list.popleft()
+                longest_point_list = max(point_lists, key=len)
+                if longest_point_list:
+                    return longest_point_list.pop()
+                return None
+
+        results = queue.Queue()
+        stop = threading.Event()
+
+        def run_points(mc, instance_number):
+            try:
+                if self.mot_file is not None:
+                    mc.load_from_file(self.mot_file)
+                while not stop.is_set():
+                    index = next_index(instance_number)
+                    if index is None:
+                        break
+                    results.put(self._run_point(mc, index))
+            except Exception as e:
+                # Pass unexpected errors to the main thread to raise
+                results.put(e)
+            finally:
+                results.put(_WORKER_FINISHED)
+
+        workers = [
+            threading.Thread(target=run_points, args=(mc, instance_number), daemon=True)
+            for instance_number, mc in enumerate(instances)
+        ]
+        for worker in workers:
+            worker.start()
+
+        checkpoint = None
+        if self.checkpoint_file is not None:
+            checkpoint = open(self.checkpoint_file, "a", encoding="utf-8")
+
+        try:
+            finished_workers = 0
+            while finished_workers < len(workers):
+                result = results.get()
+                if result is _WORKER_FINISHED:
+                    finished_workers += 1
+                    continue
+                if isinstance(result, Exception):
+                    raise result
+                if (checkpoint is not None) and (result.error == ""):
+                    checkpoint.write(json.dumps(result.to_json()) + "\n")
+                    checkpoint.flush()
+                yield result
+        finally:
+            # Stop workers taking new points if the caller stops early
+            stop.set()
+            for worker in workers:
+                worker.join()
+            if checkpoint is not None:
+                checkpoint.close()
+            if owns_instances:
+                for mc in instances:
+                    mc.quit()
+
+    def _run_point(self, mc, index):
+        """Run one design point.
+
+        Parameters
+        ----------
+        mc : MotorCAD
+            Motor-CAD instance to use.
+        index : int
+            Index of the design point.
+
+        Returns
+        -------
+        SweepResult
+        """
+        point = self.points[index]
+        result = SweepResult(index, point)
+        try:
+            if self.evaluate is not None:
+                result.outputs = self.evaluate(mc, point)
+                return result
+
+            for variable_name, value in point.items():
+                mc.set_variable(variable_name, value)
+            calculation_result = getattr(mc, self.calculation)()
+
+            if isinstance(calculation_result, CachedResult):
+                # Result cache is enabled, so the outputs might not be in Motor-CAD
+                outputs = calculation_result.outputs
+                result.outputs = dict(
+                    (output_name, outputs.get_variable(output_name)) for output_name in self.outputs
+                )
+                if calculation_result.from_cache:
+                    if self.graphs_3d or not calculation_result.has_graphs(self.graphs):
+                        result.error = "Graphs are not available from the result cache"
+                    else:
+                        result.graphs = dict(
+                            (graph, calculation_result.graphs[graph]) for graph in self.graphs
+                        )
+                    return result
+            else:
+                result.outputs = dict(
+                    (output_name, mc.get_variable(output_name)) for output_name in self.outputs
+                )
+
+            result.graphs = dict(
+                ((source, graph_name), getattr(mc, GRAPH_FUNCTIONS[source])(graph_name))
+                for source, graph_name in self.graphs
+            )
+            result.graphs_3d = dict(
+                (
+                    (graph_name, section_number),
+                    mc.get_magnetic_3d_graph(graph_name, section_number),
+                )
+                for graph_name, section_number in self.graphs_3d
+            )
+        except MotorCADError as e:
+            result.error = str(e)
+        except Exception as e:
+            # Other errors, for example from a custom evaluate function, only fail this point
+            result.error = type(e).__name__ + ": " + str(e)
+        return result
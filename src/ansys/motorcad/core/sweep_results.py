@@ -0,0 +1,360 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Writers that stream parametric sweep results to columnar files as the sweep runs.
+
+Results are buffered and written in row groups, so that completed points are saved to disk
+during the sweep and memory use doesn't grow with the size of the sweep. Files can be read
+while the sweep is still running.
+"""
+import os
+
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+try:
+    import h5py
+
+    _HAS_H5PY = True
+except ImportError:
+    _HAS_H5PY = False
+
+
+def _column_name(*parts):
+    """Join parts of a column name. Forward slashes in the parts are replaced."""
+    return "/".join(str(part).replace("/", "_") for part in parts)
+
+
+def _column_value(value):
+    """Convert numbers to floats, so that columns have the same type in every row group."""
+    if isinstance(value, bool) or (value is None) or isinstance(value, str):
+        return value
+    elif isinstance(value, (int, float)):
+        return float(value)
+    elif isinstance(value, (list, tuple)):
+        return [_column_value(item) for item in value]
+    elif hasattr(value, "tolist"):
+        # NumPy array or scalar
+        return _column_value(value.tolist())
+    else:
+        return str(value)
+
+
+def result_columns(result):
+    """Get the column names and values for a sweep result.
+
+    Columns are named ``point/<variable>``, ``outputs/<variable>``,
+    ``graphs/<source>/<graph_name>/x`` and ``graphs/<source>/<graph_name>/y`` and
+    ``graphs_3d/<graph_name>/<section_number>/x``, ``/y`` and ``/data``.
+
+    Parameters
+    ----------
+    result : ansys.motorcad.core.sweep.SweepResult
+        Result of one design point.
+
+    Returns
+    -------
+    dict
+        Value of each column.
+    """
+    columns = {"index": result.index, "error": result.error}
+    for variable_name, value in result.point.items():
+        columns[_column_name("point", variable_name)] = _column_value(value)
+    for variable_name, value in result.outputs.items():
+        columns[_column_name("outputs", variable_name)] = _column_value(value)
+    for (source, graph_name), (x_values, y_values) in result.graphs.items():
+        columns[_column_name("graphs", source, graph_name, "x")] = _column_value(x_values)
+        columns[_column_name("graphs", source, graph_name, "y")] = _column_value(y_values)
+    for (graph_name, section_number), graph in result.graphs_3d.items():
+        for axis_name in ["x", "y", "data"]:
+            columns[
+                _column_name("graphs_3d", graph_name, section_number, axis_name)
+            ] = _column_value(getattr(graph, axis_name))
+    return columns
+
+
+class _SweepResultsWriter:
+    """Base class for buffering sweep results and writing them in row groups."""
+
+    def __init__(self, path, row_group_size):
+        self.path = path
+        self.row_group_size = row_group_size
+        self._rows = []
+        self._column_names = None
+
+    def __enter__(self):
+        """Use the writer in a ``with`` statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Write any buffered results and close the writer."""
+        self.close()
+
+    def write(self, result):
+        """Add a sweep result, writing a row group if the buffer is full.
+
+        Parameters
+        ----------
+        result : ansys.motorcad.core.sweep.SweepResult
+            Result of one design point.
+        """
+        self._rows.append(result_columns(result))
+        if len(self._rows) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered results as a row group.
+
+        The columns of the file are fixed by the first row group. Failed results only have the
+        point columns, so results are kept in the buffer until there is a successful result, or
+        until the writer is closed.
+        """
+        if (self._column_names is None) and all(row["error"] != "" for row in self._rows):
+            return
+        self._write_rows()
+
+    def _write_rows(self):
+        """Write the buffered results as a row group, even if they have all failed."""
+        if not self._rows:
+            return
+
+        if self._column_names is None:
+            # Columns are fixed by the first row group
+            self._column_names = []
+            for row in self._rows:
+                for column_name in row:
+                    if column_name not in self._column_names:
+                        self._column_names.append(column_name)
+        else:
+            for row in self._rows:
+                for column_name in row:
+                    if column_name not in self._column_names:
+                        raise ValueError(
+                            "Sweep result has a column that isn't in the file: " + column_name
+                        )
+
+        columns = dict(
+            (column_name, [row.get(column_name) for row in self._rows])
+            for column_name in self._column_names
+        )
+        self._write_columns(columns)
+        self._rows = []
+
+    def close(self):
+        """Write any buffered results and close the file."""
+        self._write_rows()
+
+    def _write_columns(self, columns):
+        raise NotImplementedError
+
+
+class ParquetResultsWriter(_SweepResultsWriter):
+    """Write sweep results to a Parquet dataset.
+
+    Each row group is written as a separate Parquet file in the dataset directory. Files are
+    written under a temporary hidden name and then renamed, so readers only see complete row
+    groups. Use ``read_parquet_results()`` to read the results, including while the sweep is
+    running. Writing to an existing dataset adds new files, so a resumed sweep appends to its
+    previous results. Numbers are stored as floats, as are columns with no values in the first
+    row group.
+
+    Requires pyarrow.
+
+    Parameters
+    ----------
+    path : str
+        Directory for the dataset. The directory is created if it doesn't exist.
+    row_group_size : int, default: 100
+        Number of results in each row group.
+    """
+
+    def __init__(self, path, row_group_size=100):
+        """Create ParquetResultsWriter object."""
+        if not _HAS_PYARROW:
+            raise ImportError(
+                "Failed to create ParquetResultsWriter. Please ensure pyarrow is installed"
+            )
+        super().__init__(path, row_group_size)
+        os.makedirs(path, exist_ok=True)
+
+        self._schema = None
+        part_files = sorted(self._part_files())
+        self._part_number = len(part_files)
+        if part_files:
+            self._schema = pq.read_schema(os.path.join(path, part_files[0]))
+            self._column_names = self._schema.names
+
+    def _part_files(self):
+        return [
+            file_name
+            for file_name in os.listdir(self.path)
+            if file_name.startswith("part-") and file_name.endswith(".parquet")
+        ]
+
+    @staticmethod
+    def _to_array(values):
+        """Convert the values of a column to an array, with floats for a column of None."""
+        if all(value is None for value in values):
+            return pa.array(values, type=pa.float64())
+        return pa.array(values)
+
+    def _write_columns(self, columns):
+        if self._schema is None:
+            table = pa.table(
+                dict((name, self._to_array(values)) for name, values in columns.items())
+            )
+            self._schema = table.schema
+        else:
+            table = pa.Table.from_pydict(columns, schema=self._schema)
+
+        file_name = "part-{:05d}.parquet".format(self._part_number)
+        temp_path = os.path.join(self.path, "." + file_name + ".tmp")
+        pq.write_table(table, temp_path)
+        os.replace(temp_path, os.path.join(self.path, file_name))
+        self._part_number += 1
+
+
+def read_parquet_results(path):
+    """Read sweep results written by ``ParquetResultsWriter``.
+
+    Parameters
+    ----------
+    path : str
+        Directory of the dataset.
+
+    Returns
+    -------
+    pyarrow.Table
+    """
+    if not _HAS_PYARROW:
+        raise ImportError("Failed to read sweep results. Please ensure pyarrow is installed")
+    return pq.read_table(path)
+
+
+class HDF5ResultsWriter(_SweepResultsWriter):
+    """Write sweep results to an HDF5 file.
+
+    Each column is stored as a dataset with one row per result. Graphs are stored as 2D
+    datasets and magnetic 3D graphs as 3D datasets, so every result must have graphs of the
+    same size. Numbers and booleans are stored as floats, with NaN for missing values.
+
+    The file is written in single-writer multiple-reader (SWMR) mode, so it can be read while
+    the sweep is running by opening it with ``h5py.File(path, "r", libver="latest",
+    swmr=True)`` and calling ``refresh()`` on the datasets.
+
+    Requires h5py.
+
+    Parameters
+    ----------
+    path : str
+        HDF5 file name. If the file exists, results are appended.
+    row_group_size : int, default: 100
+        Number of results to write at a time.
+    """
+
+    def __init__(self, path, row_group_size=100):
+        """Create HDF5ResultsWriter object."""
+        if not (_HAS_H5PY and _HAS_NUMPY):
+            raise ImportError(
+                "Failed to create HDF5ResultsWriter. Please ensure h5py and numpy are installed"
+            )
+        super().__init__(path, row_group_size)
+
+        self._file = h5py.File(path, "a", libver="latest")
+        self._number_of_rows = 0
+        if "index" in self._file:
+            self._number_of_rows = len(self._file["index"])
+            self._column_names = []
+            self._file.visititems(
+                lambda name, item: self._column_names.append(name)
+                if isinstance(item, h5py.Dataset)
+                else None
+            )
+            self._file.swmr_mode = True
+
+    def close(self):
+        """Write any buffered results and close the file."""
+        self._write_rows()
+        self._file.close()
+
+    @staticmethod
+    def _to_array(values, dtype=None, row_shape=None):
+        """Convert the values of a column to an array with a row per result."""
+        if dtype is None:
+            is_string = any(isinstance(value, str) for value in values)
+        else:
+            is_string = dtype.kind == "O"
+
+        if is_string:
+            return np.array(
+                ["" if value is None else str(value) for value in values],
+                dtype=h5py.string_dtype(),
+            )
+
+        if row_shape is None:
+            row_shape = ()
+            for value in values:
+                if value is not None:
+                    row_shape = np.shape(value)
+                    break
+        return np.array(
+            [np.full(row_shape, np.nan) if value is None else value for value in values],
+            dtype=float,
+        )
+
+    def _write_columns(self, columns):
+        number_of_new_rows = len(columns["index"])
+
+        if not self._file.swmr_mode:
+            # New file. All datasets must be created before switching to SWMR mode.
+            for column_name, values in columns.items():
+                array = self._to_array(values)
+                self._file.create_dataset(
+                    column_name, data=array, maxshape=(None,) + array.shape[1:], chunks=True
+                )
+            self._file.swmr_mode = True
+        else:
+            for column_name, values in columns.items():
+                dataset = self._file[column_name]
+                array = self._to_array(values, dataset.dtype, dataset.shape[1:])
+                if array.shape[1:] != dataset.shape[1:]:
+                    raise ValueError(
+                        "Sweep result has a different size to the file for: " + column_name
+                    )
+                dataset.resize(self._number_of_rows + number_of_new_rows, axis=0)
+                dataset[self._number_of_rows :] = array
+
+        for column_name in columns:
+            self._file[column_name].flush()
+        self._number_of_rows += number_of_new_rows
@@ -0,0 +1,231 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Solve exported Motor-CAD thermal networks without running Motor-CAD.
+
+Networks from ``MotorCAD.get_thermal_network`` can be solved for many power loss cases, for
+example in calibration loops, using sparse LU factorisations that are calculated once and reused.
+"""
+try:
+    import numpy as np
+    from scipy import sparse
+    from scipy.sparse.linalg import splu
+
+    _HAS_SCIPY = True
+except ImportError:
+    _HAS_SCIPY = False
+
+
+class ThermalNetworkSolver:
+    """Steady state and transient solver for a thermal network.
+
+    Nodes with a fixed temperature keep that temperature. For all other nodes, the power
+    flowing in through the conductances balances the node power (steady state), or the
+    node power and the energy stored in the node capacitance (transient).
+
+    The conductance between nodes is symmetric, so heat carried by fluid flow in one direction
+    isn't represented in the same way as in Motor-CAD.
+
+    Requires NumPy and SciPy.
+
+    Parameters
+    ----------
+    network : ansys.motorcad.core.methods.rpc_methods_thermal.ThermalNetwork
+        Thermal network from ``MotorCAD.get_thermal_network``.
+    """
+
+    def __init__(self, network):
+        """Create ThermalNetworkSolver object."""
+        if not _HAS_SCIPY:
+            raise ImportError(
+                "Failed to create thermal network solver. "
+                "Please ensure numpy and scipy are installed"
+            )
+        self.network = network
+        conductance = sparse.csr_matrix(network.conductance)
+        # Heat flow out of each node is (diag(sum of conductances) - conductance) @ temperatures
+        self._laplacian = (
+            sparse.diags(np.asarray(conductance.sum(axis=1)).ravel()) - conductance
+        ).tocsr()
+
+        fixed = np.isfinite(network.fixed_temperatures)
+        if not fixed.any():
+            raise ValueError("Thermal network must have at least one fixed temperature node.")
+        self._fixed = np.flatnonzero(fixed)
+        self._free = np.flatnonzero(~fixed)
+        self._laplacian_free = self._laplacian[self._free][:, self._free].tocsc()
+        self._laplacian_fixed = self._laplacian[self._free][:, self._fixed].tocsr()
+        self._capacitances_free = np.asarray(network.capacitances, dtype=float)[self._free]
+
+        self._steady_state_factorisation = None
+        # Transient factorisations, stored by (capacitance multiplier / time step)
+        self._transient_factorisations = {}
+
+    def _get_steady_state_factorisation(self):
+        if self._steady_state_factorisation is None:
+            self._steady_state_factorisation = splu(self._laplacian_free)
+        return self._steady_state_factorisation
+
+    def _get_transient_factorisation(self, capacitance_factor):
+        if capacitance_factor not in self._transient_factorisations:
+            matrix = self._laplacian_free + sparse.diags(
+                self._capacitances_free * capacitance_factor
+            )
+            self._transient_factorisations[capacitance_factor] = splu(matrix.tocsc())
+        return self._transient_factorisations[capacitance_factor]
+
+    def _get_inputs(self, powers, fixed_temperatures):
+        """Get node powers and fixed temperatures, as arrays with a column for each case."""
+        if powers is None:
+            powers = self.network.powers
+        if fixed_temperatures is None:
+            fixed_temperatures = self.network.fixed_temperatures
+        powers = np.asarray(powers, dtype=float)
+        fixed_temperatures = np.asarray(fixed_temperatures, dtype=float)
+        if powers.shape[0] != len(self.network.node_numbers):
+            raise ValueError("Powers must have a value for each node in the thermal network.")
+        if fixed_temperatures.shape[0] != len(self.network.node_numbers):
+            raise ValueError(
+                "Fixed temperatures must have a value for each node in the thermal network."
+            )
+        return powers, fixed_temperatures
+
+    def _get_heat_input(self, powers, fixed_temperatures):
+        """Get the power into each free node from node powers and fixed temperature nodes."""
+        return powers[self._free] - self._laplacian_fixed @ fixed_temperatures[self._fixed]
+
+    def steady_state(self, powers=None, fixed_temperatures=None):
+        """Solve the steady state temperatures.
+
+        Several cases can be solved at once, with a column of powers for each case. The
+        factorisation of the network is calculated on the first solve and reused.
+
+        Parameters
+        ----------
+        powers : numpy.ndarray, default: None
+            Power of each node, in W, with shape (number of nodes) or (number of nodes,
+            number of cases). If None, the network powers are used.
+        fixed_temperatures : numpy.ndarray, default: None
+            Temperatures of the fixed temperature nodes, in degrees C, with shape (number of
+            nodes) or (number of nodes, number of cases). Values for other nodes are ignored. If
+            None, the network fixed temperatures are used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Temperature of each node, in degrees C, with shape (number of nodes) or (number of
+            nodes, number of cases).
+        """
+        powers, fixed_temperatures = self._get_inputs(powers, fixed_temperatures)
+        if powers.ndim < fixed_temperatures.ndim:
+            powers = powers[:, np.newaxis]
+        elif fixed_temperatures.ndim < powers.ndim:
+            fixed_temperatures = fixed_temperatures[:, np.newaxis]
+        shape = np.broadcast_shapes(powers.shape, fixed_temperatures.shape)
+        powers = np.broadcast_to(powers, shape)
+        fixed_temperatures = np.broadcast_to(fixed_temperatures, shape)
+
+        temperatures = np.array(fixed_temperatures, dtype=float)
+        temperatures[self._free] = self._get_steady_state_factorisation().solve(
+            self._get_heat_input(powers, fixed_temperatures)
+        )
+        return temperatures
+
+    def transient(
+        self,
+        initial_temperatures,
+        time_step,
+        number_of_steps,
+        powers=None,
+        fixed_temperatures=None,
+        method="bdf2",
+    ):
+        """Solve the transient temperatures for fixed time steps.
+
+        Each time step solves a linear system with a factorisation of the network that is
+        calculated once for each time step size and reused.
+
+        Parameters
+        ----------
+        initial_temperatures : numpy.ndarray
+            Temperature of each node at the start, in degrees C. Values for fixed temperature
+            nodes are ignored.
+        time_step : float
+            Time step, in seconds.
+        number_of_steps : int
+            Number of time steps.
+        powers : numpy.ndarray, default: None
+            Power of each node, in W. Either constant, with shape (number of nodes), or for each
+            time step, with shape (number of steps, number of nodes). If None, the network powers
+            are used.
+        fixed_temperatures : numpy.ndarray, default: None
+            Temperatures of the fixed temperature nodes, in degrees C. If None, the network fixed
+            temperatures are used.
+        method : str, default: "bdf2"
+            Time integration method. Options are ``"euler"`` (implicit Euler) and ``"bdf2"``
+            (second order backward differentiation, starting with one implicit Euler step).
+
+        Returns
+        -------
+        times : numpy.ndarray
+            Time of each result, in seconds, including the start.
+        temperatures : numpy.ndarray
+            Temperature of each node at each time, in degrees C, with shape
+            (number of steps + 1, number of nodes).
+        """
+        if method not in ("euler", "bdf2"):
+            raise ValueError('Method must be "euler" or "bdf2".')
+        if powers is None:
+            powers = self.network.powers
+        powers = np.asarray(powers, dtype=float)
+        if powers.ndim == 1:
+            powers = np.broadcast_to(powers, (number_of_steps, len(powers)))
+        if powers.shape[0] != number_of_steps:
+            raise ValueError("Powers must have a row for each time step.")
+        powers, fixed_temperatures = self._get_inputs(powers.T, fixed_temperatures)
+        powers = powers.T
+
+        temperatures = np.empty((number_of_steps + 1, len(self.network.node_numbers)))
+        temperatures[:] = fixed_temperatures
+        temperatures[0, self._free] = np.asarray(initial_temperatures, dtype=float)[self._free]
+        fixed_heat_input = self._laplacian_fixed @ fixed_temperatures[self._fixed]
+        free_temperatures = temperatures[:, self._free]
+
+        euler = self._get_transient_factorisation(1.0 / time_step)
+        if method == "bdf2":
+            bdf2 = self._get_transient_factorisation(1.5 / time_step)
+        stored_heat = self._capacitances_free / time_step
+        for step in range(number_of_steps):
+            heat_input = powers[step, self._free] - fixed_heat_input
+            if method == "euler" or step == 0:
+                free_temperatures[step + 1] = euler.solve(
+                    heat_input + stored_heat * free_temperatures[step]
+                )
+            else:
+                free_temperatures[step + 1] = bdf2.solve(
+                    heat_input
+                    + stored_heat
+                    * (2 * free_temperatures[step] - 0.5 * free_temperatures[step - 1])
+                )
+        temperatures[:, self._free] = free_temperatures
+
+        return np.arange(number_of_steps + 1) * time_step, temperatures
@@ -0,0 +1,223 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Read transient thermal results saved by Motor-CAD.
+
+Reads the text files written by ``save_transient_temperatures`` and
+``save_transient_power_values`` into NumPy arrays. Lines are parsed in chunks by NumPy rather
+than one at a time in Python, and the parsed arrays can be stored in a binary ``.npz`` file next
+to the text file, so that the text file is only parsed again if it changes.
+"""
+from dataclasses import dataclass
+from itertools import islice
+import os
+
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+# Separators that Motor-CAD can use for text exports, set with ``ExportTextSeparator``
+_SEPARATORS = [";", "\t", ","]
+
+# Lines to parse at once when reading a transient results file
+_CHUNK_SIZE = 10000
+
+
+@dataclass
+class TransientResults:
+    """Class for transient thermal results.
+
+    Attributes
+    ----------
+    names : list of str
+        Name of each result column, for example each thermal node.
+    times : numpy.ndarray
+        Time of each result row.
+    values : numpy.ndarray
+        Results, indexed by time and column.
+    """
+
+    names: list
+    times: "np.ndarray"
+    values: "np.ndarray"
+
+    def __getitem__(self, name):
+        """Get the results for a column, for all times."""
+        return self.values[:, self.names.index(name)]
+
+
+def _is_number(field):
+    try:
+        float(field)
+    except ValueError:
+        return False
+    return True
+
+
+def _split_line(line, separator):
+    """Split a line into fields, ignoring a trailing separator."""
+    fields = line.rstrip("\r\n").split(separator)
+    if fields and fields[-1].strip() == "":
+        fields = fields[:-1]
+    return fields
+
+
+def _read_header(file):
+    """Read lines up to the first row of results.
+
+    Returns
+    -------
+    separator : str
+    names : list of str
+        Names of the result columns, not including time.
+    first_line : str
+        First row of results.
+    """
+    header_lines = []
+    for line in file:
+        if not line.strip():
+            header_lines.append(line)
+            continue
+        for separator in _SEPARATORS:
+            fields = _split_line(line, separator)
+            if len(fields) > 1 and all(_is_number(field) for field in fields):
+                # Column names are in the first header line with the same number of columns
+                names = None
+                for header_line in header_lines:
+                    header_fields = _split_line(header_line, separator)
+                    if len(header_fields) == len(fields):
+                        names = [field.strip() for field in header_fields[1:]]
+                        break
+                if names is None:
+                    names = ["Column " + str(index) for index in range(1, len(fields))]
+                return separator, names, line
+        header_lines.append(line)
+    raise ValueError("No transient results found in file.")
+
+
+def iter_transient_results(file_path, chunk_size=_CHUNK_SIZE):
+    """Read a transient results file in chunks of rows.
+
+    Use this to process results that are too large to read into memory at once.
+
+    Requires NumPy.
+
+    Parameters
+    ----------
+    file_path : str
+        Text file written by ``save_transient_temperatures`` or ``save_transient_power_values``.
+    chunk_size : int, default: 10000
+        Number of rows in each chunk.
+
+    Yields
+    ------
+    names : list of str
+        Name of each result column.
+    times : numpy.ndarray
+        Time of each row in the chunk.
+    values : numpy.ndarray
+        Results in the chunk, indexed by time and column.
+    """
+    if not _HAS_NUMPY:
+        raise ImportError("Failed to read transient results. Please ensure numpy is installed")
+    with open(file_path, "r") as file:
+        separator, names, first_line = _read_header(file)
+        columns = range(len(names) + 1)
+        lines = [first_line]
+        while True:
+            lines.extend(islice(file, chunk_size - len(lines)))
+            # Results end at the first blank line
+            for index, line in enumerate(lines):
+                if not line.strip():
+                    lines = lines[:index]
+                    at_end = True
+                    break
+            else:
+                at_end = len(lines) < chunk_size
+            if lines:
+                chunk = np.loadtxt(lines, delimiter=separator, usecols=columns, ndmin=2)
+                yield names, chunk[:, 0], chunk[:, 1:]
+            if at_end:
+                return
+            lines = []
+
+
+def _get_file_state(file_path):
+    file_stat = os.stat(file_path)
+    return np.array([file_stat.st_mtime_ns, file_stat.st_size], dtype=np.int64)
+
+
+def read_transient_results(file_path, chunk_size=_CHUNK_SIZE, cache=True):
+    """Read a transient results file.
+
+    Requires NumPy.
+
+    Parameters
+    ----------
+    file_path : str
+        Text file written by ``save_transient_temperatures`` or ``save_transient_power_values``.
+    chunk_size : int, default: 10000
+        Number of rows to parse at once.
+    cache : bool, default: True
+        Whether to store the results in a ``.npz`` file next to the text file. If the ``.npz``
+        file is from the current version of the text file, results are read from it instead.
+
+    Returns
+    -------
+    TransientResults
+    """
+    if not _HAS_NUMPY:
+        raise ImportError("Failed to read transient results. Please ensure numpy is installed")
+    cache_path = file_path + ".npz"
+    file_state = _get_file_state(file_path)
+    if cache and os.path.isfile(cache_path):
+        with np.load(cache_path) as cached:
+            if np.array_equal(cached["file_state"], file_state):
+                return TransientResults(cached["names"].tolist(), cached["times"], cached["values"])
+
+    names = []
+    times = []
+    values = []
+    for names, chunk_times, chunk_values in iter_transient_results(file_path, chunk_size):
+        times.append(chunk_times)
+        values.append(chunk_values)
+    results = TransientResults(names, np.concatenate(times), np.concatenate(values))
+
+    if cache:
+        # Write to a temporary file first, so that a partly written file is never read
+        temp_path = os.path.join(
+            os.path.dirname(cache_path), "." + os.path.basename(cache_path) + ".tmp"
+        )
+        with open(temp_path, "wb") as file:
+            np.savez(
+                file,
+                file_state=file_state,
+                names=np.array(results.names, dtype=str),
+                times=results.times,
+                values=results.values,
+            )
+        os.replace(temp_path, cache_path)
+
+    return results
@@ -23,6 +23,12 @@
 import os
 import shutil
 
+from ansys.motorcad.core import MotorCADError
+from ansys.motorcad.core.methods.rpc_methods_utility import _RpcMethodsUtility
+from ansys.motorcad.core.motorcad_methods import _MotorCADCore
+from ansys.motorcad.core.rpc_client_core import _MotorCADConnection
+from ansys.motorcad.core.rpc_methods_core_old import _RpcMethodsCore
+
 
 def get_dir_path():
     return os.path.dirname(os.path.realpath(__file__))
@@ -67,3 +73,142 @@ def reset_temp_file_folder():
         shutil.rmtree(dir_path)
 
     os.mkdir(dir_path)
+
+
+class _FakeResponse:
+    def __init__(self, response_json):
+        self.response_json = response_json
+
+    def json(self):
+        return self.response_json
+
+
+class FakeMotorCADConnection(_MotorCADConnection):
+    """Connection to a fake Motor-CAD RPC server, which answers each call from a Python function.
+
+    Only the HTTP requests are faked, so requests are built and responses are processed by the
+    real connection. Use for behaviour that can't be tested with a Motor-CAD instance, such as
+    the requests sent to older Motor-CAD versions.
+
+    Parameters
+    ----------
+    methods : dict, default: None
+        Functions to answer RPC methods, where the key is the method name. Each function is
+        called with the method params and returns the method output. Raise ``MotorCADError``
+        to fail the call.
+    variables : dict, default: None
+        Motor-CAD variables used by ``GetVariable``, ``SetVariable``, ``GetArrayVariable`` and
+        ``SetArrayVariable``. The dictionary is changed by ``SetVariable`` calls.
+    features : list of str, default: ()
+        Features that exist, for ``CheckIfFeatureExists``.
+    program_version : str, default: "2027.0"
+        Motor-CAD version.
+    batch_supported : bool, default: True
+        Whether the server accepts JSON-RPC batch requests.
+    """
+
+    def __init__(
+        self,
+        methods=None,
+        variables=None,
+        features=(),
+        program_version="2027.0",
+        batch_supported=True,
+    ):
+        self._port = 1
+        self._url = "http://localhost"
+        self._session = None
+        self._connected = True
+        self._last_error_message = ""
+        self._batch_supported = None
+        self._open_new_instance = False
+        self._compatibility_mode = False
+        self.program_version = program_version
+        self.pid = -1
+        self.calculation_generation = 0
+        self.model_generation = 0
+        self.enable_exceptions = True
+        self.enable_success_variable = False
+        self.reuse_parallel_instances = False
+        self.keep_instance_open = False
+
+        self.variables = {} if variables is None else variables
+        self.features = set(features)
+        self.server_batch_supported = batch_supported
+        self.methods = {
+            "Handshake": lambda: "Handshake",
+            "CheckIfFeatureExists": lambda feature_name: feature_name in self.features,
+            "GetVariable": self._get_variable,
+            "SetVariable": self._set_variable,
+            "GetArrayVariable": lambda name, index: self._get_variable(name)[index],
+            "SetArrayVariable": self._set_array_variable,
+        }
+        if methods is not None:
+            self.methods.update(methods)
+        # Names of the methods sent in each request
+        self.requests = []
+
+    def __del__(self):
+        pass
+
+    def count_calls(self, method):
+        """Get the number of times that a method has been called."""
+        return sum(request.count(method) for request in self.requests)
+
+    def _get_variable(self, name):
+        if name not in self.variables:
+            raise MotorCADError("Invalid variable name: " + name)
+        return self.variables[name]
+
+    def _set_variable(self, name, value):
+        self.variables[name] = value
+
+    def _set_array_variable(self, name, index, value):
+        self._get_variable(name)[index] = value
+
+    def _call_response(self, call):
+        method = call["method"]
+        if method not in self.methods:
+            return {"jsonrpc": "2.0", "error": {"message": "Method not found"}, "id": call["id"]}
+
+        # Motor-CAD accepts strings or numbers as variants
+        params = [
+            param["variant"] if isinstance(param, dict) and list(param) == ["variant"] else param
+            for param in call["params"]
+        ]
+        try:
+            output = self.methods[method](*params)
+        except MotorCADError as e:
+            result = {"success": -1, "errorMessage": str(e), "output": []}
+        else:
+            if output is None:
+                output = []
+            elif isinstance(output, tuple):
+                output = list(output)
+            else:
+                output = [output]
+            result = {"success": 0, "errorMessage": "", "output": output}
+        return {"jsonrpc": "2.0", "result": result, "id": call["id"]}
+
+    def _post(self, url, json):
+        if isinstance(json, list):
+            self.requests.append([call["method"] for call in json])
+            if not self.server_batch_supported:
+                return _FakeResponse({"jsonrpc": "2.0", "error": {"message": "Invalid Request"}})
+            # Batch responses can be in any order
+            return _FakeResponse([self._call_response(call) for call in reversed(json)])
+        else:
+            self.requests.append([json["method"]])
+            return _FakeResponse(self._call_response(json))
+
+
+class FakeMotorCAD(_MotorCADCore):
+    """MotorCAD object connected to a fake Motor-CAD RPC server.
+
+    Parameters are the same as ``FakeMotorCADConnection``.
+    """
+
+    def __init__(self, **kwargs):
+        self.connection = FakeMotorCADConnection(**kwargs)
+        _RpcMethodsCore.__init__(self, mc_connection=self.connection)
+        _RpcMethodsUtility.__init__(self, mc_connection=self.connection)
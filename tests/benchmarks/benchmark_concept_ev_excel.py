@@ -0,0 +1,79 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark writing ConceptEV efficiency maps to Excel.
+
+Compares the write-only workbook used by ``export_concept_ev_model`` with writing each cell
+of a regular workbook. Run with ``python tests/benchmarks/benchmark_concept_ev_excel.py``. No
+Motor-CAD instance is needed.
+"""
+import os
+import tempfile
+import time
+
+import numpy as np
+from openpyxl import Workbook
+
+from ansys.motorcad.core.methods.rpc_methods_lab import _write_excel
+
+MAP_SIZE = 200
+DC_VOLTAGES = [300, 400, 500, 600, 700]
+SHEETS = ["Speed", "Shaft_Torque", "Stator_Current_Line_RMS", "Total_Loss", "Power_Factor"]
+
+
+def _write_excel_cell_by_cell(data, sheets, DC_voltage_list, i, wb, reset_speeds):
+    """Write each cell of a regular workbook, as before write-only workbooks were used."""
+    i_len, j_len = data["Speed"].shape
+    for sheet in sheets:
+        ws = wb.create_sheet(sheet + str(i + 1))
+        for jj, col in enumerate(ws.iter_cols(min_col=0, max_col=j_len, max_row=i_len)):
+            for ii, cell in enumerate(col):
+                ws[cell.coordinate] = data[sheet][ii][jj]
+    return wb
+
+
+def _time_export(write_function, write_only, file_path):
+    rng = np.random.default_rng(0)
+    start = time.perf_counter()
+    wb = Workbook(write_only=write_only)
+    for i in range(len(DC_VOLTAGES)):
+        data = dict((sheet, rng.random((MAP_SIZE, MAP_SIZE))) for sheet in SHEETS)
+        write_function(data, SHEETS, DC_VOLTAGES, i, wb, False)
+    wb.save(file_path)
+    return time.perf_counter() - start
+
+
+def main():
+    """Print the time to export efficiency maps for each DC bus voltage."""
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "ConceptEV_elecdata.xlsx")
+        print("{} x {} map, {} DC bus voltages".format(MAP_SIZE, MAP_SIZE, len(DC_VOLTAGES)))
+        print(
+            "cell by cell: {:.2f} s".format(
+                _time_export(_write_excel_cell_by_cell, False, file_path)
+            )
+        )
+        print("write-only:   {:.2f} s".format(_time_export(_write_excel, True, file_path)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark harmonic analysis of magnetic graphs, with and without NumPy.
+
+Run with ``python tests/benchmarks/benchmark_graph_harmonics.py``. No Motor-CAD instance is
+needed.
+"""
+import math
+import timeit
+
+from ansys.motorcad.core.methods import rpc_methods_graphs
+
+GRAPH_LENGTHS = [90, 180, 360, 720, 1800, 3600, 7200]
+
+
+def _test_graph(number_of_points):
+    x = [360 * i / (number_of_points - 1) for i in range(number_of_points)]
+    y = [
+        math.sin(math.radians(x_value)) + 0.1 * math.sin(math.radians(5 * x_value)) for x_value in x
+    ]
+    return x, y
+
+
+def _time_harmonics(x, y, use_numpy):
+    rpc_methods_graphs._HAS_NUMPY = use_numpy
+    timer = timeit.Timer(lambda: rpc_methods_graphs._graph_harmonics(x, y))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main():
+    """Print the time to get the harmonics of a graph for each graph length."""
+    has_numpy = rpc_methods_graphs._HAS_NUMPY
+    print("{:>8} {:>14} {:>14}".format("points", "python (ms)", "numpy (ms)"))
+    try:
+        for number_of_points in GRAPH_LENGTHS:
+            x, y = _test_graph(number_of_points)
+            python_time = _time_harmonics(x, y, False)
+            numpy_time = _time_harmonics(x, y, True) if has_numpy else math.nan
+            print(
+                "{:>8} {:>14.3f} {:>14.3f}".format(
+                    number_of_points, python_time * 1000, numpy_time * 1000
+                )
+            )
+    finally:
+        rpc_methods_graphs._HAS_NUMPY = has_numpy
+
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,16 @@
 
 import os
 
-from RPC_Test_Common import almost_equal, almost_equal_fixed, get_dir_path
+import pytest
+
+from RPC_Test_Common import (
+    FakeMotorCAD,
+    almost_equal,
+    almost_equal_fixed,
+    get_dir_path,
+    reset_to_default_file,
+)
+from ansys.motorcad.core import MotorCADError
 from ansys.motorcad.core.enums import MotorCADContext
 
 
@@ -103,3 +112,75 @@ def test_create_winding_pattern(mc):
     # Reset model
     mc.set_variable("NumberStrandsHand", strands)
     mc.create_winding_pattern()
+
+
+def _force_matrix_motorcad(matrix_feature_exists):
+    """Fake Motor-CAD, with 5 x 70 force harmonics matrices for 3 load points."""
+
+    def value(row, column, load_point):
+        return load_point * 10000 + row * 100 + column
+
+    def get_amplitude(row, column, load_point):
+        if row >= 5 or column >= 70:
+            raise MotorCADError("Index out of range")
+        return value(row, column, load_point)
+
+    return FakeMotorCAD(
+        methods={
+            "GetForceFrequencyDomainAmplitude": get_amplitude,
+            "GetForceFrequencyDomainMatrix": lambda load_point: [
+                [value(row, column, load_point) for column in range(70)] for row in range(5)
+            ],
+        },
+        variables={"NumLoadPoints": 3},
+        features=["get_force_frequency_domain_matrix"] if matrix_feature_exists else [],
+    )
+
+
+@pytest.mark.parametrize("matrix_feature_exists", [True, False])
+def test_get_force_frequency_domain_matrix(matrix_feature_exists):
+    pytest.importorskip("numpy")
+    mc = _force_matrix_motorcad(matrix_feature_exists)
+
+    matrix = mc.get_force_frequency_domain_matrix()
+    assert matrix.shape == (3, 5, 70)
+    # Load points are numbered from 1
+    assert matrix[2, 4, 69] == 30469
+    if not matrix_feature_exists:
+        # Size found by doubling then bisecting, followed by one request for the matrix
+        amplitude_requests = [
+            request
+            for request in mc.connection.requests
+            if "GetForceFrequencyDomainAmplitude" in request
+        ]
+        assert all(len(request) == 1 for request in amplitude_requests[:-1])
+        assert len(amplitude_requests) == 1 + 6 + 14 + 1
+        assert len(amplitude_requests[-1]) == 3 * 5 * 70
+
+    matrix = mc.get_force_frequency_domain_matrix(load_points=[1])
+    assert matrix.shape == (1, 5, 70)
+    assert matrix[0, 3, 2] == 10302
+
+    with pytest.raises(ValueError):
+        mc.get_force_frequency_domain_matrix(load_points=[0])
+
+
+def test_get_force_frequency_domain_matrix_motorcad(mc):
+    pytest.importorskip("numpy")
+    reset_to_default_file(mc)
+    mc.do_multi_force_calculation()
+
+    matrix = mc.get_force_frequency_domain_matrix()
+
+    number_of_load_points = mc.get_variable("NumLoadPoints")
+    assert matrix.shape[0] == number_of_load_points
+    assert matrix.shape[1] > 1
+    assert matrix.shape[2] > 1
+    assert almost_equal(
+        matrix[-1, 1, 1], mc.get_force_frequency_domain_amplitude(1, 1, number_of_load_points)
+    )
+    last_row, last_column = matrix.shape[1] - 1, matrix.shape[2] - 1
+    assert almost_equal(
+        matrix[0, last_row, last_column],
+        mc.get_force_frequency_domain_amplitude(last_row, last_column, 1),
+    )
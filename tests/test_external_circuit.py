@@ -0,0 +1,167 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from RPC_Test_Common import FakeMotorCAD
+from ansys.motorcad.core.external_circuit import (
+    Capacitance,
+    CircuitNode,
+    ExternalCircuit,
+    FixedTemperature,
+    PowerSource,
+    Resistance,
+)
+
+
+def _external_circuit_motorcad():
+    """Fake Motor-CAD, recording the parameters of each external circuit call."""
+    calls = []
+
+    def record_call(method):
+        return lambda *params: calls.append((method, list(params)))
+
+    mc = FakeMotorCAD(
+        methods=dict(
+            (method, record_call(method))
+            for method in [
+                "ClearExternalCircuit",
+                "CreateNewNode",
+                "ModifyNode",
+                "SetResistanceValue",
+                "SetCapacitanceValue",
+                "SetPowerSourceValue",
+                "RemoveExternalComponent",
+                "LoadFromFile",
+            ]
+        )
+    )
+    return mc, calls
+
+
+def _circuit_requests(mc):
+    """Get the methods sent in each request, except checks for batch support."""
+    return [request for request in mc.connection.requests if request != ["Handshake"]]
+
+
+def _circuit(number_of_nodes):
+    circuit = ExternalCircuit()
+    for index in range(number_of_nodes):
+        node = 2000 + index
+        circuit.add_node("Node " + str(index), node, index, 0, 0)
+        circuit.add_resistance("R" + str(index), node, node - 1, 0.5, "to previous node")
+        circuit.add_capacitance("C" + str(index), node, 10.0)
+    circuit.add_power_source("Loss", 2000, 25.0)
+    return circuit
+
+
+def test_external_circuit():
+    circuit = _circuit(2)
+    assert len(circuit) == 7
+    assert CircuitNode("Node 0", 2000, 0, 0, 0) in circuit.components
+
+    # Components with the same type, name and first node are replaced
+    circuit.add(Resistance("R0", 2000, 1999, 0.25))
+    assert len(circuit) == 7
+    assert Resistance("R0", 2000, 1999, 0.25) in circuit.components
+    circuit.add_fixed_temperature("Coolant", 2001, 65.0)
+    circuit.add_fixed_temperature("Coolant", 2001, 70.0)
+    assert FixedTemperature("Coolant", 2001, 70.0) in circuit.components
+    assert len(circuit) == 8
+
+    circuit.remove(PowerSource("Loss", 2000, 0))
+    assert len(circuit) == 7
+
+    with pytest.raises(TypeError):
+        circuit.add("R1")
+
+
+def test_set_external_circuit():
+    mc, calls = _external_circuit_motorcad()
+
+    # The first update clears the circuit and sends nodes, then components
+    mc.set_external_circuit(_circuit(100))
+    requests = _circuit_requests(mc)
+    assert requests[0] == ["ClearExternalCircuit"]
+    assert len(requests) == 3
+    assert requests[1] == ["CreateNewNode"] * 100
+    assert len(requests[2]) == 201
+    assert ("CreateNewNode", ["Node 0", 2000, 0, 0, 0, ""]) in calls
+    assert ("SetResistanceValue", ["R5", 2005, 2004, 0.5, "to previous node"]) in calls
+    assert ("SetPowerSourceValue", ["Loss", 2000, 25.0, 0, 0, ""]) in calls
+
+    # Sending the same circuit again sends nothing
+    mc.connection.requests.clear()
+    mc.set_external_circuit(_circuit(100))
+    assert _circuit_requests(mc) == []
+
+    # Only changes are sent
+    calls.clear()
+    circuit = _circuit(100)
+    circuit.add_power_source("Loss", 2000, 30.0)
+    circuit.add_node("Node 3", 2003, 3, 1, 0)
+    circuit.remove(Resistance("R7", 2007, 2006, 0.5))
+    mc.set_external_circuit(circuit)
+    assert _circuit_requests(mc) == [
+        ["RemoveExternalComponent"],
+        ["ModifyNode"],
+        ["SetPowerSourceValue"],
+    ]
+    assert calls == [
+        ("RemoveExternalComponent", ["Resistance", "R7", 2007]),
+        ("ModifyNode", ["Node 3", 2003, 3, 1, 0, ""]),
+        ("SetPowerSourceValue", ["Loss", 2000, 30.0, 0, 0, ""]),
+    ]
+
+    # Capacitances can't be removed on their own, so the whole circuit is sent again
+    mc.connection.requests.clear()
+    circuit.remove(Capacitance("C7", 2007, 10.0))
+    mc.set_external_circuit(circuit)
+    requests = _circuit_requests(mc)
+    assert requests[0] == ["ClearExternalCircuit"]
+    assert len(requests[2]) == 199
+
+    # The whole circuit is sent again after a model is loaded
+    mc.load_from_file("model.mot")
+    mc.connection.requests.clear()
+    mc.set_external_circuit(circuit)
+    assert _circuit_requests(mc)[0] == ["ClearExternalCircuit"]
+
+    mc.connection.requests.clear()
+    mc.set_external_circuit(circuit, full_update=True)
+    assert _circuit_requests(mc)[0] == ["ClearExternalCircuit"]
+
+
+def test_set_external_circuit_motorcad(mc):
+    circuit = ExternalCircuit()
+    circuit.add_resistance("test res", 3, 4, 150, "test resistance")
+    circuit.add_capacitance("test cap", 795, 35, "test capacitance value")
+    mc.set_external_circuit(circuit)
+    mc.do_steady_state_analysis()
+    assert mc.get_node_to_node_resistance(3, 4) == 150
+    assert mc.get_node_capacitance(795) == 35
+
+    circuit.add_resistance("test res", 3, 4, 250, "test resistance")
+    mc.set_external_circuit(circuit)
+    mc.do_steady_state_analysis()
+    assert mc.get_node_to_node_resistance(3, 4) == 250
+
+    mc.clear_external_circuit()
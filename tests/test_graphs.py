@@ -20,9 +20,19 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-# import pytest
+import dataclasses
+import math
 
-from RPC_Test_Common import almost_equal, almost_equal_percentage, reset_to_default_file
+import pytest
+
+from RPC_Test_Common import (
+    FakeMotorCAD,
+    almost_equal,
+    almost_equal_percentage,
+    reset_to_default_file,
+)
+from ansys.motorcad.core import MotorCADError
+from ansys.motorcad.core.methods import rpc_methods_graphs
 
 
 def test_get_magnetic_graph_point(mc):
@@ -167,6 +177,7 @@ def test_get_magnetic_3d_graph(mc):
     assert len(graph_result.y) == 4
     # Note that graph viewer shows in kN, result is in N
     assert almost_equal(graph_result.data[1][1], y)
+    assert graph_result.data_array[1, 1] == graph_result.data[1][1]
 
 
 def test_get_magnetic_graph_harmonics(mc):
@@ -187,6 +198,366 @@ def test_get_magnetic_graph_harmonics(mc):
     assert almost_equal(ang[1], phase_expected)
 
 
+def test_get_graphs(mc):
+    reset_to_default_file(mc)
+
+    mc.set_variable("TorqueCalculation", True)
+    mc.do_magnetic_calculation()
+
+    graphs = [("magnetic", "TorqueVW"), ("magnetic", "PhaseCurrent1")]
+    graph_points = mc.get_graphs(graphs)
+
+    assert list(graph_points) == graphs
+    for graph_name in ["TorqueVW", "PhaseCurrent1"]:
+        x, y = mc.get_magnetic_graph(graph_name)
+        x_array, y_array = graph_points[("magnetic", graph_name)]
+        assert list(x_array) == x
+        assert list(y_array) == y
+
+    with pytest.raises(ValueError):
+        mc.get_graphs([("unknown", "TorqueVW")])
+
+
+def test_get_magnetic_graph_point_by_point(mc, monkeypatch):
+    reset_to_default_file(mc)
+
+    mc.set_variable("TorqueCalculation", True)
+    mc.do_magnetic_calculation()
+    mc.set_variable("MessageDisplayState", 1)
+
+    x, y = mc.get_magnetic_graph("TorqueVW")
+
+    # Get the graph one point at a time, as for Motor-CAD versions before 2025.0
+    x_points, y_points = mc._get_graph("GetMagneticGraphPoint", "TorqueVW")
+    assert x_points == x
+    assert y_points == y
+    assert mc.get_variable("MessageDisplayState") == 1
+
+    # Get the graph without batch requests
+    monkeypatch.setattr(mc.connection, "_batch_supported", False)
+    x_points, y_points = mc._get_graph("GetMagneticGraphPoint", "TorqueVW")
+    assert x_points == x
+    assert y_points == y
+    assert mc.get_variable("MessageDisplayState") == 1
+
+    mc.set_variable("MessageDisplayState", 2)
+
+
+def _graph_point_motorcad(batch_supported, failed_point_number=None):
+    """Fake Motor-CAD, with a graph of 100 points for getting one point at a time."""
+
+    def get_magnetic_graph_point(graph_name, point_number):
+        if point_number >= 100:
+            raise MotorCADError(rpc_methods_graphs._END_OF_GRAPH_ERROR)
+        if point_number == failed_point_number:
+            raise MotorCADError("Point failed")
+        return point_number, point_number * 2
+
+    return FakeMotorCAD(
+        methods={"GetMagneticGraphPoint": get_magnetic_graph_point},
+        variables={"MessageDisplayState": 1},
+        program_version="2024.0",
+        batch_supported=batch_supported,
+    )
+
+
+@pytest.mark.parametrize("batch_supported", [True, False])
+def test_get_graph_point_by_point(batch_supported):
+    mc = _graph_point_motorcad(batch_supported)
+
+    x, y = mc.get_magnetic_graph("TorqueVW")
+
+    assert x == list(range(100))
+    assert y == list(range(0, 200, 2))
+    assert mc.connection.variables["MessageDisplayState"] == 1
+    # Each point is requested once, with a few requests after the end to find the length
+    number_of_calls = mc.connection.count_calls("GetMagneticGraphPoint")
+    assert 100 < number_of_calls <= 110
+    point_requests = [
+        request for request in mc.connection.requests if "GetMagneticGraphPoint" in request
+    ]
+    if batch_supported:
+        # Points after finding the length are requested in one batch
+        assert len(point_requests[-1]) == number_of_calls - (len(point_requests) - 1)
+        assert len(point_requests) < 20
+    else:
+        assert len(point_requests) == number_of_calls
+
+
+@pytest.mark.parametrize("batch_supported", [True, False])
+def test_get_graph_point_by_point_failed(batch_supported):
+    mc = _graph_point_motorcad(batch_supported, failed_point_number=50)
+    with pytest.raises(MotorCADError, match="Point failed"):
+        mc.get_magnetic_graph("TorqueVW")
+
+    # With exceptions disabled, the graph ends at the failed point
+    mc.connection.enable_exceptions = False
+    x, y = mc.get_magnetic_graph("TorqueVW")
+    assert x == list(range(50))
+    assert mc.connection.variables["MessageDisplayState"] == 1
+
+
+def test_magnetic_3d_graph_values(monkeypatch):
+    graph = rpc_methods_graphs.Magnetic3dGraph([0, 1, 2], [0, 90], [[1, 2], [3, 4], [5, 6]])
+
+    # Values are lists
+    assert graph.x == [0, 1, 2]
+    assert graph.data + [[7, 8]] == [[1, 2], [3, 4], [5, 6], [7, 8]]
+    assert graph == rpc_methods_graphs.Magnetic3dGraph(**dataclasses.asdict(graph))
+    assert [field.name for field in dataclasses.fields(graph)] == ["x", "y", "data"]
+
+    assert graph.x_array.dtype == float
+    assert list(graph.y_array) == [0, 90]
+    assert graph.data_array.shape == (3, 2)
+    assert graph.data_array[1, 1] == 4
+
+    # Arrays are converted once, until the values are set again
+    assert graph.data_array is graph.data_array
+    assert not graph.data_array.flags.writeable
+    graph.data = [[7, 8]]
+    assert graph.data_array.tolist() == [[7, 8]]
+    assert graph.x_array is graph.x_array
+    assert "_arrays" not in dataclasses.asdict(graph)
+    assert repr(graph) == "Magnetic3dGraph(x=[0, 1, 2], y=[0, 90], data=[[7, 8]])"
+
+    graph = rpc_methods_graphs.Magnetic3dGraph([0, 1, 2], [0, 90], [[1, 2], [3, 4], [5, 6]])
+    monkeypatch.setattr(rpc_methods_graphs, "_HAS_NUMPY", False)
+    with pytest.raises(ImportError):
+        graph.data_array
+
+
+def _changing_graph_motorcad(**kwargs):
+    """Fake Motor-CAD, which returns a graph that changes with each call."""
+    calls = []
+
+    def get_generic_graph(graph_name, data_source, section_number, point_number):
+        if graph_name == "Unknown":
+            raise MotorCADError("Graph not found")
+        calls.append(graph_name)
+        return [0, 1], [len(calls), len(calls)]
+
+    return FakeMotorCAD(methods={"GetGenericGraph": get_generic_graph}, **kwargs)
+
+
+def test_graph_cache():
+    mc = _changing_graph_motorcad()
+    mc.set_graph_cache(True)
+
+    x, y = mc.get_magnetic_graph("TorqueVW")
+    assert y == [1, 1]
+    # Changing the returned graph doesn't change the stored graph
+    y[0] = 100
+    assert mc.get_magnetic_graph("TorqueVW") == ([0, 1], [1, 1])
+    assert mc.connection.count_calls("GetGenericGraph") == 1
+
+    # Graphs from different sources are stored separately
+    assert mc.get_power_graph("TorqueVW") == ([0, 1], [2, 2])
+    graph_points = mc.get_graphs([("magnetic", "TorqueVW"), ("power", "TorqueVW")])
+    assert list(graph_points[("power", "TorqueVW")][1]) == [2, 2]
+    assert mc.connection.count_calls("GetGenericGraph") == 2
+
+    # Running a calculation clears stored graphs
+    mc.connection.calculation_generation += 1
+    assert mc.get_magnetic_graph("TorqueVW") == ([0, 1], [3, 3])
+    assert mc.connection.count_calls("GetGenericGraph") == 3
+
+    mc.set_graph_cache(False)
+    mc.get_magnetic_graph("TorqueVW")
+    mc.get_magnetic_graph("TorqueVW")
+    assert mc.connection.count_calls("GetGenericGraph") == 5
+
+
+def test_graph_cache_motorcad(mc):
+    reset_to_default_file(mc)
+    mc.set_variable("TorqueCalculation", True)
+    mc.do_magnetic_calculation()
+
+    mc.set_graph_cache(True)
+    try:
+        x, y = mc.get_magnetic_graph("TorqueVW")
+        x_cached, y_cached = mc.get_magnetic_graph("TorqueVW")
+        assert (x_cached, y_cached) == (x, y)
+
+        # Running a calculation clears stored graphs
+        mc.set_variable("PeakCurrent", mc.get_variable("PeakCurrent") / 2)
+        mc.do_magnetic_calculation()
+        _, y_new = mc.get_magnetic_graph("TorqueVW")
+        assert y_new != y
+    finally:
+        mc.set_graph_cache(False)
+        reset_to_default_file(mc)
+
+
+def test_get_graphs_without_generic_graphs():
+    # Motor-CAD without GetGenericGraphs
+    mc = _changing_graph_motorcad(program_version="2026.0")
+    graphs = [("magnetic", "TorqueVW"), ("power", "TorqueVW"), ("magnetic", "PhaseCurrent1")]
+
+    graph_points = mc.get_graphs(graphs)
+
+    # All graphs in one batch request
+    assert mc.connection.requests[-1] == ["GetGenericGraph"] * 3
+    assert sorted(y[0] for _, y in graph_points.values()) == [1, 2, 3]
+
+    with pytest.raises(MotorCADError):
+        mc.get_graphs([("magnetic", "Unknown")])
+
+    # Failed graphs are None with exceptions disabled, and aren't stored
+    mc.connection.enable_exceptions = False
+    mc.set_graph_cache(True)
+    graph_points = mc.get_graphs([("magnetic", "Unknown"), ("magnetic", "TorqueVW")])
+    assert graph_points[("magnetic", "Unknown")] is None
+    assert list(graph_points[("magnetic", "TorqueVW")][1]) == [4, 4]
+    assert mc.get_graphs([("magnetic", "Unknown")])[("magnetic", "Unknown")] is None
+
+
+def _force_orders_motorcad():
+    """Fake Motor-CAD, with force FFT graphs for 2 operating points and 3 slices."""
+
+    def get_magnetic_3d_graph(graph_name, slice_number):
+        operating_point = int(graph_name[-1])
+        # Value encodes the operating point, slice, space order index and time order index
+        data = [
+            [
+                operating_point * 1000 + slice_number * 100 + space_index * 10 + time_index
+                for time_index in range(5)
+            ]
+            for space_index in range(8)
+        ]
+        if "Angle" in graph_name:
+            data = [[-value for value in row] for row in data]
+        return {"x": list(range(8)), "y": list(range(5)), "data": data}
+
+    return FakeMotorCAD(
+        methods={"GetMagnetic3DGraph": get_magnetic_3d_graph},
+        variables={"NumLoadPoints": 2, "SkewType": 2, "RotorSkewSlices": 3},
+    )
+
+
+def test_get_force_orders():
+    mc = _force_orders_motorcad()
+
+    force_orders = mc.get_force_orders(max_space_order=4, electrical_cycles=2)
+
+    # All graphs in one batch request
+    assert mc.connection.requests[-1] == ["GetMagnetic3DGraph"] * 12
+
+    assert force_orders.amplitude.shape == (2, 3, 8, 5)
+    assert force_orders.angle.shape == (2, 3, 8, 5)
+    assert list(force_orders.space_orders) == [0, 1, 2, 3, -4, -3, -2, -1]
+    assert list(force_orders.time_orders) == [0, 0.5, 1, 1.5, 2]
+
+    # Operating point 2, slice 3, space order -3, electrical order 1.5
+    assert force_orders.amplitude[1, 2, 5, 3] == 2 * 2353
+    assert force_orders.angle[1, 2, 5, 3] == -2353
+    # Time order 0 isn't doubled
+    assert force_orders.amplitude[0, 0, 0, 0] == 1100
+
+    amplitude, angle = force_orders.get_order(-3, 1.5)
+    assert amplitude.shape == (2, 3)
+    assert amplitude[1, 2] == 2 * 2353
+    assert angle[1, 2] == -2353
+
+    with pytest.raises(ValueError):
+        force_orders.get_order(10, 1)
+
+
+@pytest.mark.parametrize("enable_exceptions", [True, False])
+def test_get_force_orders_missing_graph(enable_exceptions):
+    mc = _force_orders_motorcad()
+    mc.connection.variables["NumLoadPoints"] = 3
+    mc.connection.enable_exceptions = enable_exceptions
+
+    def get_magnetic_3d_graph(graph_name, slice_number):
+        if graph_name.endswith("Th3"):
+            raise MotorCADError("Graph not found")
+        return {"x": [0], "y": [0], "data": [[0]]}
+
+    mc.connection.methods["GetMagnetic3DGraph"] = get_magnetic_3d_graph
+    with pytest.raises(MotorCADError, match="Fr_Density_Stator_FFT_Amplitude_OL_Th3 for slice 1"):
+        mc.get_force_orders(max_space_order=0, electrical_cycles=1)
+
+
+def test_get_force_orders_motorcad(mc):
+    np = pytest.importorskip("numpy")
+    reset_to_default_file(mc)
+    mc.do_multi_force_calculation()
+
+    force_orders = mc.get_force_orders()
+
+    number_of_operating_points = mc.get_variable("NumLoadPoints")
+    assert force_orders.amplitude.shape[:2] == (number_of_operating_points, 1)
+    assert force_orders.angle.shape == force_orders.amplitude.shape
+
+    # Same values as single points of the graphs, with negative space orders offset by twice
+    # the maximum space order, and time orders scaled by the number of electrical cycles
+    max_space_order = mc.get_variable("ForceMaxOrder_Space_Stator_OL")
+    electrical_cycles = mc.get_variable("TorqueNumberCycles")
+    for operating_point in [1, number_of_operating_points]:
+        for space_order in [0, 2, -2]:
+            for time_order in [0, 1, 2]:
+                raw_space_order = space_order + 2 * max_space_order * (space_order < 0)
+                _, amplitude = mc.get_magnetic_3d_graph_point(
+                    "Fr_Density_Stator_FFT_Amplitude_OL_Th" + str(operating_point),
+                    1,
+                    raw_space_order,
+                    time_order * electrical_cycles,
+                )
+                _, angle = mc.get_magnetic_3d_graph_point(
+                    "Fr_Density_Stator_FFT_Angle_OL_Th" + str(operating_point),
+                    1,
+                    raw_space_order,
+                    time_order * electrical_cycles,
+                )
+                if time_order > 0:
+                    amplitude = amplitude * 2
+
+                space_index = np.flatnonzero(force_orders.space_orders == space_order)[0]
+                time_index = np.flatnonzero(force_orders.time_orders == time_order)[0]
+                assert np.isclose(
+                    force_orders.amplitude[operating_point - 1, 0, space_index, time_index],
+                    amplitude,
+                )
+                assert np.isclose(
+                    force_orders.angle[operating_point - 1, 0, space_index, time_index], angle
+                )
+
+    max_space_order = mc.get_variable("ForceMaxOrder_Space_Stator_OL")
+    assert force_orders.space_orders[max_space_order] == -max_space_order
+
+
+def _harmonics_test_graph(number_of_points):
+    # Two electrical cycles, starting at -30 degrees
+    x = [-30 + 720 * i / (number_of_points - 1) for i in range(number_of_points)]
+    y = [
+        1 + 3 * math.cos(math.radians(x_value)) + 2 * math.sin(math.radians(3 * x_value) + 0.5)
+        for x_value in x
+    ]
+    return x, y
+
+
+def test_graph_harmonics(monkeypatch):
+    x, y = _harmonics_test_graph(361)
+    orders, amp, ang = rpc_methods_graphs._graph_harmonics(x, y)
+
+    assert len(orders) == 181
+    assert almost_equal(orders[2], 1)
+    assert almost_equal(amp[0], 1)
+    assert almost_equal(amp[2], 3)
+    assert almost_equal(amp[6], 2)
+    assert almost_equal(amp[4], 0)
+    assert ang[4] == 0
+
+    # Results are the same without NumPy
+    monkeypatch.setattr(rpc_methods_graphs, "_HAS_NUMPY", False)
+    for numpy_values, python_values in zip(
+        [orders, amp, ang], rpc_methods_graphs._graph_harmonics(x, y)
+    ):
+        assert len(numpy_values) == len(python_values)
+        for numpy_value, python_value in zip(numpy_values, python_values):
+            assert math.isclose(numpy_value, python_value, abs_tol=1e-9)
+
+
 #   #Not fully ready submitted an issue
 # def test_get_fea_graph_point():
 #     reset_to_default_file(mc)
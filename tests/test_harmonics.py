@@ -0,0 +1,86 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import math
+
+import pytest
+
+from ansys.motorcad.core.harmonics import harmonics
+from ansys.motorcad.core.methods import rpc_methods_graphs
+
+np = pytest.importorskip("numpy")
+
+
+def _test_waveforms():
+    # Three phases of a current waveform with a 5th harmonic, over two cycles from -30 degrees
+    x = np.linspace(-30, 690, 361)
+    waveforms = np.array(
+        [
+            10 * np.cos(np.radians(x - phase_shift)) + np.cos(np.radians(5 * (x - phase_shift)))
+            for phase_shift in [0, 120, 240]
+        ]
+    )
+    return x, waveforms
+
+
+def test_harmonics():
+    x, waveforms = _test_waveforms()
+
+    orders, amplitudes, angles = harmonics(waveforms, (x[0], x[-1]))
+
+    assert orders.shape == (181,)
+    assert amplitudes.shape == (3, 181)
+    assert angles.shape == (3, 181)
+    assert orders[2] == pytest.approx(1)
+    assert amplitudes[:, 2] == pytest.approx([10, 10, 10])
+    assert amplitudes[:, 10] == pytest.approx([1, 1, 1])
+    assert amplitudes[:, 4] == pytest.approx([0, 0, 0], abs=1e-9)
+    assert list(angles[:, 4]) == [0, 0, 0]
+
+
+def test_harmonics_same_as_graph_harmonics(monkeypatch):
+    x, waveforms = _test_waveforms()
+
+    orders, amplitudes, angles = harmonics(waveforms, (x[0], x[-1]))
+
+    # Compare with the pure Python version for a single graph
+    monkeypatch.setattr(rpc_methods_graphs, "_HAS_NUMPY", False)
+    for waveform_amplitudes, waveform_angles, waveform in zip(amplitudes, angles, waveforms):
+        graph_orders, graph_amplitudes, graph_angles = rpc_methods_graphs._graph_harmonics(
+            list(x), list(waveform)
+        )
+        assert list(orders) == pytest.approx(graph_orders)
+        assert list(waveform_amplitudes) == pytest.approx(graph_amplitudes, abs=1e-9)
+        for angle, graph_angle in zip(waveform_angles, graph_angles):
+            assert math.isclose(angle, graph_angle, abs_tol=1e-6)
+
+
+def test_harmonics_without_end_point():
+    x, waveforms = _test_waveforms()
+
+    orders, amplitudes, angles = harmonics(waveforms[0], (x[0], x[-1]))
+    orders_no_end, amplitudes_no_end, angles_no_end = harmonics(
+        waveforms[0, :-1], (x[0], x[-1]), includes_end_point=False
+    )
+
+    assert orders_no_end == pytest.approx(orders)
+    assert amplitudes_no_end == pytest.approx(amplitudes)
+    assert angles_no_end == pytest.approx(angles)
@@ -23,14 +23,18 @@ import os
 from os import path, remove
 import time
 
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 import pytest
 
 from RPC_Test_Common import (  # (get_dir_path,
+    FakeMotorCAD,
     almost_equal_percentage,
     get_dir_path,
+    get_temp_files_dir_path,
     reset_to_default_file,
 )
+from ansys.motorcad.core.methods import rpc_methods_lab
+from ansys.motorcad.core.methods.rpc_methods_lab import _write_excel
 
 
 def test_model_build_lab(mc):
@@ -177,6 +181,165 @@ def test_external_custom_loss_functions(mc):
     assert mc.get_variable("NumCustomLossesExternal_Lab") == no_external_losses + 1
 
 
+def test_custom_loss_tables(mc):
+    internal_losses = mc.get_internal_custom_losses()
+    external_losses = mc.get_external_custom_losses()
+    assert len(internal_losses) == mc.get_variable("NumCustomLossesInternal_Lab")
+    assert len(external_losses) == mc.get_variable("NumCustomLossesExternal_Lab")
+
+    new_internal_losses = internal_losses + [
+        {"name": "Loss A", "function": "Speed * 1E-3", "type": "electrical", "thermal_node": 2},
+        {"name": "Loss B", "function": "Speed * 2E-3", "type": "Mechanical", "thermal_node": 4},
+    ]
+    mc.set_internal_custom_losses(new_internal_losses)
+    new_internal_losses[-2]["type"] = "Electrical"
+    assert mc.get_internal_custom_losses() == new_internal_losses
+
+    mc.remove_internal_custom_loss("Loss A")
+    assert mc.get_internal_custom_losses() == internal_losses + new_internal_losses[-1:]
+
+    with pytest.raises(ValueError):
+        mc.set_internal_custom_losses(
+            [{"name": "Loss C", "function": "1", "type": "Electrical", "thermal_node": -2}]
+        )
+
+    new_external_losses = [
+        {"name": "Loss D", "power_function": "Idc**2 * 1E-2", "voltage_function": "Idc * 1E-2"}
+    ]
+    mc.set_external_custom_losses(new_external_losses)
+    assert mc.get_external_custom_losses() == new_external_losses
+
+    mc.set_internal_custom_losses(internal_losses)
+    mc.set_external_custom_losses(external_losses)
+    assert mc.get_internal_custom_losses() == internal_losses
+    assert mc.get_external_custom_losses() == external_losses
+
+
+def test_custom_loss_tables_edit(mc):
+    internal_losses = mc.get_internal_custom_losses()
+    external_losses = mc.get_external_custom_losses()
+    custom_losses = internal_losses + [
+        {"name": "Loss " + str(i), "function": str(i), "type": "Electrical", "thermal_node": 2}
+        for i in range(1, 11)
+    ]
+    mc.set_internal_custom_losses(custom_losses)
+    assert mc.get_variable("NumCustomLossesInternal_Lab") == len(custom_losses)
+
+    # Losses after the removed loss are moved up
+    mc.remove_internal_custom_loss("Loss 5")
+    del custom_losses[len(internal_losses) + 4]
+    assert mc.get_internal_custom_losses() == custom_losses
+
+    mc.add_internal_custom_loss("Loss 11", "11", "mechanical", 2)
+    assert mc.get_internal_custom_losses() == custom_losses + [
+        {"name": "Loss 11", "function": "11", "type": "Mechanical", "thermal_node": 2}
+    ]
+
+    new_external_losses = [
+        {"name": "Loss " + str(i), "power_function": str(i), "voltage_function": "0"}
+        for i in range(3)
+    ]
+    mc.set_external_custom_losses(new_external_losses)
+    mc.add_external_custom_loss("Loss 3", "3", "0")
+    mc.remove_external_custom_loss("Loss 0")
+    assert [loss["name"] for loss in mc.get_external_custom_losses()] == [
+        "Loss 1",
+        "Loss 2",
+        "Loss 3",
+    ]
+
+    mc.set_internal_custom_losses(internal_losses)
+    mc.set_external_custom_losses(external_losses)
+    assert mc.get_internal_custom_losses() == internal_losses
+    assert mc.get_external_custom_losses() == external_losses
+
+
+def _custom_loss_motorcad():
+    """Fake Motor-CAD, storing custom loss arrays."""
+    variables = {"NumCustomLossesInternal_Lab": 0, "NumCustomLossesExternal_Lab": 0}
+    for array_name in list(rpc_methods_lab._internal_custom_loss_arrays.values()) + list(
+        rpc_methods_lab._external_custom_loss_arrays.values()
+    ):
+        variables[array_name] = []
+
+    def set_variable(variable_name, value):
+        variables[variable_name] = value
+        # Arrays are resized when their length changes
+        for array_name in (
+            rpc_methods_lab._internal_custom_loss_arrays.values()
+            if "Internal" in variable_name
+            else rpc_methods_lab._external_custom_loss_arrays.values()
+        ):
+            array = variables[array_name]
+            del array[value:]
+            array.extend([None] * (value - len(array)))
+
+    return FakeMotorCAD(
+        methods={"SetVariable": set_variable, "GetNodeExists": lambda node: node > 0},
+        variables=variables,
+    )
+
+
+def _array_variable_batches(mc):
+    """Get the requests which read or write custom loss arrays."""
+    return [
+        request
+        for request in mc.connection.requests
+        if "GetArrayVariable" in request or "SetArrayVariable" in request
+    ]
+
+
+def test_custom_loss_tables_batched():
+    mc = _custom_loss_motorcad()
+    custom_losses = [
+        {"name": "Loss " + str(i), "function": str(i), "type": "Electrical", "thermal_node": i}
+        for i in range(1, 21)
+    ]
+
+    mc.set_internal_custom_losses(custom_losses)
+    assert mc.get_variable("NumCustomLossesInternal_Lab") == 20
+    assert mc.get_internal_custom_losses() == custom_losses
+
+    # Each edit reads and writes the table in one batch each
+    mc.connection.requests.clear()
+    mc.remove_internal_custom_loss("Loss 5")
+    batches = _array_variable_batches(mc)
+    assert len(batches) == 2
+    # Only losses after the removed loss are moved
+    assert batches[1] == ["SetArrayVariable"] * 15 * 4
+    assert mc.get_internal_custom_losses() == custom_losses[:4] + custom_losses[5:]
+
+    mc.add_internal_custom_loss("Loss 21", "21", "mechanical", 21)
+    assert mc.get_internal_custom_losses()[-1] == {
+        "name": "Loss 21",
+        "function": "21",
+        "type": "Mechanical",
+        "thermal_node": 21,
+    }
+
+    with pytest.raises(NameError):
+        mc.remove_internal_custom_loss("Loss 5")
+    with pytest.raises(ValueError):
+        mc.set_internal_custom_losses([dict(custom_losses[0], type="Thermal")])
+    with pytest.raises(ValueError):
+        mc.set_internal_custom_losses([dict(custom_losses[0], thermal_node=-1)])
+    with pytest.raises(ValueError):
+        mc.set_external_custom_losses([{"name": "Loss"}])
+
+    external_losses = [
+        {"name": "Loss " + str(i), "power_function": str(i), "voltage_function": "0"}
+        for i in range(3)
+    ]
+    mc.set_external_custom_losses(external_losses)
+    mc.add_external_custom_loss("Loss 3", "3", "0")
+    mc.remove_external_custom_loss("Loss 0")
+    assert [loss["name"] for loss in mc.get_external_custom_losses()] == [
+        "Loss 1",
+        "Loss 2",
+        "Loss 3",
+    ]
+
+
 def test_export_concept_ev_model(mc):
     mc.set_variable("MessageDisplayState", 2)
     mc.load_template("e9")
@@ -226,6 +389,123 @@ def test_export_concept_ev_model(mc):
     reset_to_default_file(mc)
 
 
+def test_write_excel():
+    np = pytest.importorskip("numpy")
+
+    data = {
+        "Speed": np.array([[1.0, 1.0, 1.0], [500.0, 500.0, 500.0]]),
+        "Shaft_Torque": np.array([[10.0, 20.0, 30.0], [40.0, 50.0, 60.0]]),
+    }
+    file_path = path.join(get_temp_files_dir_path(), "write_excel_test.xlsx")
+    wb = Workbook(write_only=True)
+    _write_excel(data, ["Speed", "Shaft_Torque"], [400, 600], 1, wb, True)
+    wb.save(file_path)
+
+    wb = load_workbook(file_path)
+    assert wb.sheetnames == ["Speed2", "Shaft_Torque2"]
+    torque_sheet = wb["Shaft_Torque2"]
+    assert torque_sheet.max_row == 2
+    assert torque_sheet.max_column == 3
+    assert torque_sheet.cell(row=2, column=3).value == 60
+    # Speeds of 1 RPM are reset to 0 RPM
+    assert wb["Speed2"].cell(row=1, column=2).value == 0
+    assert wb["Speed2"].cell(row=2, column=2).value == 500
+
+
+def _parallel_lab_motorcad(mot_file=""):
+    """Fake Motor-CAD, where the Lab calculation saves the DC bus voltage as the speed."""
+    savemat = pytest.importorskip("scipy.io").savemat
+    variables = {"MessageDisplayState": 0, "Motor_Type": 0, "CurrentSpec_MotorLAB": 0}
+    files = {"mot_file": mot_file}
+
+    def set_file_name(mot_file):
+        files["mot_file"] = mot_file
+        variables["ResultsPath_MotorLAB"] = path.join(path.splitext(mot_file)[0], "Lab", "")
+
+    def save_to_file(mot_file):
+        with open(mot_file, "w") as file:
+            file.write("model copy")
+        set_file_name(mot_file)
+
+    def load_from_file(mot_file):
+        # Model and results folder are copied for each instance
+        assert path.dirname(mot_file) != get_temp_files_dir_path()
+        assert path.isfile(path.join(path.splitext(mot_file)[0], "Lab", "model.mat"))
+        set_file_name(mot_file)
+
+    def calculate_magnetic_lab():
+        time.sleep(0.05)
+        assert path.isfile(variables["ResultsPath_MotorLAB"] + "model.mat")
+        lab_results = dict((name, [[0.0]]) for name in rpc_methods_lab._CONCEPT_EV_LAB_VARIABLES)
+        lab_results["Speed"] = [[variables["DCBusVoltage"]]]
+        savemat(variables["ResultsPath_MotorLAB"] + "MotorLAB_elecdata.mat", lab_results)
+
+    if mot_file:
+        set_file_name(mot_file)
+    return FakeMotorCAD(
+        methods={
+            "GetMotorCADFileName": lambda: files["mot_file"],
+            "SaveToFile": save_to_file,
+            "LoadFromFile": load_from_file,
+            "SetMotorLABContext": lambda: None,
+            "CalculateMagnetic_Lab": calculate_magnetic_lab,
+        },
+        variables=variables,
+    )
+
+
+def test_calculate_lab_voltages_parallel():
+    mot_file = path.join(get_temp_files_dir_path(), "parallel_lab.mot")
+    with open(mot_file, "w") as file:
+        file.write("model")
+    lab_folder = path.join(get_temp_files_dir_path(), "parallel_lab", "Lab")
+    os.makedirs(lab_folder, exist_ok=True)
+    with open(path.join(lab_folder, "model.mat"), "w") as file:
+        file.write("lab model")
+
+    mc = _parallel_lab_motorcad(mot_file)
+    instances = [_parallel_lab_motorcad(), _parallel_lab_motorcad()]
+    voltages = [300, 400, 500, 600, 700, 800]
+
+    voltage_results = mc._calculate_lab_voltages_parallel(voltages, instances, {"I_max": 400})
+
+    assert [results["Speed"][0][0] for results in voltage_results] == voltages
+    # This instance takes a share of the voltages
+    calculations = [
+        instance.connection.count_calls("CalculateMagnetic_Lab") for instance in [mc] + instances
+    ]
+    assert sum(calculations) == len(voltages)
+    assert all(calculations)
+    for instance in instances:
+        assert instance.get_variable("Imax_MotorLAB") == 400
+        assert instance.get_variable("MessageDisplayState") == 0
+    # Model file isn't overwritten, and this instance keeps its model file
+    with open(mot_file) as file:
+        assert file.read() == "model"
+    assert mc.connection.count_calls("SaveToFile") == 0
+    assert mc.get_file_name() == mot_file
+
+
+def test_export_concept_ev_model_parallel(mc):
+    reset_to_default_file(mc)
+    mc.set_variable("MessageDisplayState", 2)
+    mot_file = mc.get_file_name()
+    modified_time = os.path.getmtime(mot_file)
+    file_path = mc.get_variable("ResultsPath_MotorLAB") + "ConceptEV_elecdata.xlsx"
+
+    mc.export_concept_ev_model(
+        Max_speed=10000, Speed_step=1000, DC_voltage_list=[300, 400], instances=1
+    )
+
+    # Model file isn't overwritten, and this instance keeps its model file
+    assert os.path.getmtime(mot_file) == modified_time
+    assert mc.get_file_name() == mot_file
+    wb = load_workbook(file_path)
+    assert "Shaft_Torque" in wb.sheetnames
+    assert "Shaft_Torque2" in wb.sheetnames
+    reset_to_default_file(mc)
+
+
 def test_thermal_model_export(mc):
     if not (
         mc.connection.check_if_feature_exists("BuildLabThermalModel")
@@ -0,0 +1,178 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import os
+from os import path
+
+import pytest
+
+from RPC_Test_Common import get_temp_files_dir_path
+from ansys.motorcad.core import lab_results
+from ansys.motorcad.core.lab_results import LabMapInterpolator, LabResults
+
+np = pytest.importorskip("numpy")
+scipy_io = pytest.importorskip("scipy.io")
+
+
+def _save_lab_results(file_path, torque_scale=1.0):
+    speed, torque = np.meshgrid(np.linspace(0, 10000, 5), np.linspace(0, 200, 3))
+    scipy_io.savemat(
+        file_path,
+        {
+            "Speed": speed,
+            "Shaft_Torque": torque * torque_scale,
+            "Total_Loss": speed * 0.01 + torque,
+            "varStr": np.array(["Speed", "Shaft_Torque", "Total_Loss"]),
+            "varUnits": np.array(["rpm", "Nm", "W"]),
+        },
+        do_compression=True,
+    )
+
+
+def test_lab_results(monkeypatch):
+    file_path = path.join(get_temp_files_dir_path(), "lab_results_elecdata.mat")
+    _save_lab_results(file_path)
+
+    loaded_names = []
+    loadmat = lab_results.loadmat
+
+    def record_loadmat(file_name, variable_names):
+        loaded_names.append(list(variable_names))
+        return loadmat(file_name, variable_names=variable_names)
+
+    monkeypatch.setattr(lab_results, "loadmat", record_loadmat)
+
+    results = LabResults(file_path)
+    assert results.speed.shape == (3, 5)
+    assert results.speed[0, -1] == 10000
+    assert loaded_names == [["Speed"]]
+
+    # Variables are only read once by each object
+    assert np.array_equal(results.total_loss, results.speed * 0.01 + results.shaft_torque)
+    assert loaded_names == [["Speed"], ["Total_Loss"], ["Shaft_Torque"]]
+    assert np.array_equal(LabResults(file_path)["Speed"], results.speed)
+    assert loaded_names[-1] == ["Speed"]
+
+    assert set(results.variable_names()) == {
+        "Speed",
+        "Shaft_Torque",
+        "Total_Loss",
+        "varStr",
+        "varUnits",
+    }
+    assert "Total_Loss" in results
+    assert results.get_unit("Shaft_Torque") == "Nm"
+
+    with pytest.raises(KeyError):
+        results["Power_Factor"]
+
+    # Stored variables are cleared when the file changes
+    loaded_names.clear()
+    _save_lab_results(file_path, torque_scale=2.0)
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+    assert results.shaft_torque[-1, 0] == 400
+    assert loaded_names == [["Shaft_Torque"]]
+
+
+def _lab_map_grid(speed_points=11, current_steps=6):
+    # Rows are speed points and columns are current steps, as in MotorLAB_elecdata.mat.
+    # Maximum torque falls above 4000 rpm, so the map is not convex.
+    speed = np.repeat(np.linspace(0, 10000, speed_points)[:, np.newaxis], current_steps, axis=1)
+    max_torque = np.minimum(200, 200 * 4000 / np.maximum(speed, 1))
+    torque = max_torque * np.linspace(0, 1, current_steps)
+    return speed, torque
+
+
+def test_lab_map_interpolator():
+    pytest.importorskip("scipy.spatial")
+    speed, torque = _lab_map_grid()
+    interpolator = LabMapInterpolator(
+        speed, torque, {"Total_Loss": 2 * speed + 3 * torque, "Power_Factor": np.ones_like(speed)}
+    )
+
+    # Linear maps are interpolated exactly
+    point_speed = np.array([[500, 3999], [7000, 2500]])
+    point_torque = np.array([[10, 150], [50, 199]])
+    values, outside = interpolator.interpolate(point_speed, point_torque)
+    assert not outside.any()
+    assert values["Total_Loss"].shape == (2, 2)
+    assert np.allclose(values["Total_Loss"], 2 * point_speed + 3 * point_torque)
+    assert np.allclose(values["Power_Factor"], 1)
+
+    # Points above the torque limit, or outside the speed range, are outside the map
+    values, outside = interpolator.interpolate([8000, 12000], [190, 10])
+    assert outside.all()
+    assert np.isnan(values["Total_Loss"]).all()
+
+    # With extrapolation, points outside use the nearest grid point
+    points = interpolator.locate([8000, 12000, 1000], [190, 10, 10], extrapolate=True)
+    assert list(points.outside) == [True, True, False]
+    values = interpolator.evaluate(points, ["Total_Loss"])
+    assert list(values) == ["Total_Loss"]
+    assert values["Total_Loss"][0] == 2 * 5000 + 3 * 160
+    assert values["Total_Loss"][1] == 2 * 10000 + 3 * 16
+    assert np.isclose(values["Total_Loss"][2], 2 * 1000 + 3 * 10)
+
+
+@pytest.mark.parametrize("speed_points, current_steps", [(11, 6), (6, 21), (4, 41)])
+def test_lab_map_interpolator_envelope(speed_points, current_steps):
+    pytest.importorskip("scipy.spatial")
+    speed, torque = _lab_map_grid(speed_points, current_steps)
+    interpolator = LabMapInterpolator(speed, torque, {"Total_Loss": 2 * speed + 3 * torque})
+
+    # Every point inside the envelope of the grid, including its edges, is inside the map
+    rng = np.random.default_rng(0)
+    point_speed = np.concatenate([rng.uniform(0, 10000, 100000), np.linspace(0, 10000, 1001)])
+    max_torque = np.interp(point_speed, speed[:, 0], torque[:, -1])
+    point_torque = max_torque * np.concatenate([rng.uniform(0, 1, 100000), np.ones(1001)])
+    values, outside = interpolator.interpolate(point_speed, point_torque)
+    assert not outside.any()
+    assert np.allclose(values["Total_Loss"], 2 * point_speed + 3 * point_torque)
+
+    values, outside = interpolator.interpolate(point_speed, max_torque * 1.01 + 0.1)
+    assert outside.all()
+
+
+def test_lab_map_interpolator_scattered():
+    pytest.importorskip("scipy.spatial")
+    speed, torque = _lab_map_grid()
+    interpolator = LabMapInterpolator(
+        speed.ravel(), torque.ravel(), {"Total_Loss": (2 * speed + 3 * torque).ravel()}
+    )
+    values, outside = interpolator.interpolate([500, 7000], [10, 50])
+    assert not outside.any()
+    assert np.allclose(values["Total_Loss"], [2 * 500 + 3 * 10, 2 * 7000 + 3 * 50])
+
+
+def test_lab_results_interpolator():
+    pytest.importorskip("scipy.spatial")
+    file_path = path.join(get_temp_files_dir_path(), "lab_results_interpolator.mat")
+    speed, torque = _lab_map_grid()
+    scipy_io.savemat(
+        file_path,
+        {"Speed": speed, "Shaft_Torque": torque, "Total_Loss": speed + torque},
+    )
+
+    interpolator = LabResults(file_path).interpolator(["Total_Loss"])
+    values, outside = interpolator.interpolate(np.linspace(0, 4000, 100), 100)
+    assert not outside.any()
+    assert np.allclose(values["Total_Loss"], np.linspace(0, 4000, 100) + 100)
@@ -0,0 +1,173 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import os
+
+import pytest
+
+from RPC_Test_Common import FakeMotorCAD, get_temp_files_dir_path, reset_to_default_file
+from ansys.motorcad.core.datastore import Datastore
+from ansys.motorcad.core.lab_results import LabResults
+from ansys.motorcad.core.result_cache import CachedResult, ResultCache
+
+
+def _cache_directory(name):
+    return os.path.join(get_temp_files_dir_path(), name)
+
+
+def test_result_cache_get_put():
+    cache = ResultCache(_cache_directory("result_cache_get_put"))
+    cache.clear()
+
+    key = ResultCache.get_key("input_hash", "DoMagneticCalculation", "2026.0")
+    assert key != ResultCache.get_key("input_hash", "DoSteadyStateAnalysis", "2026.0")
+    assert key != ResultCache.get_key("input_hash", "DoMagneticCalculation", "2026.1")
+    assert cache.get(key) is None
+
+    outputs = Datastore.from_dict({"ShaftTorque": 12.5, "TorqueRipple": [1.0, 2.0]})
+    graphs = {("magnetic", "TorqueVW"): ([0, 180, 360], [10.0, 12.0, 10.0])}
+    cache.put(key, CachedResult(outputs, graphs))
+
+    # Cache is persistent
+    cache = ResultCache(_cache_directory("result_cache_get_put"))
+    result = cache.get(key)
+    assert result.from_cache
+    assert result.outputs.get_variable("ShaftTorque") == 12.5
+    assert result.outputs.get_variable("TorqueRipple") == [1.0, 2.0]
+    assert result.graphs[("magnetic", "TorqueVW")] == ([0, 180, 360], [10.0, 12.0, 10.0])
+    assert result.has_graphs([("magnetic", "TorqueVW")])
+    assert not result.has_graphs([("magnetic", "BackEMF")])
+
+
+def test_result_cache_eviction():
+    cache = ResultCache(_cache_directory("result_cache_eviction"), max_entries=2)
+    cache.clear()
+
+    outputs = Datastore.from_dict({"ShaftTorque": 12.5})
+    cache.put("a", CachedResult(outputs))
+    cache.put("b", CachedResult(outputs))
+    # Use "a" so that "b" is least recently used
+    cache.get("a")
+    cache.put("c", CachedResult(outputs))
+
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+    # Size limit
+    cache.max_size = cache.size - 1
+    cache.put("d", CachedResult(outputs))
+    assert len(cache) == 1
+    assert "d" in cache
+
+
+def _cache_motorcad(program_version):
+    def record_json(name, value, inout_type):
+        return {
+            "current_value": value,
+            "default_value": value,
+            "units": "",
+            "input_or_output_type": inout_type,
+            "record_name": name,
+            "activex_name": name,
+            "alternative_activex_name": "",
+            "file_section": "Magnetics",
+            "is_array": False,
+            "is_array_2d": False,
+            "use_max_value": False,
+            "use_min_value": False,
+            "max_value": None,
+            "min_value": None,
+        }
+
+    datastore_json = {
+        "data_records": [record_json("Shaft_Speed", 1000, 0), record_json("ShaftTorque", 10.0, 2)]
+    }
+    return FakeMotorCAD(
+        methods={"GetDataStore": lambda: datastore_json, "DoMagneticCalculation": lambda: None},
+        program_version=program_version,
+    )
+
+
+def test_result_cache_program_version():
+    cache = ResultCache(_cache_directory("result_cache_program_version"))
+    cache.clear()
+
+    mc = _cache_motorcad("2026.0")
+    mc.set_result_cache(cache)
+    assert not mc.do_magnetic_calculation().from_cache
+    assert mc.do_magnetic_calculation().from_cache
+    assert mc.connection.count_calls("DoMagneticCalculation") == 1
+
+    # Results from another Motor-CAD version aren't used
+    mc = _cache_motorcad("2026.1")
+    mc.set_result_cache(cache)
+    assert not mc.do_magnetic_calculation().from_cache
+    assert len(cache) == 2
+
+def test_set_result_cache(mc):
+    reset_to_default_file(mc)
+    cache = ResultCache(_cache_directory("result_cache_motorcad"))
+    cache.clear()
+
+    mc.set_result_cache(cache, graphs=[("magnetic", "TorqueVW")])
+    try:
+        result = mc.do_magnetic_calculation()
+        assert not result.from_cache
+        assert len(cache) == 1
+
+        result_cached = mc.do_magnetic_calculation()
+        assert result_cached.from_cache
+        assert result_cached.outputs.to_dict() == result.outputs.to_dict()
+        assert result_cached.graphs == result.graphs
+
+        # Changing an input needs a new calculation
+        mc.set_variable("Shaft_Speed", mc.get_variable("Shaft_Speed") + 100)
+        assert not mc.do_magnetic_calculation().from_cache
+        assert len(cache) == 2
+    finally:
+        mc.set_result_cache(None)
+        reset_to_default_file(mc)
+
+
+def test_result_cache_lab(mc):
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("scipy")
+    reset_to_default_file(mc)
+    cache = ResultCache(_cache_directory("result_cache_lab"))
+    cache.clear()
+
+    mc.set_result_cache(cache)
+    try:
+        mc.set_motorlab_context()
+        mc.set_variable("EmagneticCalcType_Lab", 1)
+        shaft_torques = []
+        for dc_bus_voltage in [400, 200]:
+            mc.set_variable("DCBusVoltage", dc_bus_voltage)
+            # Lab results are in files, so the calculation always runs
+            assert mc.calculate_magnetic_lab() is None
+            shaft_torques.append(LabResults.from_motorcad(mc).shaft_torque)
+        assert len(cache) == 0
+        assert not np.array_equal(shaft_torques[0], shaft_torques[1])
+    finally:
+        mc.set_result_cache(None)
+        reset_to_default_file(mc)
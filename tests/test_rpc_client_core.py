@@ -30,6 +30,7 @@ import grpc
 from psutil import pid_exists
 import pytest
 
+from RPC_Test_Common import FakeMotorCADConnection
 import ansys.motorcad.core as pymotorcad
 from ansys.motorcad.core import MotorCAD, MotorCADError, MotorCADWarning
 from ansys.motorcad.core.rpc_client_core import MOTORCAD_EXE_GLOBAL, _MotorCADConnection
@@ -463,3 +464,39 @@ def test_resolve_motor_cad_exe_ignores_full_headless_beta_when_exe_manually_set(
         assert result == test_path
     finally:
         pymotorcad.set_motorcad_exe(save_global_exe)
+
+
+def _batch_test_connection(batch_supported):
+    """Connection to a fake Motor-CAD, where ``Test`` returns its params."""
+
+    def fail():
+        raise MotorCADError("Call failed")
+
+    return FakeMotorCADConnection(
+        methods={"Test": lambda *params: params, "Fail": fail}, batch_supported=batch_supported
+    )
+
+
+@pytest.mark.parametrize("batch_supported", [True, False])
+def test_send_and_receive_batch(batch_supported):
+    connection = _batch_test_connection(batch_supported)
+    calls = [("Test", [number, number * 2]) for number in range(10)]
+
+    results = connection.send_and_receive_batch(calls)
+
+    assert results == [(number, number * 2) for number in range(10)]
+    if batch_supported:
+        # Check for batch support, then one request for all calls
+        assert len(connection.requests) == 2
+    else:
+        assert len(connection.requests) == 11
+
+    results = connection.send_and_receive_batch(
+        [("Test", [1]), ("Fail", []), ("Test", [2])], return_errors=True
+    )
+    assert results[0] == 1
+    assert isinstance(results[1], MotorCADError)
+    assert results[2] == 2
+
+    with pytest.raises(MotorCADError):
+        connection.send_and_receive_batch([("Test", [1]), ("Fail", [])])
@@ -0,0 +1,382 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import os
+
+import pytest
+
+from RPC_Test_Common import FakeMotorCAD, get_temp_files_dir_path, reset_to_default_file
+from ansys.motorcad.core import MotorCADError
+from ansys.motorcad.core.datastore import Datastore
+from ansys.motorcad.core.result_cache import ResultCache
+from ansys.motorcad.core.sweep import (
+    DEFAULT_VARIABLE_COST,
+    Sweep,
+    SweepResult,
+    classify_variables,
+    order_points,
+    schedule_points,
+    transition_cost,
+)
+from ansys.motorcad.core.sweep_results import (
+    HDF5ResultsWriter,
+    ParquetResultsWriter,
+    read_parquet_results,
+)
+
+
+def _sweep_instance(fail_at_speed=None):
+    """Fake Motor-CAD, where the torque is proportional to the speed."""
+    variables = {"Shaft_Speed": 0, "ShaftTorque": 0}
+
+    def do_magnetic_calculation():
+        if variables["Shaft_Speed"] == fail_at_speed:
+            raise MotorCADError("Calculation failed")
+        variables["ShaftTorque"] = variables["Shaft_Speed"] / 100
+
+    def get_magnetic_3d_graph(graph_name, section_number):
+        torque = variables["ShaftTorque"]
+        return {"x": [0, 1, 2], "y": [0, 1], "data": [[torque] * 3, [torque * 2] * 3]}
+
+    return FakeMotorCAD(
+        methods={
+            "DoMagneticCalculation": do_magnetic_calculation,
+            "GetGenericGraph": lambda *params: ([0, 360], [variables["ShaftTorque"]] * 2),
+            "GetMagnetic3DGraph": get_magnetic_3d_graph,
+        },
+        variables=variables,
+    )
+
+
+def _calculation_count(instances):
+    return sum(mc.connection.count_calls("DoMagneticCalculation") for mc in instances)
+
+
+def _sweep_points():
+    return [{"Shaft_Speed": speed} for speed in range(1000, 2000, 100)]
+
+
+def test_sweep_run():
+    instances = [_sweep_instance(), _sweep_instance()]
+    sweep = Sweep(_sweep_points(), outputs=["ShaftTorque"], graphs=[("magnetic", "TorqueVW")])
+
+    results = sorted(sweep.run(instances), key=lambda result: result.index)
+
+    assert [result.index for result in results] == list(range(10))
+    assert _calculation_count(instances) == 10
+    for result in results:
+        assert result.error == ""
+        assert result.outputs["ShaftTorque"] == result.point["Shaft_Speed"] / 100
+        assert result.graphs[("magnetic", "TorqueVW")][1][0] == result.outputs["ShaftTorque"]
+
+    with pytest.raises(ValueError):
+        Sweep(_sweep_points(), graphs=[("not_a_source", "TorqueVW")])
+
+
+def test_sweep_run_evaluate_error():
+    def evaluate(mc, point):
+        if point["Shaft_Speed"] == 1500:
+            raise ValueError("Invalid speed")
+        mc.set_variable("Shaft_Speed", point["Shaft_Speed"])
+        mc.do_magnetic_calculation()
+        return {"ShaftTorque": mc.get_variable("ShaftTorque")}
+
+    instances = [_sweep_instance(), _sweep_instance()]
+    sweep = Sweep(_sweep_points(), evaluate=evaluate)
+
+    results = sorted(sweep.run(instances), key=lambda result: result.index)
+
+    # Only the failing point has an error, and the other points still run
+    assert len(results) == 10
+    assert [result.index for result in results if result.error != ""] == [5]
+    assert results[5].error == "ValueError: Invalid speed"
+    assert results[6].outputs["ShaftTorque"] == 16
+
+
+def test_sweep_checkpoint_resume():
+    checkpoint_file = os.path.join(get_temp_files_dir_path(), "sweep_checkpoint.jsonl")
+    if os.path.exists(checkpoint_file):
+        os.remove(checkpoint_file)
+
+    sweep = Sweep(_sweep_points(), outputs=["ShaftTorque"], checkpoint_file=checkpoint_file)
+
+    # Interrupt the sweep after 4 points
+    results = sweep.run([_sweep_instance()])
+    for _ in range(4):
+        next(results)
+    results.close()
+
+    assert len(sweep.checkpoint_results()) == 4
+    assert len(sweep.pending_indices()) == 6
+
+    # Resume, with one point failing
+    instance = _sweep_instance(fail_at_speed=1900)
+    results = list(sweep.run([instance]))
+    assert len(results) == 6
+    assert _calculation_count([instance]) == 6
+    assert [result.index for result in results if result.error != ""] == [9]
+    assert sweep.pending_indices() == [9]
+
+    restored = sweep.checkpoint_results()
+    assert isinstance(restored[0], SweepResult)
+    assert len(restored) == 9
+
+    # Checkpoint can't be used with different points
+    with pytest.raises(ValueError):
+        Sweep(_sweep_points()[::-1], checkpoint_file=checkpoint_file).checkpoint_results()
+
+
+def _factorial_points():
+    points = []
+    for current in [10, 20, 30]:
+        for speed in [1000, 2000, 3000, 4000]:
+            for slot_width in [2.0, 2.5, 3.0]:
+                points.append(
+                    {"PeakCurrent": current, "Shaft_Speed": speed, "Slot_Width": slot_width}
+                )
+    return points
+
+
+def _variable_costs():
+    datastore = Datastore.from_dict({"Slot_Width": 2.0, "PeakCurrent": 10})
+    datastore["Slot_Width"].file_section = "Dimensions"
+    datastore["PeakCurrent"].file_section = "Calculation"
+    return classify_variables(datastore, ["Slot_Width", "PeakCurrent", "Shaft_Speed"])
+
+
+def test_classify_variables():
+    variable_costs = _variable_costs()
+    assert variable_costs["Slot_Width"] > variable_costs["PeakCurrent"]
+    assert variable_costs["PeakCurrent"] == DEFAULT_VARIABLE_COST
+    # Not in datastore
+    assert variable_costs["Shaft_Speed"] == DEFAULT_VARIABLE_COST
+
+
+def test_order_points():
+    points = _factorial_points()
+    variable_costs = _variable_costs()
+    geometry_cost = variable_costs["Slot_Width"]
+
+    def costly_transitions(order):
+        return sum(
+            transition_cost(points[previous], points[current], variable_costs) >= geometry_cost
+            for previous, current in zip(order, order[1:])
+        )
+
+    order = order_points(points, variable_costs)
+    assert sorted(order) == list(range(len(points)))
+    # Original order changes geometry every point, ordered points only when necessary
+    assert costly_transitions(list(range(len(points)))) == len(points) - 1
+    assert costly_transitions(order) == 2
+    # Each step only changes one variable
+    for previous, current in zip(order, order[1:]):
+        changed = [
+            name for name in points[current] if points[current][name] != points[previous][name]
+        ]
+        assert len(changed) == 1
+
+
+def test_schedule_points():
+    points = _factorial_points()
+    variable_costs = _variable_costs()
+
+    schedule = schedule_points(points, variable_costs, 3)
+    assert len(schedule) == 3
+    assert sorted(index for indices in schedule for index in indices) == list(range(len(points)))
+    # Each instance gets one geometry
+    for indices in schedule:
+        assert len(indices) == 12
+        assert len(set(points[index]["Slot_Width"] for index in indices)) == 1
+
+    # More instances than points
+    schedule = schedule_points(points[:2], variable_costs, 4)
+    assert sorted(index for indices in schedule for index in indices) == [0, 1]
+
+
+def test_sweep_run_scheduled():
+    points = _factorial_points()
+    instances = [_sweep_instance(), _sweep_instance()]
+    sweep = Sweep(points, outputs=["ShaftTorque"])
+
+    results = list(sweep.run(instances, variable_costs=_variable_costs()))
+
+    assert sorted(result.index for result in results) == list(range(len(points)))
+    assert _calculation_count(instances) == len(points)
+
+
+def _write_sweep_results(writer, fail_at_speed=None):
+    sweep = Sweep(
+        _sweep_points(),
+        outputs=["ShaftTorque"],
+        graphs=[("magnetic", "TorqueVW")],
+        graphs_3d=[("B_Gap", 1)],
+    )
+    with writer:
+        for result in sweep.run([_sweep_instance(fail_at_speed)]):
+            writer.write(result)
+
+
+def test_parquet_results_writer():
+    pytest.importorskip("pyarrow")
+    results_path = os.path.join(get_temp_files_dir_path(), "sweep_results_parquet")
+    if os.path.isdir(results_path):
+        for file_name in os.listdir(results_path):
+            os.remove(os.path.join(results_path, file_name))
+
+    _write_sweep_results(ParquetResultsWriter(results_path, row_group_size=4), 1500)
+
+    # 10 points in row groups of 4
+    assert len(os.listdir(results_path)) == 3
+    results = read_parquet_results(results_path).to_pydict()
+    assert sorted(results["index"]) == list(range(10))
+    row = results["index"].index(2)
+    assert results["point/Shaft_Speed"][row] == 1200
+    assert results["outputs/ShaftTorque"][row] == 12
+    assert results["graphs/magnetic/TorqueVW/y"][row] == [12, 12]
+    assert results["graphs_3d/B_Gap/1/data"][row] == [[12, 12, 12], [24, 24, 24]]
+    failed_row = results["index"].index(5)
+    assert results["error"][failed_row] != ""
+    assert results["outputs/ShaftTorque"][failed_row] is None
+
+    # Writing again appends to the dataset
+    _write_sweep_results(ParquetResultsWriter(results_path, row_group_size=10))
+    assert len(read_parquet_results(results_path)) == 20
+
+
+def _write_failed_first_results(writer):
+    with writer:
+        # First row group only has failed results, without outputs
+        for index in range(2):
+            writer.write(SweepResult(index, {"Shaft_Speed": 1000}, error="Calculation failed"))
+        writer.write(
+            SweepResult(
+                2,
+                {"Shaft_Speed": 1200},
+                outputs={"ShaftTorque": 12, "Unset": None},
+                graphs={("magnetic", "TorqueVW"): ([0, 360], [12, 12])},
+            )
+        )
+        writer.write(
+            SweepResult(3, {"Shaft_Speed": 1300}, outputs={"ShaftTorque": 13, "Unset": 1.5})
+        )
+
+
+def test_parquet_results_writer_failed_first():
+    pytest.importorskip("pyarrow")
+    results_path = os.path.join(get_temp_files_dir_path(), "sweep_results_parquet_failed")
+    if os.path.isdir(results_path):
+        for file_name in os.listdir(results_path):
+            os.remove(os.path.join(results_path, file_name))
+
+    _write_failed_first_results(ParquetResultsWriter(results_path, row_group_size=1))
+
+    results = read_parquet_results(results_path).to_pydict()
+    assert results["index"] == [0, 1, 2, 3]
+    assert results["outputs/ShaftTorque"] == [None, None, 12, 13]
+    # Column with no values in the first row group is stored as floats
+    assert results["outputs/Unset"] == [None, None, None, 1.5]
+    assert results["graphs/magnetic/TorqueVW/y"] == [None, None, [12, 12], None]
+
+
+def test_hdf5_results_writer_failed_first():
+    h5py = pytest.importorskip("h5py")
+    results_file = os.path.join(get_temp_files_dir_path(), "sweep_results_failed.h5")
+    if os.path.exists(results_file):
+        os.remove(results_file)
+
+    _write_failed_first_results(HDF5ResultsWriter(results_file, row_group_size=1))
+
+    with h5py.File(results_file, "r", libver="latest", swmr=True) as results:
+        assert list(results["index"][:]) == [0, 1, 2, 3]
+        assert list(results["outputs/ShaftTorque"][2:]) == [12, 13]
+        assert results["outputs/Unset"][3] == 1.5
+        assert results["graphs/magnetic/TorqueVW/y"].shape == (4, 2)
+
+
+def test_hdf5_results_writer():
+    h5py = pytest.importorskip("h5py")
+    results_file = os.path.join(get_temp_files_dir_path(), "sweep_results.h5")
+    if os.path.exists(results_file):
+        os.remove(results_file)
+
+    _write_sweep_results(HDF5ResultsWriter(results_file, row_group_size=4), 1500)
+
+    with h5py.File(results_file, "r", libver="latest", swmr=True) as results:
+        indices = list(results["index"][:])
+        assert sorted(indices) == list(range(10))
+        row = indices.index(2)
+        assert results["outputs/ShaftTorque"][row] == 12
+        assert list(results["graphs/magnetic/TorqueVW/y"][row]) == [12, 12]
+        assert results["graphs_3d/B_Gap/1/data"].shape == (10, 2, 3)
+        assert results["graphs_3d/B_Gap/1/data"][row][1][0] == 24
+        failed_row = indices.index(5)
+        assert results["error"][failed_row] != b""
+        assert (
+            results["outputs/ShaftTorque"][failed_row] != results["outputs/ShaftTorque"][failed_row]
+        )
+
+    # Writing again appends to the file
+    _write_sweep_results(HDF5ResultsWriter(results_file))
+    with h5py.File(results_file, "r", libver="latest", swmr=True) as results:
+        assert len(results["index"]) == 20
+
+
+def test_sweep_motorcad(mc):
+    reset_to_default_file(mc)
+    mc.set_variable("TorqueCalculation", True)
+    sweep = Sweep(
+        [{"Shaft_Speed": 1000}, {"Shaft_Speed": 2000}],
+        outputs=["ShaftTorque"],
+        graphs=[("magnetic", "TorqueVW")],
+    )
+
+    results = list(sweep.run([mc]))
+
+    assert len(results) == 2
+    for result in results:
+        assert result.error == ""
+        assert len(result.graphs[("magnetic", "TorqueVW")][0]) > 0
+    reset_to_default_file(mc)
+
+
+def test_sweep_result_cache(mc):
+    reset_to_default_file(mc)
+    mc.set_variable("TorqueCalculation", True)
+    cache = ResultCache(os.path.join(get_temp_files_dir_path(), "sweep_result_cache"))
+    cache.clear()
+    graph = ("magnetic", "TorqueVW")
+    mc.set_result_cache(cache, graphs=[graph])
+    try:
+        sweep = Sweep([{"Shaft_Speed": 1000}], outputs=["ShaftTorque"], graphs=[graph])
+        result = list(sweep.run([mc]))[0]
+        cached_result = list(sweep.run([mc]))[0]
+
+        assert len(cache) == 1
+        assert cached_result.error == ""
+        assert cached_result.outputs == result.outputs
+        assert list(cached_result.graphs[graph][1]) == list(result.graphs[graph][1])
+
+        # Graphs that aren't in the cache can't be read from Motor-CAD for a cached result
+        sweep = Sweep([{"Shaft_Speed": 1000}], graphs=[graph, ("magnetic", "BackEMFPh1")])
+        assert list(sweep.run([mc]))[0].error == "Graphs are not available from the result cache"
+    finally:
+        mc.set_result_cache(None)
+        reset_to_default_file(mc)
@@ -23,7 +23,7 @@ import os
 
 import pytest
 
-from RPC_Test_Common import almost_equal, get_dir_path
+from RPC_Test_Common import FakeMotorCAD, almost_equal, get_dir_path, reset_to_default_file
 from ansys.motorcad.core.rpc_client_core import MotorCADError
 
 
@@ -102,6 +102,248 @@ def test_get_node_temperature(mc):
     assert temp == 40
 
 
+def test_get_node_values(mc):
+    np = pytest.importorskip("numpy")
+    mc.do_steady_state_analysis()
+
+    node_numbers = [0, 2, 397]
+    assert np.array_equal(
+        mc.get_node_temperatures(node_numbers),
+        [mc.get_node_temperature(node_number) for node_number in node_numbers],
+    )
+    assert np.array_equal(
+        mc.get_node_powers(node_numbers),
+        [mc.get_node_power(node_number) for node_number in node_numbers],
+    )
+    assert np.array_equal(
+        mc.get_node_capacitances(node_numbers),
+        [mc.get_node_capacitance(node_number) for node_number in node_numbers],
+    )
+    assert np.array_equal(
+        mc.get_node_to_node_resistances([(2, 3), (3, 4)]),
+        [mc.get_node_to_node_resistance(2, 3), mc.get_node_to_node_resistance(3, 4)],
+    )
+
+    all_node_numbers = mc.get_node_numbers()
+    assert 2 in all_node_numbers
+    assert 211 not in all_node_numbers
+    assert len(mc.get_node_temperatures()) == len(all_node_numbers)
+
+
+def _node_motorcad(variables=None):
+    """Fake Motor-CAD, with a thermal network of 1000 node numbers.
+
+    Node numbers of slices 2 and 3 are offset by 2000 and 4000.
+    """
+
+    def check_node_number(node_number):
+        if node_number >= 1000 and node_number % 2000 >= 1000 or node_number >= 6000:
+            raise MotorCADError("Range check error")
+
+    def get_node_exists(node_number):
+        check_node_number(node_number)
+        return node_number % 2000 % 3 != 1
+
+    def get_node_temperature(node_number):
+        check_node_number(node_number)
+        return 20 + node_number
+
+    def get_offset_node_number(node_number, slice_number, cuboid_number):
+        return node_number + 2000 * (slice_number - 1)
+
+    return FakeMotorCAD(
+        methods={
+            "GetNodeExists": get_node_exists,
+            "GetNodeTemperature": get_node_temperature,
+            "GetNodeToNodeResistance": lambda node1, node2: node1 + node2 / 1000,
+            "GetOffsetNodeNumber": get_offset_node_number,
+        },
+        variables=variables,
+    )
+
+
+def test_get_node_values_batched():
+    np = pytest.importorskip("numpy")
+    mc = _node_motorcad()
+
+    node_numbers = mc.get_node_numbers()
+    assert node_numbers == [node for node in range(1000) if node % 3 != 1]
+    # Batches of 256, 512 and 1024 node numbers
+    assert [len(request) for request in mc.connection.requests if "GetNodeExists" in request] == [
+        256,
+        512,
+        1024,
+    ]
+
+    mc.connection.requests.clear()
+    temperatures = mc.get_node_temperatures()
+    assert np.array_equal(temperatures, np.array(node_numbers) + 20)
+    assert mc.connection.count_calls("GetNodeTemperature") == len(node_numbers)
+    assert [request for request in mc.connection.requests if "GetNodeTemperature" in request] == [
+        ["GetNodeTemperature"] * len(node_numbers)
+    ]
+
+    mc.connection.requests.clear()
+    temperatures = mc.get_node_temperatures(np.array([5, 2]))
+    assert np.array_equal(temperatures, [25, 22])
+    assert mc.connection.requests == [["GetNodeTemperature", "GetNodeTemperature"]]
+
+    resistances = mc.get_node_to_node_resistances([(1, 2), (3, 4)])
+    assert np.array_equal(resistances, [1.002, 3.004])
+
+    with pytest.raises(MotorCADError):
+        mc.get_node_temperatures([1000])
+
+
+def test_get_node_numbers_offset():
+    # Three axial slices, with node numbers outside the range of the first slice
+    mc = _node_motorcad({"AxialSliceDefinition": 1, "NumberOfCuboids": 1})
+    node_numbers = mc.get_node_numbers()
+    slice_node_numbers = [node for node in range(1000) if node % 3 != 1]
+    assert node_numbers == [
+        node + offset for offset in [0, 2000, 4000] for node in slice_node_numbers
+    ]
+    assert mc.connection.count_calls("GetOffsetNodeNumber") == 3 * len(slice_node_numbers)
+
+
+def test_get_thermal_network(mc):
+    pytest.importorskip("scipy")
+    mc.do_steady_state_analysis()
+
+    network = mc.get_thermal_network()
+    assert network.node_numbers[0] == 0
+    assert network.fixed_temperatures[0] == 40
+    index_1 = network.get_index(1)
+    index_9 = network.get_index(9)
+    assert almost_equal(1 / network.conductance[index_1, index_9], 0.0043, 3)
+    assert (network.conductance != network.conductance.T).nnz == 0
+    assert network.capacitances[network.get_index(2)] == mc.get_node_capacitance(2)
+
+
+def test_get_thermal_network_exported(mc, monkeypatch):
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("scipy")
+    mc.do_steady_state_analysis()
+
+    # Read the network from the exported matrices, as for Motor-CAD versions without
+    # GetThermalNetwork
+    monkeypatch.setattr(mc.connection, "check_if_feature_exists", lambda feature_name: False)
+    network = mc.get_thermal_network()
+    assert np.array_equal(network.node_numbers, mc.get_node_numbers())
+    assert network.fixed_temperatures[0] == 40
+    index_1 = network.get_index(1)
+    index_9 = network.get_index(9)
+    assert almost_equal(1 / network.conductance[index_1, index_9], 0.0043, 3)
+    assert (network.conductance != network.conductance.T).nnz == 0
+    assert network.capacitances[network.get_index(2)] == mc.get_node_capacitance(2)
+
+
+def test_get_thermal_network_slices(mc):
+    pytest.importorskip("scipy")
+    mc.set_variable("AxialSliceDefinition", 1)
+    mc.do_steady_state_analysis()
+
+    # Nodes of all three axial slices are included
+    slice_node_numbers = set(
+        mc.get_offset_node_number(2, slice_number, 1) for slice_number in range(1, 4)
+    )
+    assert len(slice_node_numbers) == 3
+    assert slice_node_numbers <= set(mc.get_node_numbers())
+    assert slice_node_numbers <= set(mc.get_thermal_network().node_numbers)
+
+    reset_to_default_file(mc)
+
+
+# Node 2 doesn't exist. Nodes 1 and 3, and 3 and 4, are connected, and all nodes are
+# connected to ambient (node 0).
+_NETWORK_RESISTANCES = {(0, 1): 2.0, (0, 3): 4.0, (0, 4): 5.0, (1, 3): 0.5, (3, 4): 0.25}
+
+
+def _thermal_network_motorcad(has_network_method, resistances=_NETWORK_RESISTANCES):
+    """Fake Motor-CAD, with a thermal network of 5 node numbers."""
+    node_numbers = [0, 1, 3, 4]
+
+    def get_thermal_network():
+        return {
+            "NodeNumbers": node_numbers,
+            "Capacitances": [0, 10, 30, 40],
+            "Powers": [0, 1, 3, 4],
+            "FixedTemperatures": [40, None, None, 60],
+            "Resistances": [
+                [node1, node2, resistance] for (node1, node2), resistance in resistances.items()
+            ],
+        }
+
+    def export_matrices(directory_path):
+        with open(os.path.join(directory_path, "network.nmf"), "w") as file:
+            file.write("Node Names\n\n[Ambient]\n0 (Ambient)\n\n[Stator]\n")
+            file.write("".join(str(node) + " (Node " + str(node) + ")\n" for node in [4, 1, 3]))
+        with open(os.path.join(directory_path, "network.rmf"), "w") as file:
+            file.write("Resistance Matrix\n\nNodes;" + ";".join(map(str, node_numbers)) + ";\n\n")
+            for node1 in node_numbers:
+                # Unconnected nodes have a very large resistance. Resistances are only exported
+                # from the lower node number.
+                row = [
+                    resistances.get((node1, node2), 1e10 if node1 != node2 else 0)
+                    for node2 in node_numbers
+                ]
+                file.write(str(node1) + ";" + ";".join(map(str, row)) + ";\n")
+            file.write("\n")
+
+    return FakeMotorCAD(
+        methods={
+            "GetThermalNetwork": get_thermal_network,
+            "ExportMatrices": export_matrices,
+            "GetNodeCapacitance": lambda node_number: node_number * 10,
+            "GetNodePower": lambda node_number: node_number,
+            "GetNodeTemperature": lambda node_number: 40.0,
+        },
+        features=["get_thermal_network"] if has_network_method else [],
+    )
+
+
+@pytest.mark.parametrize("has_network_method", [True, False])
+def test_get_thermal_network_batched(has_network_method):
+    np = pytest.importorskip("numpy")
+    pytest.importorskip("scipy")
+    mc = _thermal_network_motorcad(has_network_method)
+    network = mc.get_thermal_network()
+
+    assert np.array_equal(network.node_numbers, [0, 1, 3, 4])
+    assert np.array_equal(network.capacitances, [0, 10, 30, 40])
+    assert np.array_equal(network.powers, [0, 1, 3, 4])
+    assert network.fixed_temperatures[0] == 40
+    assert np.isnan(network.fixed_temperatures[1:3]).all()
+    assert network.get_index(3) == 2
+    with pytest.raises(ValueError):
+        network.get_index(2)
+
+    assert np.allclose(
+        network.conductance.toarray(),
+        [
+            [0, 0.5, 0.25, 0.2],
+            [0.5, 0, 2, 0],
+            [0.25, 2, 0, 4],
+            [0.2, 0, 4, 0],
+        ],
+    )
+    assert network.conductance.nnz == 10
+    if not has_network_method:
+        # Resistances aren't requested for each pair of nodes
+        assert mc.connection.count_calls("GetNodeToNodeResistance") == 0
+        assert mc.connection.count_calls("ExportMatrices") == 1
+
+
+@pytest.mark.parametrize("has_network_method", [True, False])
+def test_get_thermal_network_zero_resistance(has_network_method):
+    pytest.importorskip("scipy")
+    mc = _thermal_network_motorcad(
+        has_network_method, resistances={**_NETWORK_RESISTANCES, (1, 3): 0.0}
+    )
+    with pytest.raises(MotorCADError, match="thermal nodes 1 and 3"):
+        mc.get_thermal_network()
+
+
 def test_get_node_exists(mc):
     mc.do_steady_state_analysis()
 
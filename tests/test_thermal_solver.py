@@ -0,0 +1,147 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import pytest
+
+from RPC_Test_Common import reset_to_default_file
+from ansys.motorcad.core.methods.rpc_methods_thermal import ThermalNetwork
+from ansys.motorcad.core.thermal_solver import ThermalNetworkSolver
+
+np = pytest.importorskip("numpy")
+sparse = pytest.importorskip("scipy.sparse")
+
+
+def _chain_network(number_of_nodes=5, resistance=2.0, capacitance=10.0):
+    """Chain of nodes connected to a fixed 40 degree ambient node (node 0)."""
+    conductance = sparse.diags(
+        [np.full(number_of_nodes - 1, 1 / resistance)] * 2, [-1, 1], format="csr"
+    )
+    fixed_temperatures = np.full(number_of_nodes, np.nan)
+    fixed_temperatures[0] = 40
+    return ThermalNetwork(
+        node_numbers=np.arange(number_of_nodes),
+        capacitances=np.r_[0, np.full(number_of_nodes - 1, capacitance)],
+        powers=np.r_[0, np.zeros(number_of_nodes - 2), 1.0],
+        fixed_temperatures=fixed_temperatures,
+        conductance=conductance,
+    )
+
+
+def test_steady_state():
+    solver = ThermalNetworkSolver(_chain_network())
+
+    # 1 W flows through 4 resistances of 2 K/W to ambient
+    assert np.allclose(solver.steady_state(), [40, 42, 44, 46, 48])
+
+    # Several cases at once, with the factorisation reused
+    powers = np.zeros((5, 3))
+    powers[4] = [1, 2, 3]
+    powers[1] = [0, 0, 1]
+    temperatures = solver.steady_state(powers)
+    assert temperatures.shape == (5, 3)
+    assert np.allclose(temperatures[:, 1], [40, 44, 48, 52, 56])
+    assert np.allclose(temperatures[:, 2], [40, 48, 54, 60, 66])
+
+    fixed_temperatures = np.array([20.0, 0, 0, 0, 0])
+    assert np.allclose(
+        solver.steady_state(fixed_temperatures=fixed_temperatures), [20, 22, 24, 26, 28]
+    )
+
+    with pytest.raises(ValueError):
+        solver.steady_state(powers=np.zeros(4))
+
+
+@pytest.mark.parametrize("method, tolerance", [("euler", 0.02), ("bdf2", 0.001)])
+def test_transient(method, tolerance):
+    # A single node with resistance R to ambient and capacitance C heats up as
+    # T = T_ambient + P * R * (1 - exp(-t / (R * C)))
+    network = _chain_network(number_of_nodes=2, resistance=2.0, capacitance=10.0)
+    solver = ThermalNetworkSolver(network)
+
+    times, temperatures = solver.transient(
+        np.array([40.0, 40.0]), time_step=0.5, number_of_steps=100, method=method
+    )
+    assert times[-1] == 50
+    assert temperatures.shape == (101, 2)
+    assert np.all(temperatures[:, 0] == 40)
+    expected = 40 + 2 * (1 - np.exp(-times / 20))
+    assert np.max(np.abs(temperatures[:, 1] - expected)) < tolerance
+
+    # Power for each time step, with the power switched off half way
+    powers = np.zeros((100, 2))
+    powers[:50, 1] = 1
+    _, temperatures = solver.transient(
+        np.array([40.0, 40.0]), time_step=0.5, number_of_steps=100, powers=powers, method=method
+    )
+    assert np.argmax(temperatures[:, 1]) == 50
+
+
+def test_transient_reaches_steady_state():
+    solver = ThermalNetworkSolver(_chain_network())
+    _, temperatures = solver.transient(np.full(5, 40.0), time_step=10, number_of_steps=500)
+    assert np.allclose(temperatures[-1], solver.steady_state())
+
+
+def test_solver_requires_fixed_temperature():
+    network = _chain_network()
+    network.fixed_temperatures[:] = np.nan
+    with pytest.raises(ValueError):
+        ThermalNetworkSolver(network)
+
+
+def test_steady_state_matches_motorcad(mc):
+    reset_to_default_file(mc)
+    mc.do_steady_state_analysis()
+    network = mc.get_thermal_network()
+    motorcad_temperatures = mc.get_node_temperatures(network.node_numbers)
+
+    temperatures = ThermalNetworkSolver(network).steady_state()
+    temperature_rise = motorcad_temperatures - network.fixed_temperatures[0]
+    assert np.allclose(temperatures, motorcad_temperatures, atol=0.01 * temperature_rise.max())
+
+
+def test_transient_matches_motorcad(mc):
+    reset_to_default_file(mc)
+    mc.do_steady_state_analysis()
+    network = mc.get_thermal_network()
+
+    # Simple transient, starting with all nodes at ambient temperature
+    mc.set_variable("ThermalCalcType", 1)
+    mc.set_variable("TransientCalculationType", 0)
+    mc.do_transient_analysis()
+    time_period = mc.get_variable("Simple_Transient_Period")
+    motorcad_temperatures = mc.get_node_temperatures(network.node_numbers)
+
+    ambient_temperature = network.fixed_temperatures[0]
+    times, temperatures = ThermalNetworkSolver(network).transient(
+        np.full(len(network.node_numbers), ambient_temperature),
+        time_step=time_period / 400,
+        number_of_steps=400,
+    )
+    assert times[-1] == pytest.approx(time_period)
+    # Losses and resistances are for the steady state temperatures, so the transient
+    # temperatures are only approximately the same
+    temperature_rise = motorcad_temperatures - ambient_temperature
+    assert temperature_rise.max() > 0
+    assert np.allclose(temperatures[-1], motorcad_temperatures, atol=0.05 * temperature_rise.max())
+
+    mc.set_variable("ThermalCalcType", 0)
+    reset_to_default_file(mc)
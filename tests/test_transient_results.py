@@ -0,0 +1,110 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import os
+from os import path
+
+import pytest
+
+from RPC_Test_Common import get_temp_files_dir_path, reset_to_default_file
+from ansys.motorcad.core import transient_results
+from ansys.motorcad.core.transient_results import iter_transient_results, read_transient_results
+
+np = pytest.importorskip("numpy")
+
+
+def _write_transient_file(file_path, times, values, separator=";"):
+    with open(file_path, "w") as file:
+        file.write("Transient Temperatures\n\n")
+        file.write(separator.join(["Time"] + ["Node " + str(i) for i in range(values.shape[1])]))
+        file.write(separator + "\n")
+        for time, row in zip(times, values):
+            file.write(
+                separator.join(str(value) for value in [time] + list(row)) + separator + "\n"
+            )
+        file.write("\n")
+
+
+@pytest.mark.parametrize("separator", [";", ",", "\t"])
+def test_read_transient_results(separator):
+    file_path = path.join(get_temp_files_dir_path(), "transient_results.txt")
+    times = np.linspace(0, 100, 25)
+    values = 40 + np.outer(times, np.arange(3))
+    _write_transient_file(file_path, times, values, separator)
+
+    results = read_transient_results(file_path, chunk_size=7, cache=False)
+    assert results.names == ["Node 0", "Node 1", "Node 2"]
+    assert np.allclose(results.times, times)
+    assert np.allclose(results.values, values)
+    assert np.allclose(results["Node 2"], values[:, 2])
+
+    chunks = list(iter_transient_results(file_path, chunk_size=10))
+    assert [len(chunk_times) for _, chunk_times, _ in chunks] == [10, 10, 5]
+    assert np.allclose(np.concatenate([chunk_values for _, _, chunk_values in chunks]), values)
+
+
+def test_read_transient_results_cache(monkeypatch):
+    file_path = path.join(get_temp_files_dir_path(), "transient_results_cache.txt")
+    cache_path = file_path + ".npz"
+    if path.isfile(cache_path):
+        os.remove(cache_path)
+    times = np.arange(10.0)
+    _write_transient_file(file_path, times, np.ones((10, 2)))
+
+    results = read_transient_results(file_path)
+    assert path.isfile(cache_path)
+
+    # Results are read from the cache while the text file is unchanged
+    def fail_to_parse(*args, **kwargs):
+        raise AssertionError("Text file parsed again")
+
+    monkeypatch.setattr(transient_results, "iter_transient_results", fail_to_parse)
+    cached_results = read_transient_results(file_path)
+    assert cached_results.names == results.names
+    assert np.array_equal(cached_results.values, results.values)
+    monkeypatch.undo()
+
+    # The cache is replaced when the text file changes
+    _write_transient_file(file_path, times, np.full((10, 2), 2.0))
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+    assert np.all(read_transient_results(file_path).values == 2)
+
+
+def test_read_transient_results_no_results():
+    file_path = path.join(get_temp_files_dir_path(), "transient_results_empty.txt")
+    with open(file_path, "w") as file:
+        file.write("Transient Temperatures\nTime;Node\n")
+    with pytest.raises(ValueError):
+        read_transient_results(file_path, cache=False)
+
+
+def test_read_saved_transient_temperatures(mc):
+    reset_to_default_file(mc)
+    mc.set_variable("ThermalCalcType", 1)
+    mc.do_transient_analysis()
+    file_path = path.join(get_temp_files_dir_path(), "saved_transient_temperatures.txt")
+    mc.save_transient_temperatures(file_path)
+
+    results = read_transient_results(file_path, cache=False)
+    assert len(results.times) > 1
+    assert results.values.shape == (len(results.times), len(results.names))
+    mc.set_variable("ThermalCalcType", 0)
@@ -24,7 +24,7 @@ from os import path, remove
 
 import pytest
 
-from RPC_Test_Common import get_dir_path, reset_to_default_file
+from RPC_Test_Common import FakeMotorCAD, get_dir_path, reset_to_default_file
 from ansys.motorcad.core import MotorCAD, MotorCADError
 from ansys.motorcad.core.datastore import Datastore, DataTypes
 
@@ -218,3 +218,190 @@ def test_get_datastore(mc):
     }
 
     new_datastore = Datastore.from_dict(test_dict)
+
+
+def test_datastore_refresh(mc):
+    reset_to_default_file(mc)
+    datastore = mc.get_datastore()
+
+    output_record = datastore.get_variable_record("ArmatureConductor_Temperature")
+    input_record = datastore.get_variable_record("tooth_width")
+    input_value = input_record.value
+
+    mc.set_variable("tooth_width", input_value + 1)
+    mc.do_magnetic_thermal_calculation()
+
+    refreshed = datastore.refresh(mc, inout_types=[DataTypes.output])
+    assert refreshed is datastore
+    # Record objects are updated in place
+    assert datastore.get_variable_record("ArmatureConductor_Temperature") is output_record
+    assert output_record.value == mc.get_variable("ArmatureConductor_Temperature")
+    # Inputs are not refreshed
+    assert input_record.value == input_value
+
+    datastore.refresh(mc, inout_types=[DataTypes.input], file_sections=[input_record.file_section])
+    assert datastore.get_variable_record("tooth_width") is input_record
+    assert input_record.value == input_value + 1
+
+    reset_to_default_file(mc)
+
+
+def _datastore_record_json(name, value, inout_type, file_section):
+    return {
+        "current_value": value,
+        "default_value": value,
+        "units": "",
+        "input_or_output_type": inout_type,
+        "record_name": name,
+        "activex_name": name,
+        "alternative_activex_name": "",
+        "file_section": file_section,
+        "is_array": False,
+        "is_array_2d": False,
+        "use_max_value": False,
+        "use_min_value": False,
+        "max_value": None,
+        "min_value": None,
+    }
+
+
+def _datastore_motorcad(records, filtered_supported):
+    """Get a fake Motor-CAD returning the datastore records and the filter params used."""
+    filter_params = []
+
+    def get_datastore_filtered(type_values, file_sections):
+        filter_params.append((type_values, file_sections))
+        return {
+            "data_records": [
+                record
+                for record in records
+                if ((type_values == []) or (record["input_or_output_type"] in type_values))
+                and ((file_sections == []) or (record["file_section"] in file_sections))
+            ]
+        }
+
+    mc = FakeMotorCAD(
+        methods={
+            "GetDataStore": lambda: {"data_records": records},
+            "GetDataStoreFiltered": get_datastore_filtered,
+        },
+        features=["get_datastore_filtered"] if filtered_supported else [],
+    )
+    return mc, filter_params
+
+
+@pytest.mark.parametrize("filtered_supported", [True, False])
+def test_datastore_refresh_filtered(filtered_supported):
+    records = [
+        _datastore_record_json("Torque", 10.0, 2, "Magnetics"),
+        _datastore_record_json("Speed", 1000, 0, "Magnetics"),
+        _datastore_record_json("Temperature", 80.0, 2, "Thermal"),
+    ]
+    mc, filter_params = _datastore_motorcad(records, filtered_supported)
+
+    datastore = mc.get_datastore()
+    torque_record = datastore.get_variable_record("Torque")
+    speed_record = datastore.get_variable_record("Speed")
+    datastore.pop("Temperature")
+
+    records[:] = [
+        _datastore_record_json("Torque", 12.0, 2, "Magnetics"),
+        _datastore_record_json("Speed", 2000, 0, "Magnetics"),
+        _datastore_record_json("Temperature", 90.0, 2, "Thermal"),
+    ]
+    assert datastore.refresh(mc) is datastore
+
+    if filtered_supported:
+        assert mc.connection.count_calls("GetDataStoreFiltered") == 1
+        assert filter_params == [([2], [])]
+    else:
+        # Motor-CAD returns the whole datastore, so it is filtered here
+        assert mc.connection.count_calls("GetDataStoreFiltered") == 0
+        assert mc.connection.count_calls("GetDataStore") == 2
+
+    # Existing records are updated in place and missing records are added
+    assert datastore.get_variable_record("Torque") is torque_record
+    assert torque_record.value == 12.0
+    assert datastore.get_variable("Temperature") == 90.0
+    # Inputs are not refreshed
+    assert datastore.get_variable_record("Speed") is speed_record
+    assert speed_record.value == 1000
+
+    datastore.refresh(mc, inout_types=[DataTypes.input], file_sections=["Thermal"])
+    assert speed_record.value == 1000
+    datastore.refresh(mc, inout_types=[DataTypes.input], file_sections=["Magnetics"])
+    assert datastore.get_variable_record("Speed") is speed_record
+    assert speed_record.value == 2000
+    if filtered_supported:
+        assert filter_params[1:] == [([0, 1, 6], ["Thermal"]), ([0, 1, 6], ["Magnetics"])]
+
+
+def test_datastore_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+
+    datastore_1 = Datastore.from_dict({"speed": 1000, "currents": [1.0, 2.0], "name": "a"})
+    datastore_2 = Datastore.from_dict({"speed": 1500.5, "currents": [3.0, 4.0], "extra": 1})
+
+    table = datastore_1.to_arrow()
+    assert table.num_rows == 1
+    assert table.column_names == ["speed", "currents", "name"]
+
+    table = Datastore.concat([datastore_1, datastore_2])
+    assert table.num_rows == 2
+    assert table.schema.field("currents").type == pa.list_(pa.float64(), 2)
+    assert table.column("speed").to_pylist() == [1000, 1500.5]
+    assert table.column("currents").to_pylist() == [[1.0, 2.0], [3.0, 4.0]]
+    assert table.column("extra").to_pylist() == [None, 1]
+
+    # Values that can't be stored in one column aren't converted to strings
+    datastore_3 = Datastore.from_dict({"speed": "fast", "currents": [5.0, 6.0]})
+    with pytest.raises(TypeError, match="speed"):
+        Datastore.concat([datastore_1, datastore_3])
+
+
+def test_datastore_to_pandas():
+    pytest.importorskip("pandas")
+
+    datastore_1 = Datastore.from_dict({"speed": 1000, "currents": [1.0, 2.0]})
+    datastore_2 = Datastore.from_dict({"speed": 1500, "currents": [3.0, 4.0, 5.0]})
+
+    data_frame = datastore_1.to_pandas()
+    assert data_frame.shape == (1, 2)
+
+    data_frame = Datastore.concat([datastore_1, datastore_2], output_format="pandas")
+    assert data_frame.shape == (2, 2)
+    assert list(data_frame["speed"]) == [1000, 1500]
+    assert data_frame["currents"][1] == [3.0, 4.0, 5.0]
+
+    with pytest.raises(ValueError):
+        Datastore.concat([datastore_1], output_format="csv")
+
+
+def _input_datastore(values):
+    datastore = Datastore.from_dict(values)
+    for record in datastore.values():
+        record.input_or_output_type = DataTypes.input.value[0]
+        record.file_section = "Dimensions"
+    return datastore
+
+
+def test_datastore_input_hash():
+    datastore = _input_datastore({"Slot_Width": 1.5, "Slot_Number": 48, "Magnet": "N42"})
+    input_hash = datastore.input_hash()
+
+    # Record order, float noise and -0.0 don't change the hash
+    reordered = _input_datastore({"Magnet": "N42", "Slot_Number": 48.0, "Slot_Width": 1.5 + 1e-15})
+    assert reordered.input_hash() == input_hash
+    assert _input_datastore({"a": -0.0}).input_hash() == _input_datastore({"a": 0}).input_hash()
+
+    # Outputs and other sections are ignored
+    datastore["Torque"] = Datastore.from_dict({"Torque": 10})["Torque"]
+    datastore["Torque"].input_or_output_type = DataTypes.output.value
+    assert datastore.input_hash() == input_hash
+    assert datastore.input_hash(sections=["Winding"]) != input_hash
+
+    # Setting a value updates the hash
+    datastore["Slot_Width"].current_value = 2.0
+    assert datastore.input_hash() != input_hash
+    datastore["Slot_Width"].current_value = 1.5
+    assert datastore.input_hash() == input_hash